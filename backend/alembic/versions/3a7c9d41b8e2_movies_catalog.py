@@ -0,0 +1,49 @@
+"""movies catalog
+
+Revision ID: 3a7c9d41b8e2
+Revises: fe1b2c9e3f21
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7c9d41b8e2'
+down_revision: Union[str, None] = 'fe1b2c9e3f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table('movies',
+    sa.Column('imdb_id', sa.String(length=20), nullable=False),
+    sa.Column('title', sa.Text(), nullable=False),
+    sa.Column('year', sa.Text(), nullable=True),
+    sa.Column('type_', sa.Text(), nullable=True),
+    sa.Column('imdb_rating', sa.Float(), nullable=True),
+    sa.Column('imdb_votes', sa.Integer(), nullable=True),
+    sa.Column('runtime', sa.Text(), nullable=True),
+    sa.Column('genre', sa.Text(), nullable=True),
+    sa.Column('director', sa.Text(), nullable=True),
+    sa.Column('actors', sa.Text(), nullable=True),
+    sa.Column('plot', sa.Text(), nullable=True),
+    sa.Column('poster_url', sa.Text(), nullable=True),
+    sa.Column('source', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('imdb_id'),
+    schema='public'
+    )
+    op.create_index('movies_title_trgm', 'movies', ['title'], unique=False, schema='public',
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('movies_title_trgm', table_name='movies', schema='public')
+    op.drop_table('movies', schema='public')
@@ -0,0 +1,251 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from backend.api.fast_json import dumps, loads
+
+APP_CACHE_DIR_NAME = "favourite_films"
+MISSING = object()
+
+
+def default_cache_dir() -> Path:
+    """Каталог пользовательского кэша приложения (XDG_CACHE_HOME, LOCALAPPDATA или ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if not base:
+        base = Path.home() / ".cache"
+    return Path(base) / APP_CACHE_DIR_NAME
+
+
+class DiskCache:
+    """
+    Персистентный кэш JSON-ответов OMDb в SQLite.
+    Каждая запись хранит собственный срок жизни (жёсткий) и, при необходимости, более
+    ранний мягкий срок, после которого она считается устаревшей, но ещё отдаётся;
+    при превышении max_entries вытесняются сначала просроченные, затем давно не использованные записи.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 5000, clock=time.time):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " stale_at REAL)"
+            )
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(entries)")}
+            if 'stale_at' not in columns:
+                connection.execute("ALTER TABLE entries ADD COLUMN stale_at REAL")
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> dict | None:
+        """Возвращает сохранённое значение или None, если записи нет или она просрочена."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> tuple[dict, bool] | None:
+        """
+        Возвращает (значение, устарело ли оно) или None, если записи нет или истёк её жёсткий срок.
+        Устаревшая запись ещё пригодна для показа, но её стоит обновить.
+        """
+        now = self._clock()
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT value, expires_at, stale_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[1] <= now:
+                    return None
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                connection.commit()
+            return loads(row[0]), row[2] is not None and row[2] <= now
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Ошибка чтения кэша OMDb ({key}): {e}", file=sys.stderr)
+            return None
+
+    def set(self, key: str, value: dict, ttl: float, stale_after: float | None = None) -> None:
+        """Сохраняет значение на ttl секунд; через stale_after секунд оно начнёт считаться устаревшим."""
+        now = self._clock()
+        stale_at = now + stale_after if stale_after is not None and stale_after < ttl else None
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at, stale_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, dumps(value), now + ttl, now, stale_at)
+                )
+                self._evict(connection, now)
+                connection.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Ошибка записи в кэш OMDb ({key}): {e}", file=sys.stderr)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        count = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        overflow = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            connection.commit()
+
+    def purge(self, expired_only: bool = False) -> int:
+        """Удаляет записи (все или только просроченные) и возвращает их количество."""
+        with self._lock:
+            connection = self._connect()
+            if expired_only:
+                cursor = connection.execute("DELETE FROM entries WHERE expires_at <= ?", (self._clock(),))
+            else:
+                cursor = connection.execute("DELETE FROM entries")
+            connection.commit()
+            return cursor.rowcount
+
+    def iter_values(self, key_prefix: str = '') -> Iterator[dict]:
+        """Перебирает непросроченные значения, ключ которых начинается с key_prefix."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT value FROM entries WHERE key >= ? AND key < ? AND expires_at > ?",
+                (key_prefix, key_prefix + '\uffff', self._clock())
+            ).fetchall()
+        for (value,) in rows:
+            try:
+                yield loads(value)
+            except ValueError:
+                continue
+
+    def stats(self) -> dict:
+        """Сводка по кэшу: путь, число записей, просроченных и устаревших, объём данных."""
+        with self._lock:
+            connection = self._connect()
+            now = self._clock()
+            entries, expired, stale, size_bytes = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at <= ?), 0),"
+                " COALESCE(SUM(expires_at > ? AND stale_at <= ?), 0), COALESCE(SUM(LENGTH(value)), 0) FROM entries",
+                (now, now, now)
+            ).fetchone()
+        return {
+            'path': str(self.path),
+            'entries': entries,
+            'expired': expired,
+            'stale': stale,
+            'size_bytes': size_bytes,
+            'max_entries': self.max_entries
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class MemoryCache:
+    """
+    Потокобезопасный LRU-кэш в памяти процесса с TTL.
+    Кэширует и найденные значения, и промахи (None) — последние живут negative_ttl секунд.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 600, negative_ttl: float = 60,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[object, float]] = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        """Возвращает значение (в т.ч. закэшированный промах None) или MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if value is None:
+                self.negative_hits += 1
+            return value
+
+    def set(self, key: str, value, ttl: float | None = None) -> None:
+        if ttl is None:
+            ttl = self.negative_ttl if value is None else self.ttl
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def set_negative(self, key: str) -> None:
+        self.set(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+if __name__ == '__main__':
+    import argparse
+    from backend.api.omdb_client import default_client
+
+    response_cache = default_client.response_cache
+
+    parser = argparse.ArgumentParser(description="Просмотр и очистка кэша ответов OMDb.")
+    parser.add_argument('command', choices=['stats', 'purge'])
+    parser.add_argument('--expired', action='store_true', help="удалить только просроченные записи")
+    args = parser.parse_args()
+
+    if response_cache is None:
+        print("Кэш OMDb отключён (OMDB_CACHE_ENABLED=false).")
+    elif args.command == 'stats':
+        for name, value in response_cache.stats().items():
+            print(f"{name}: {value}")
+    else:
+        print(f"Удалено записей: {response_cache.purge(expired_only=args.expired)}")
@@ -0,0 +1,117 @@
+import sys
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """OMDb считается недоступным: запрос отклонён без обращения к сети."""
+
+
+class CircuitBreaker:
+    """
+    Предохранитель для запросов к OMDb.
+    После failure_threshold сбоев подряд (ошибки соединения, таймауты, 5xx) цепь размыкается,
+    и запросы сразу отклоняются с CircuitOpenError. Раз в reset_timeout секунд один запрос
+    пропускается как пробный (half-open): успех замыкает цепь, сбой снова размыкает её.
+    Слушатели listener(state) узнают о каждой смене состояния; они вызываются из потока, где шёл запрос.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._listeners: list = []
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_after(self) -> float:
+        """Через сколько секунд будет пропущен пробный запрос (0, если цепь не разомкнута)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def add_listener(self, listener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def allow(self) -> None:
+        """Пропускает запрос или бросает CircuitOpenError, пока OMDb считается недоступным."""
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+                changed = self._set_state(HALF_OPEN)
+            elif self._state == HALF_OPEN and self._probe_started is not None \
+                    and now - self._probe_started < self.reset_timeout:
+                # Пробный запрос уже в работе; если он так и не отчитался, через reset_timeout пускаем следующий.
+                self.rejected += 1
+                raise CircuitOpenError("OMDb недоступен, идёт проверка соединения")
+            elif self._state == OPEN:
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"OMDb недоступен, повторная попытка через {self._opened_at + self.reset_timeout - now:.0f} с"
+                )
+            else:
+                changed = None
+            if self._state == HALF_OPEN:
+                self._probe_started = now
+        self._notify(changed)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            changed = self._set_state(CLOSED)
+        self._notify(changed)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            changed = None
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self.opened += 1
+                changed = self._set_state(OPEN)
+        self._notify(changed)
+
+    def _set_state(self, state: str) -> str | None:
+        """Меняет состояние (под блокировкой) и возвращает новое, если оно изменилось."""
+        if state == self._state:
+            return None
+        self._state = state
+        self._probe_started = None
+        return state
+
+    def _notify(self, state: str | None) -> None:
+        if state is None:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(state)
+            except Exception as e:
+                print(f"Ошибка в обработчике состояния OMDb ({state}): {e}", file=sys.stderr)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'opened': self.opened,
+                'rejected': self.rejected
+            }
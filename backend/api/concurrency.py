@@ -0,0 +1,142 @@
+import threading
+import time
+
+SUCCESS = 'success'
+OVERLOAD = 'overload'
+IGNORE = 'ignore'
+BASELINE_DRIFT = 0.05
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    Адаптивный предел числа одновременных запросов к OMDb (AIMD).
+    Пока ответы приходят без ошибок и не дольше latency_tolerance базовой задержки, предел растёт:
+    до первой перегрузки — на единицу за ответ, затем — примерно на единицу за «окно» из limit ответов.
+    Таймаут, ошибка соединения, 429 или 5xx уменьшают предел в backoff раз; ответы на запросы,
+    начатые до предыдущего снижения, повторно его не уменьшают.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 15, backoff: float = 0.5,
+                 latency_tolerance: float = 2.0, clock=time.monotonic):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._limit = float(min(max_limit, max(min_limit, initial)))
+        self._slow_start = True
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._last_saturated = float('-inf')
+        self._baseline: float | None = None
+        self.increases = 0
+        self.decreases = 0
+        self.slow_responses = 0
+
+    @property
+    def limit(self) -> int:
+        """Текущий предел одновременных запросов."""
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    def acquire(self, timeout: float | None = None) -> float | None:
+        """
+        Ждёт, пока число запросов в работе станет меньше предела, и занимает место.
+        Возвращает момент начала запроса для release или None, если за timeout места не нашлось.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return None
+            self._in_flight += 1
+            started = self._clock()
+            if self._in_flight * 2 >= int(self._limit):
+                self._last_saturated = started
+            return started
+
+    def release(self, started: float, outcome: str = SUCCESS) -> None:
+        """
+        Освобождает место и учитывает исход запроса: SUCCESS, OVERLOAD или IGNORE
+        (ответ, ничего не говорящий о перегрузке, например ошибка клиента).
+        """
+        now = self._clock()
+        with self._condition:
+            saturated = self._last_saturated >= started
+            self._in_flight -= 1
+            if outcome == OVERLOAD:
+                self._decrease(started, now)
+            elif outcome == SUCCESS:
+                self._record_success(now - started, saturated)
+            self._condition.notify_all()
+
+    def _record_success(self, latency: float, saturated: bool) -> None:
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            # Базовая задержка медленно подтягивается вверх, если сеть стала медленнее.
+            self._baseline += (latency - self._baseline) * BASELINE_DRIFT
+        if latency > self._baseline * self.latency_tolerance:
+            self.slow_responses += 1
+            return
+        # Если за время запроса предел ни разу не был занят хотя бы наполовину,
+        # ответ ничего не говорит о запасе пропускной способности.
+        if not saturated or self._limit >= self.max_limit:
+            return
+        step = 1.0 if self._slow_start else 1.0 / self._limit
+        self._limit = min(float(self.max_limit), self._limit + step)
+        self.increases += 1
+
+    def _decrease(self, started: float, now: float) -> None:
+        if started < self._last_decrease:
+            return
+        self._slow_start = False
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._last_decrease = now
+        self.decreases += 1
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'increases': self.increases,
+                'decreases': self.decreases,
+                'slow_responses': self.slow_responses,
+                'baseline_latency': self._baseline
+            }
+
+
+if __name__ == '__main__':
+    import argparse
+    from backend.api.omdb_client import OmdbClient
+    from backend.api.omdb_stub import OmdbStub, StubServer
+
+    parser = argparse.ArgumentParser(
+        description="Поиск по локальной заглушке OMDb с фиксированным и адаптивным числом параллельных запросов."
+    )
+    parser.add_argument('--searches', type=int, default=20)
+    parser.add_argument('--latency', default='uniform:0.02,0.1', help="распределение задержки заглушки")
+    parser.add_argument('--rate-limit', type=float, default=20.0, help="запросов в секунду на заглушке, сверх — 429")
+    parser.add_argument('--synthetic', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for name, limit in (("фиксированный пул", None), ("адаптивный предел", AdaptiveConcurrencyLimit())):
+        stub = OmdbStub(latency=args.latency, rate_limit=args.rate_limit,
+                        synthetic_results=args.synthetic, seed=args.seed)
+        with StubServer(stub) as server:
+            found = 0
+            started = time.monotonic()
+            with OmdbClient(api_key='benchmark', base_url=server.url, concurrency=limit) as client:
+                for number in range(args.searches):
+                    found += len(client.search_movie_by_title(f"benchmark {number}") or [])
+            elapsed = time.monotonic() - started
+        print(f"{name}: {elapsed:.1f} с, результатов: {found}, "
+              f"запросов к OMDb: {stub.stats['requests']}, ответов 429: {stub.stats['throttled']}")
+        if limit is not None:
+            print(f"  {limit.stats()}")
@@ -0,0 +1,98 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DETAIL_FIELDS = frozenset({'Response', 'Error', 'imdbID', 'Title', 'Year', 'Type', 'Poster', 'imdbRating',
+                           'imdbVotes', 'Runtime', 'Genre', 'Director', 'Actors', 'Plot'})
+FULL_DETAIL_FIELDS = DETAIL_FIELDS | {'Rated', 'Released', 'Writer', 'Language', 'Country', 'Awards', 'Ratings',
+                                      'Metascore', 'BoxOffice', 'Production'}
+SEARCH_PAGE_FIELDS = frozenset({'Response', 'Error', 'totalResults', 'Search'})
+SEARCH_ITEM_FIELDS = frozenset({'imdbID', 'Title', 'Year', 'Type', 'Poster'})
+
+
+def available() -> bool:
+    """Установлен ли orjson."""
+    return orjson is not None
+
+
+def loads(data: bytes | str):
+    """Разбирает JSON через orjson, если он установлен, иначе через стандартный json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False)
+
+
+def compact_details(data: dict, fields: frozenset = DETAIL_FIELDS) -> dict:
+    """Ответ ?i= только с полями, которые используют клиент, индекс рейтингов и каталог."""
+    return {name: value for name, value in data.items() if name in fields}
+
+
+def compact_search_page(data: dict) -> dict:
+    """Страница ?s= только с полями выдачи, которые нужны курсору поиска."""
+    page = {name: value for name, value in data.items() if name in SEARCH_PAGE_FIELDS}
+    if isinstance(page.get('Search'), list):
+        page['Search'] = [{name: value for name, value in item.items() if name in SEARCH_ITEM_FIELDS}
+                          for item in page['Search']]
+    return page
+
+
+def decode_omdb(raw: bytes, params: dict) -> dict:
+    """Разбирает ответ OMDb и отбрасывает неиспользуемые поля (тип ответа определяется по params)."""
+    data = loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError("Ответ OMDb не является JSON-объектом")
+    if 'i' in params:
+        return compact_details(data, FULL_DETAIL_FIELDS if params.get('plot') == 'full' else DETAIL_FIELDS)
+    if 's' in params:
+        return compact_search_page(data)
+    return data
+
+
+if __name__ == '__main__':
+    import argparse
+    import timeit
+    from backend.api.movie_records import MovieDetails, MovieSummary
+    from backend.api.omdb_stub import FIXTURES_DIR
+
+    parser = argparse.ArgumentParser(
+        description="Сравнение стандартного и быстрого разбора записанных ответов OMDb."
+    )
+    parser.add_argument('--fixtures', default=str(FIXTURES_DIR))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    with open(f"{args.fixtures}/details.json", encoding='utf-8') as fixture:
+        details_payloads = [json.dumps(data).encode('utf-8') for data in json.load(fixture).values()]
+    with open(f"{args.fixtures}/search.json", encoding='utf-8') as fixture:
+        search_payloads = [
+            json.dumps({"Search": items[:10], "totalResults": str(len(items)), "Response": "True"}).encode('utf-8')
+            for items in json.load(fixture).values()
+        ]
+
+    def standard_path():
+        for raw in details_payloads:
+            MovieDetails.from_omdb(json.loads(raw.decode('utf-8')))
+        for raw in search_payloads:
+            [MovieSummary.from_omdb(item) for item in json.loads(raw.decode('utf-8'))['Search']]
+
+    def fast_path():
+        for raw in details_payloads:
+            MovieDetails.from_omdb(decode_omdb(raw, {'i': ''}))
+        for raw in search_payloads:
+            [MovieSummary.from_omdb(item) for item in decode_omdb(raw, {'s': ''})['Search']]
+
+    payloads = len(details_payloads) + len(search_payloads)
+    print(f"Ответов: {payloads}, orjson: {'да' if available() else 'нет'}")
+    for name, path in (("стандартный json", standard_path), ("быстрый путь", fast_path)):
+        best = min(timeit.repeat(path, repeat=args.repeat, number=args.number))
+        print(f"{name}: {best / (args.number * payloads) * 1e6:.2f} мкс на ответ")
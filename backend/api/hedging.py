@@ -0,0 +1,117 @@
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Скользящее окно длительностей последних запросов и их перцентиль."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Перцентиль (0 < fraction <= 1) длительности или None, пока замеров меньше min_samples."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class HedgePolicy:
+    """
+    Когда отправлять дублирующий запрос деталей фильма.
+    Дубль отправляется, если запрос идёт дольше percentile недавних запросов;
+    бюджет позволяет не больше budget дублей на один обычный запрос (плюс небольшой запас burst),
+    поэтому дополнительный расход квоты OMDb ограничен долей budget.
+    """
+
+    def __init__(self, percentile: float = 0.95, budget: float = 0.05, burst: float = 2.0,
+                 min_delay: float = 0.02, tracker: LatencyTracker | None = None):
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_delay = min_delay
+        self.tracker = tracker if tracker is not None else LatencyTracker()
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.denied = 0
+
+    def hedge_delay(self) -> float | None:
+        """Через сколько секунд дублировать запрос; None, пока задержка ещё не выучена."""
+        threshold = self.tracker.percentile(self.percentile)
+        return None if threshold is None else max(self.min_delay, threshold)
+
+    def record_request(self) -> None:
+        """Учитывает обычный запрос: каждый пополняет бюджет дублей на budget."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def try_hedge(self) -> bool:
+        """Забирает из бюджета один дубль; False, если бюджет исчерпан."""
+        with self._lock:
+            if self._tokens + 1e-9 < 1.0:
+                self.denied += 1
+                return False
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'denied': self.denied,
+                'hedge_delay': self.hedge_delay()
+            }
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    from backend.api.omdb_client import OmdbClient
+    from backend.api.omdb_stub import OmdbStub, StubServer
+
+    parser = argparse.ArgumentParser(
+        description="Задержка запросов деталей к локальной заглушке OMDb без дублирования и с ним."
+    )
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--latency', default='pareto:0.01,1.5', help="распределение задержки заглушки")
+    parser.add_argument('--percentile', type=float, default=0.95)
+    parser.add_argument('--budget', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    def quantile(samples: list[float], fraction: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    for name, policy in (("без дублей", None), ("с дублями", HedgePolicy(args.percentile, args.budget))):
+        with StubServer(OmdbStub(latency=args.latency, seed=args.seed)) as server:
+            imdb_ids = list(server.stub.details_fixtures)
+            durations = []
+            with OmdbClient(api_key='benchmark', base_url=server.url, hedge=policy) as client:
+                for number in range(args.requests):
+                    started = time.monotonic()
+                    client.get_movie_by_id(imdb_ids[number % len(imdb_ids)])
+                    durations.append(time.monotonic() - started)
+            sent = server.stub.stats['details']
+        print(f"{name}: p50 {quantile(durations, 0.5) * 1000:.0f} мс, p95 {quantile(durations, 0.95) * 1000:.0f} мс, "
+              f"p99 {quantile(durations, 0.99) * 1000:.0f} мс, запросов к OMDb: {sent}")
+        if policy is not None:
+            print(f"  {policy.stats()}")
@@ -0,0 +1,140 @@
+import re
+from dataclasses import dataclass, replace
+
+OMDB_MISSING = 'N/A'
+_YEAR_PATTERN = re.compile(r'\d{4}')
+_RUNTIME_PATTERN = re.compile(r'\d+')
+
+
+def _text(value) -> str | None:
+    """Строковое поле OMDb; пустые значения и 'N/A' становятся None."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if not value or value == OMDB_MISSING else value
+
+
+def parse_rating(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_votes(value) -> int | None:
+    try:
+        return int(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_year(value) -> int | None:
+    """Первый год из поля Year ('2005', '2005–2012', '2019–')."""
+    match = _YEAR_PATTERN.search(str(value)) if value is not None else None
+    return int(match.group()) if match else None
+
+
+def parse_runtime(value) -> int | None:
+    """Продолжительность в минутах из поля Runtime ('142 min')."""
+    match = _RUNTIME_PATTERN.search(str(value)) if _text(value) is not None else None
+    return int(match.group()) if match else None
+
+
+@dataclass(frozen=True, slots=True)
+class MovieDetails:
+    """Детали фильма из ответа ?i= (или каталога) с уже разобранными числовыми полями."""
+    rating: float | None = None
+    votes: int | None = None
+    runtime: int | None = None
+    genre: str | None = None
+    director: str | None = None
+    actors: str | None = None
+    plot: str | None = None
+    poster_url: str | None = None
+
+    @classmethod
+    def from_omdb(cls, data: dict) -> 'MovieDetails':
+        return cls(
+            rating=parse_rating(data.get('imdbRating')),
+            votes=parse_votes(data.get('imdbVotes')),
+            runtime=parse_runtime(data.get('Runtime')),
+            genre=_text(data.get('Genre')),
+            director=_text(data.get('Director')),
+            actors=_text(data.get('Actors')),
+            plot=_text(data.get('Plot')),
+            poster_url=_text(data.get('Poster'))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MovieFullDetails:
+    """
+    Полные детали для карточки фильма (ответ ?i=&plot=full): полное описание, награды, сборы
+    и оценки других источников (ratings — пары (источник, оценка), например ('Rotten Tomatoes', '94%')).
+    """
+    plot: str | None = None
+    rated: str | None = None
+    released: str | None = None
+    writer: str | None = None
+    language: str | None = None
+    country: str | None = None
+    awards: str | None = None
+    box_office: str | None = None
+    metascore: int | None = None
+    ratings: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_omdb(cls, data: dict) -> 'MovieFullDetails':
+        ratings = tuple(
+            (str(rating['Source']), str(rating['Value']))
+            for rating in data.get('Ratings') or ()
+            if isinstance(rating, dict) and rating.get('Source') and rating.get('Value')
+        )
+        return cls(
+            plot=_text(data.get('Plot')),
+            rated=_text(data.get('Rated')),
+            released=_text(data.get('Released')),
+            writer=_text(data.get('Writer')),
+            language=_text(data.get('Language')),
+            country=_text(data.get('Country')),
+            awards=_text(data.get('Awards')),
+            box_office=_text(data.get('BoxOffice')),
+            metascore=parse_votes(_text(data.get('Metascore'))),
+            ratings=ratings
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MovieSummary:
+    """
+    Результат поиска: поля выдачи ?s= и, после загрузки, детали фильма.
+    year — первый год выпуска числом, year_label — исходная строка OMDb для показа (например, '2005–2012').
+    """
+    imdb_id: str
+    title: str
+    year: int | None = None
+    year_label: str | None = None
+    type_: str | None = None
+    poster_url: str | None = None
+    details: MovieDetails | None = None
+
+    @classmethod
+    def from_omdb(cls, data: dict) -> 'MovieSummary':
+        """Запись выдачи ?s= (или ответа ?i=, без деталей)."""
+        year_label = _text(data.get('Year'))
+        return cls(
+            imdb_id=data['imdbID'],
+            title=_text(data.get('Title')) or '',
+            year=parse_year(year_label),
+            year_label=year_label,
+            type_=_text(data.get('Type')),
+            poster_url=_text(data.get('Poster'))
+        )
+
+    @property
+    def rating(self) -> float | None:
+        return self.details.rating if self.details is not None else None
+
+    def with_details(self, details: MovieDetails) -> 'MovieSummary':
+        """Копия с деталями; постер из деталей предпочтительнее постера выдачи."""
+        return replace(self, details=details, poster_url=details.poster_url or self.poster_url)
@@ -1,132 +1,1441 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from backend.config.config import settings
 import sys
 import time
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from urllib.parse import urlencode
+from backend.api.cache import MISSING, DiskCache, MemoryCache, default_cache_dir
+from backend.api.circuit_breaker import CLOSED as CIRCUIT_CLOSED, OPEN as CIRCUIT_OPEN, CircuitBreaker, CircuitOpenError
+from backend.api.concurrency import IGNORE, OVERLOAD, SUCCESS, AdaptiveConcurrencyLimit
+from backend.api.fast_json import FULL_DETAIL_FIELDS, available as fast_json_available, compact_details, decode_omdb
+from backend.api.hedging import HedgePolicy
+from backend.api.movie_records import MovieDetails, MovieFullDetails, MovieSummary
+from backend.api.rate_limiter import DailyQuota, QuotaExceededError, TokenBucket
+from backend.api.ratings_index import RatingsIndex
+from backend.api.singleflight import AsyncSingleFlight, SingleFlight
+from backend.database.catalog import MovieCatalog
 
-BASE_URL = "http://www.omdbapi.com/"
+BASE_URL = settings.OMDB_BASE_URL
 OMDB_API_KEY = settings.OMDB_API_KEY
+MAX_SEARCH_RESULTS = 15
+DETAIL_FETCH_WORKERS = 15
+DETAIL_TIMEOUT = 10
+SEARCH_TIMEOUT = 15
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+CANCEL_POLL_INTERVAL = 0.1
+OMDB_PAGE_SIZE = 10
+MAX_OMDB_PAGE = 100
+MAX_PAGES_PER_FETCH = 5
+REVALIDATION_WORKERS = 2
+BATCH_SEARCH_QUERIES = 4
+PROBE_IMDB_ID = "tt0111161"
+# Детали не загрузились (сбой сети, срок, квота, разомкнутый предохранитель) — в отличие от None,
+# когда OMDb ответил, что данных нет.
+FETCH_FAILED = object()
 
 
-def get_movie_by_id(imdb_id):
-    if not OMDB_API_KEY: print("API ключ OMDb не настроен.", file=sys.stderr); return None
-    params = {'apikey': OMDB_API_KEY, 'i': imdb_id, 'plot': 'short'}
+class OmdbSearchError(Exception):
+    """Поиск невозможен: нет API ключа или первая страница выдачи не загрузилась."""
+
+
+class DeadlineExceeded(Exception):
+    """Срок, отведённый на поиск, истёк раньше, чем запрос к OMDb мог быть выполнен."""
+
+
+class Deadline:
+    """Общий срок выполнения поиска: каждый запрос к OMDb получает не больше оставшегося времени."""
+
+    def __init__(self, seconds: float, clock=time.monotonic):
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def timeout(self, limit: float) -> float:
+        """Таймаут запроса: limit, урезанный до оставшегося времени; DeadlineExceeded, если времени нет."""
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceeded("Истёк срок, отведённый на поиск")
+        return min(limit, remaining)
+
+    def check_wait(self, delay: float) -> None:
+        """DeadlineExceeded, если после паузы delay на запрос не останется времени."""
+        if delay >= self.remaining():
+            raise DeadlineExceeded("Истёк срок, отведённый на поиск")
+
+
+class SearchResults(list):
+    """Результаты поиска; truncated — поиск остановлен по сроку и результаты неполные."""
+    truncated = False
+
+
+def _cache_key(params: dict) -> str:
+    """Ключ кэша из параметров запроса без API ключа; название поиска нормализуется."""
+    normalized = {name: value for name, value in params.items() if name != 'apikey'}
+    if 's' in normalized:
+        normalized['s'] = ' '.join(str(normalized['s']).lower().split())
+    return urlencode(sorted(normalized.items()))
+
+
+def _search_params(api_key: str, title: str, page: int, year: str | None, type_filter: str | None) -> dict:
+    params = {'apikey': api_key, 's': title, 'page': page}
+    if year and year.strip().isdigit():
+        params['y'] = year.strip()
+    if type_filter and type_filter in ['movie', 'series', 'episode']:
+        params['type'] = type_filter
+    return params
+
+
+def _batch_query(query) -> tuple[str, str | None, str | None]:
+    """Запрос пакетного поиска: название или кортеж (название[, год[, тип]])."""
+    if isinstance(query, str):
+        return query, None, None
+    title, year, type_filter = (*query, None, None)[:3]
+    return title, year or None, type_filter or None
+
+
+def _parse_total_results(data: dict) -> int:
     try:
-        response = requests.get(BASE_URL, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        return int(data.get("totalResults", 0))
+    except ValueError:
+        return 0
+
+
+def _enrich_result(summary: MovieSummary, detailed_data: dict | None,
+                   min_rating: float, max_rating: float) -> MovieSummary | None:
+    """Дополняет результат поиска деталями; None, если деталей нет или рейтинг вне диапазона."""
+    if not detailed_data:
+        return None
+
+    result = summary.with_details(MovieDetails.from_omdb(detailed_data))
+    return result if _rating_accepted(result, min_rating, max_rating) else None
+
+
+def _rating_accepted(result: MovieSummary, min_rating: float, max_rating: float) -> bool:
+    if min_rating <= 0.0 and max_rating >= 10.0:
+        return True
+    return result.rating is not None and min_rating <= result.rating <= max_rating
+
+
+def _request_outcome(status_code: int) -> str:
+    """Что ответ говорит о перегрузке OMDb: 429 и 5xx — перегрузка, прочие ошибки клиента — ничего."""
+    if status_code == 429 or status_code >= 500:
+        return OVERLOAD
+    return SUCCESS if status_code < 400 else IGNORE
+
+
+def _cache_ttls(soft_ttl: int, hard_ttl: int) -> tuple[int, int | None]:
+    """(срок хранения, срок свежести) записи дискового кэша с учётом stale-while-revalidate."""
+    if not settings.OMDB_CACHE_STALE_WHILE_REVALIDATE:
+        return soft_ttl, None
+    return max(soft_ttl, hard_ttl), soft_ttl
+
+
+class _BaseOmdbClient(ABC):
+    """Общая часть синхронного и асинхронного клиентов: ключ, кэши и задержки повторов."""
+
+    def __init__(
+            self,
+            api_key: str | None = None,
+            base_url: str = BASE_URL,
+            max_retries: int = 2,
+            backoff_factor: float = 0.5,
+            backoff_max: float = 5.0,
+            response_cache: DiskCache | None = None,
+            detail_cache: MemoryCache | None = None,
+            rate_limiter: TokenBucket | None = None,
+            quota: DailyQuota | None = None,
+            ratings_index: RatingsIndex | None = None,
+            fast_json: bool = False,
+            circuit_breaker: CircuitBreaker | None = None
+    ):
+        self._api_key = api_key
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.response_cache = response_cache
+        self.detail_cache = detail_cache
+        self.rate_limiter = rate_limiter
+        self.quota = quota
+        self.ratings_index = ratings_index
+        self.circuit_breaker = circuit_breaker
+        # Быстрый разбор ответов (orjson, только используемые поля) включается, лишь если orjson установлен.
+        self.fast_json = fast_json and fast_json_available()
+        self._update_listeners: list = []
+        self._revalidating: set[str] = set()
+        self._revalidating_lock = threading.Lock()
+
+    @property
+    def api_key(self) -> str | None:
+        """Явно переданный ключ или ключ из настроек."""
+        return self._api_key if self._api_key is not None else OMDB_API_KEY
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
+
+    def _reserve_request(self) -> float:
+        """
+        Учитывает сетевой запрос в дневной квоте (QuotaExceededError, если она исчерпана)
+        и возвращает, сколько секунд подождать токен ограничителя частоты.
+        Пока предохранитель считает OMDb недоступным, сразу бросает CircuitOpenError.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.allow()
+        if self.quota is not None:
+            self.quota.consume()
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve()
+
+    def _record_health(self, status: int | None = None, failed: bool = False) -> None:
+        """Сообщает предохранителю исход попытки: сбой соединения или таймаут (failed) либо HTTP-статус ответа."""
+        if self.circuit_breaker is None or (status is None and not failed):
+            return
+        if failed or status >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def add_update_listener(self, listener) -> None:
+        """
+        Подписывает listener(kind, key, data) на обновления устаревших записей кэша,
+        выполненные в фоне: kind — 'details' (key — imdbID) или 'search' (key — ключ кэша).
+        Слушатель вызывается не из того потока, где был сделан запрос.
+        """
+        self._update_listeners.append(listener)
+
+    def remove_update_listener(self, listener) -> None:
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
+    def _notify_update(self, kind: str, key: str, data: dict) -> None:
+        for listener in list(self._update_listeners):
+            try:
+                listener(kind, key, data)
+            except Exception as e:
+                print(f"Ошибка в обработчике обновления OMDb ({kind}, {key}): {e}", file=sys.stderr)
+
+    def _start_revalidation(self, cache_key: str) -> bool:
+        """Отмечает ключ как обновляемый; False, если обновление уже идёт или OMDb сейчас недоступен."""
+        if self.circuit_breaker is not None and self.circuit_breaker.state == CIRCUIT_OPEN:
+            return False
+        with self._revalidating_lock:
+            if cache_key in self._revalidating:
+                return False
+            self._revalidating.add(cache_key)
+            return True
+
+    def _finish_revalidation(self, cache_key: str) -> None:
+        with self._revalidating_lock:
+            self._revalidating.discard(cache_key)
+
+    @abstractmethod
+    def _revalidate(self, kind: str, key: str, cache_key: str, loader, *args) -> None:
+        """Запускает фоновое обновление устаревшей записи кэша (реализуется в клиентах)."""
+
+    def _cached_details(self, imdb_id: str, cache_key: str, params: dict):
+        """
+        Детали из кэша в памяти или на диске; MISSING, если их нужно запросить.
+        Устаревшая запись с диска возвращается сразу, а её обновление запускается в фоне.
+        """
+        if self.detail_cache is not None:
+            cached = self.detail_cache.get(imdb_id)
+            if cached is not MISSING:
+                return cached
+        if self.response_cache is not None:
+            entry = self.response_cache.get_entry(cache_key)
+            if entry is not None:
+                cached, stale = entry
+                if stale:
+                    self._revalidate('details', imdb_id, cache_key, self._refresh_details, imdb_id, cache_key, params)
+                if self.detail_cache is not None:
+                    self.detail_cache.set(imdb_id, cached)
+                return cached
+        return MISSING
+
+    def _store_details(self, imdb_id: str, cache_key: str, data: dict) -> dict | None:
+        """
+        Сохраняет ответ ?i= в кэши и возвращает данные фильма или None.
+        Хранятся только поля, которые нужны выдаче поиска (см. fast_json.DETAIL_FIELDS).
+        """
         if data.get("Response") == "True":
+            data = compact_details(data)
+            if self.ratings_index is not None:
+                self.ratings_index.record(data)
+            if self.response_cache is not None:
+                ttl, stale_after = _cache_ttls(settings.OMDB_CACHE_DETAIL_TTL, settings.OMDB_CACHE_DETAIL_HARD_TTL)
+                self.response_cache.set(cache_key, data, ttl, stale_after)
+            if self.detail_cache is not None:
+                self.detail_cache.set(imdb_id, data)
             return data
+        if data.get('Error') != 'Error getting data.':
+            print(f"OMDb API Error (i={imdb_id}): {data.get('Error')}", file=sys.stderr)
+        # Ответ OMDb без данных кэшируется коротко, чтобы не повторять заведомо пустой запрос.
+        if self.detail_cache is not None:
+            self.detail_cache.set_negative(imdb_id)
+        return None
+
+    def _cached_full_details(self, cache_key: str):
+        """Полные детали фильма из кэша в памяти или на диске; MISSING, если их нужно запросить."""
+        if self.detail_cache is not None:
+            cached = self.detail_cache.get(cache_key)
+            if cached is not MISSING:
+                return cached
+        if self.response_cache is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                if self.detail_cache is not None:
+                    self.detail_cache.set(cache_key, cached)
+                return cached
+        return MISSING
+
+    def _store_full_details(self, imdb_id: str, cache_key: str, data: dict) -> dict | None:
+        """
+        Сохраняет ответ ?i=&plot=full отдельно от деталей для выдачи (свой ключ в кэшах)
+        и возвращает его поля из FULL_DETAIL_FIELDS или None.
+        """
+        if data.get("Response") != "True":
+            print(f"OMDb API Error (i={imdb_id}, plot=full): {data.get('Error')}", file=sys.stderr)
+            if self.detail_cache is not None:
+                self.detail_cache.set_negative(cache_key)
+            return None
+        data = compact_details(data, FULL_DETAIL_FIELDS)
+        if self.response_cache is not None:
+            ttl, stale_after = _cache_ttls(settings.OMDB_CACHE_DETAIL_TTL, settings.OMDB_CACHE_DETAIL_HARD_TTL)
+            self.response_cache.set(cache_key, data, ttl, stale_after)
+        if self.detail_cache is not None:
+            self.detail_cache.set(cache_key, data)
+        return data
+
+    def _rating_excluded(self, imdb_id: str, min_rating: float, max_rating: float) -> bool:
+        """Кандидат заведомо не проходит фильтр по рейтингу согласно локальному индексу."""
+        return self.ratings_index is not None and self.ratings_index.excludes(imdb_id, min_rating, max_rating)
+
+    def _cached_search_page(self, cache_key: str, params: dict) -> dict | None:
+        if self.response_cache is None:
+            return None
+        entry = self.response_cache.get_entry(cache_key)
+        if entry is None:
+            return None
+        cached, stale = entry
+        if stale:
+            self._revalidate('search', cache_key, cache_key, self._load_search_page, cache_key, params)
+        return cached
+
+    def _store_search_page(self, cache_key: str, data: dict) -> None:
+        if self.response_cache is not None and data.get("Response") == "True":
+            ttl, stale_after = _cache_ttls(settings.OMDB_CACHE_SEARCH_TTL, settings.OMDB_CACHE_SEARCH_HARD_TTL)
+            self.response_cache.set(cache_key, data, ttl, stale_after)
+
+
+class OmdbClient(_BaseOmdbClient):
+    """
+    Клиент OMDb API поверх одной requests.Session с пулом keep-alive соединений.
+    Идемпотентные GET-запросы повторяются при ошибках соединения и ответах 5xx
+    с экспоненциальной задержкой и случайным разбросом (full jitter).
+    Если задан catalog, поиск сначала выполняется по локальному каталогу фильмов.
+    С политикой hedge запрос деталей, выполняющийся дольше выученного перцентиля,
+    дублируется, и используется ответ, пришедший первым.
+    С пределом concurrency число одновременных запросов к OMDb подстраивается
+    под задержки и ошибки сети вместо фиксированного max_workers.
+    """
+
+    def __init__(self, api_key: str | None = None, base_url: str = BASE_URL,
+                 pool_size: int = DETAIL_FETCH_WORKERS, catalog: MovieCatalog | None = None,
+                 hedge: HedgePolicy | None = None, concurrency: AdaptiveConcurrencyLimit | None = None,
+                 **kwargs):
+        super().__init__(api_key, base_url, **kwargs)
+        self.catalog = catalog
+        self.hedge = hedge
+        self.concurrency = concurrency
+        if concurrency is not None:
+            pool_size = max(pool_size, concurrency.max_limit)
+        self.pool_size = pool_size
+        self.inflight = SingleFlight()
+        self._fetch_status = threading.local()
+        self.session = requests.Session()
+        # Дубли запросов не должны вытеснять соединения основных запросов из пула.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size * 2 if hedge is not None else pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._revalidation_executor: ThreadPoolExecutor | None = None
+        self._revalidation_executor_lock = threading.Lock()
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        if self._revalidation_executor is not None:
+            self._revalidation_executor.shutdown(wait=False, cancel_futures=True)
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _revalidate(self, kind: str, key: str, cache_key: str, loader, *args) -> None:
+        if not self._start_revalidation(cache_key):
+            return
+        self._get_revalidation_executor().submit(self._run_revalidation, kind, key, cache_key, loader, args)
+
+    def _get_revalidation_executor(self) -> ThreadPoolExecutor:
+        with self._revalidation_executor_lock:
+            if self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(max_workers=REVALIDATION_WORKERS,
+                                                                 thread_name_prefix="omdb-revalidate")
+            return self._revalidation_executor
+
+    def _run_revalidation(self, kind: str, key: str, cache_key: str, loader, args: tuple) -> None:
+        try:
+            data = self._shared(cache_key, None, loader, *args)
+        except Exception as e:
+            print(f"Не удалось обновить устаревшие данные OMDb ({key}): {e}", file=sys.stderr)
+            return
+        finally:
+            self._finish_revalidation(cache_key)
+        if data:
+            self._notify_update(kind, key, data)
+
+    def _shared(self, cache_key: str, deadline: Deadline | None, loader, *args):
+        """
+        Один запрос на ключ для всех одновременных вызовов. Если общий запрос оборвался по сроку
+        вызова, который его начал, а у этого вызова время ещё есть, запрос повторяется с его сроком.
+        """
+        return self.inflight.do(cache_key, loader, *args, retry_on=lambda error: (
+            isinstance(error, DeadlineExceeded) and (deadline is None or not deadline.expired)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get(self, params: dict, timeout: float, deadline: Deadline | None = None) -> dict:
+        """
+        GET-запрос к OMDb с повторами; возвращает разобранный JSON.
+        С deadline таймаут каждой попытки урезается до оставшегося времени, а пауза,
+        после которой времени не останется, заменяется исключением DeadlineExceeded.
+        """
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.timeout(timeout)
+            delay = self._reserve_request()
+            if delay > 0:
+                if deadline is not None:
+                    deadline.check_wait(delay)
+                time.sleep(delay)
+            started = self._acquire_slot(deadline)
+            try:
+                request_timeout = timeout if deadline is None else deadline.timeout(timeout)
+            except DeadlineExceeded as e:
+                # Срок мог истечь, пока ждали места в пределе: место нужно вернуть.
+                self._release_slot(started, error=e)
+                raise
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=request_timeout)
+            except requests.exceptions.RequestException as e:
+                self._release_slot(started, error=e)
+                self._record_health(failed=isinstance(e, (requests.exceptions.ConnectionError,
+                                                          requests.exceptions.Timeout)))
+                if isinstance(e, requests.exceptions.Timeout) and deadline is not None and deadline.expired:
+                    # Таймаут был урезан до срока поиска: для других ожидающих этот запрос — истечение срока.
+                    raise DeadlineExceeded("Истёк срок, отведённый на поиск") from e
+                if not isinstance(e, requests.exceptions.ConnectionError) or attempt >= self.max_retries:
+                    raise
+            else:
+                self._release_slot(started, status_code=response.status_code)
+                self._record_health(response.status_code)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    if self.fast_json:
+                        return decode_omdb(response.content, params)
+                    return response.json()
+            backoff = self._backoff_delay(attempt)
+            if deadline is not None:
+                deadline.check_wait(backoff)
+            time.sleep(backoff)
+            attempt += 1
+
+    def _acquire_slot(self, deadline: Deadline | None) -> float | None:
+        """Ждёт места в адаптивном пределе одновременных запросов (не дольше оставшегося до deadline)."""
+        if self.concurrency is None:
+            return None
+        started = self.concurrency.acquire(None if deadline is None else deadline.remaining())
+        if started is None:
+            raise DeadlineExceeded("Истёк срок, отведённый на поиск")
+        return started
+
+    def _release_slot(self, started: float | None, status_code: int | None = None,
+                      error: Exception | None = None) -> None:
+        """Освобождает место в пределе, сообщая ему, говорит ли ответ (или ошибка) о перегрузке OMDb."""
+        if started is None:
+            return
+        if error is not None:
+            overloaded = isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+            self.concurrency.release(started, OVERLOAD if overloaded else IGNORE)
         else:
-            if data.get('Error') != 'Error getting data.':
-                print(f"OMDb API Error (i={imdb_id}): {data.get('Error')}", file=sys.stderr)
+            self.concurrency.release(started, _request_outcome(status_code))
+
+    def probe(self) -> bool:
+        """
+        Пробный запрос к OMDb в обход кэшей. Когда разомкнутому предохранителю пора проверить соединение,
+        запрос проходит как half-open, и его исход замыкает цепь или снова размыкает её.
+        """
+        if not self.api_key:
+            return False
+        try:
+            self._get({'apikey': self.api_key, 'i': PROBE_IMDB_ID}, DETAIL_TIMEOUT)
+        except (QuotaExceededError, CircuitOpenError, requests.exceptions.RequestException, ValueError):
+            return False
+        return True
+
+    def get_movie_by_id(self, imdb_id, deadline: Deadline | None = None):
+        api_key = self.api_key
+        if not api_key: print("API ключ OMDb не настроен.", file=sys.stderr); return None
+        params = {'apikey': api_key, 'i': imdb_id, 'plot': 'short'}
+        cache_key = _cache_key(params)
+        cached = self._cached_details(imdb_id, cache_key, params)
+        if cached is not MISSING:
+            return cached
+        data = self._load_logged(imdb_id, cache_key, deadline, self._load_details, imdb_id, cache_key, params,
+                                 deadline)
+        if data is FETCH_FAILED:
+            self._fetch_status.failed = True
             return None
-    except requests.exceptions.Timeout:
-        print(f"Таймаут при получении деталей для {imdb_id}", file=sys.stderr)
-        return None
-    except requests.exceptions.RequestException as e:
-        print(f"Ошибка сети при получении деталей {imdb_id}: {e}", file=sys.stderr)
-        return None
-    except Exception as e:
-        print(f"Неожиданная ошибка при получении деталей {imdb_id}: {e}", file=sys.stderr)
-        return None
+        return data
 
+    def _fetch_for_search(self, imdb_id: str, deadline: Deadline | None = None):
+        """get_movie_by_id для обхода выдачи: сбой загрузки возвращается как FETCH_FAILED, а не None."""
+        self._fetch_status.failed = False
+        data = self.get_movie_by_id(imdb_id) if deadline is None else self.get_movie_by_id(imdb_id, deadline=deadline)
+        if data is None and getattr(self._fetch_status, 'failed', False):
+            return FETCH_FAILED
+        return data
 
-def search_movie_by_title(
-        title: str,
-        year: str | None = None,
-        type_filter: str | None = None,
-        min_rating: float = 0.0,
-        max_rating: float = 10.0
-) -> list[dict] | None:
+    def get_full_details(self, imdb_id: str) -> MovieFullDetails | None:
+        """
+        Полные детали для карточки фильма: описание plot=full, награды, сборы, оценки других источников.
+        Запрашиваются только по требованию (выдача поиска обходится короткими деталями)
+        и кэшируются отдельно от них.
+        """
+        api_key = self.api_key
+        if not api_key: print("API ключ OMDb не настроен.", file=sys.stderr); return None
+        params = {'apikey': api_key, 'i': imdb_id, 'plot': 'full'}
+        cache_key = _cache_key(params)
+        data = self._cached_full_details(cache_key)
+        if data is MISSING:
+            data = self._load_logged(imdb_id, cache_key, None, self._load_full_details, imdb_id, cache_key, params)
+        return None if data is None or data is FETCH_FAILED else MovieFullDetails.from_omdb(data)
+
+    def _load_logged(self, imdb_id: str, cache_key: str, deadline: Deadline | None, loader, *args):
+        """
+        Загружает детали через loader (один запрос на ключ, см. _shared); None, если у OMDb их нет.
+        Ошибки печатаются, вместо них возвращается FETCH_FAILED.
+        """
+        try:
+            return self._shared(cache_key, deadline, loader, *args)
+        except (QuotaExceededError, CircuitOpenError) as e:
+            print(f"{e} ({imdb_id})", file=sys.stderr)
+            return FETCH_FAILED
+        except DeadlineExceeded:
+            return FETCH_FAILED
+        except requests.exceptions.Timeout:
+            print(f"Таймаут при получении деталей для {imdb_id}", file=sys.stderr)
+            return FETCH_FAILED
+        except requests.exceptions.RequestException as e:
+            print(f"Ошибка сети при получении деталей {imdb_id}: {e}", file=sys.stderr)
+            return FETCH_FAILED
+        except Exception as e:
+            print(f"Неожиданная ошибка при получении деталей {imdb_id}: {e}", file=sys.stderr)
+            return FETCH_FAILED
+
+    def search_movie_by_title(
+            self,
+            title: str,
+            year: str | None = None,
+            type_filter: str | None = None,
+            min_rating: float = 0.0,
+            max_rating: float = 10.0,
+            max_workers: int = DETAIL_FETCH_WORKERS,
+            timeout: float | None = None
+    ) -> SearchResults | None:
+        """
+        Ищет фильмы/сериалы по названию, фильтрует по году/типу,
+        затем фильтрует по диапазону рейтинга IMDb.
+        Детали фильмов загружаются параллельно (не более max_workers запросов одновременно),
+        порядок результатов совпадает с порядком выдачи OMDb.
+        Возвращает не более 15 результатов с рейтингом для каждого фильма.
+        timeout ограничивает весь поиск: по его истечении возвращаются уже найденные
+        результаты с пометкой truncated.
+        """
+        cursor = SearchCursor(self, title, year, type_filter, min_rating, max_rating, max_workers, timeout)
+        try:
+            found = list(cursor.iter_positions())
+        except OmdbSearchError:
+            return None
+        results = SearchResults(result for _, result in sorted(found, key=lambda item: item[0]))
+        results.truncated = cursor.truncated
+        return results
+
+    def iter_search(
+            self,
+            title: str,
+            year: str | None = None,
+            type_filter: str | None = None,
+            min_rating: float = 0.0,
+            max_rating: float = 10.0,
+            max_workers: int = DETAIL_FETCH_WORKERS,
+            on_progress=None,
+            cancel_event: threading.Event | None = None,
+            timeout: float | None = None
+    ) -> Iterator[MovieSummary]:
+        """
+        Потоковый вариант search_movie_by_title: отдаёт каждый результат, как только
+        пришли его детали и он прошёл фильтр по рейтингу (в порядке готовности).
+        on_progress(done, total) вызывается после каждой загрузки деталей;
+        установленный cancel_event прекращает поиск и отменяет ещё не начатые запросы,
+        а истёкший timeout — просто завершает выдачу.
+        Бросает OmdbSearchError, если не удалось получить первую страницу выдачи.
+        """
+        cursor = SearchCursor(self, title, year, type_filter, min_rating, max_rating, max_workers, timeout)
+        return cursor.fetch_more(on_progress=on_progress, cancel_event=cancel_event)
+
+    def search_many(
+            self,
+            queries,
+            min_rating: float = 0.0,
+            max_rating: float = 10.0,
+            max_queries: int = BATCH_SEARCH_QUERIES,
+            max_workers: int = DETAIL_FETCH_WORKERS,
+            cancel_event: threading.Event | None = None,
+            timeout: float | None = None
+    ) -> Iterator[tuple[int, SearchResults | None]]:
+        """
+        Пакетный поиск по многим названиям: queries — названия или кортежи (название, год, тип).
+        Отдаёт пары (номер запроса в queries, результат search_movie_by_title) по мере готовности,
+        а не в порядке запросов. Одновременно выполняется не больше max_queries поисков, и они
+        делят между собой max_workers запросов деталей, пул соединений, кэши, ограничитель частоты
+        и объединение одинаковых запросов; совпадающие запросы пакета выполняются один раз.
+        timeout ограничивает каждый поиск отдельно; cancel_event прекращает выдачу,
+        ещё не начатые поиски не выполняются.
+        """
+        positions: dict[tuple, tuple[tuple, list[int]]] = {}
+        for index, query in enumerate(queries):
+            title, year, type_filter = _batch_query(query)
+            key = (title.strip().lower(), year, type_filter)
+            positions.setdefault(key, ((title, year, type_filter), []))[1].append(index)
+        if not positions:
+            return
+        waiting = iter(positions.values())
+        workers = max(1, min(max_queries, len(positions)))
+        per_query_workers = max(1, max_workers // workers)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="omdb-batch")
+        pending = {}
+        try:
+            while True:
+                while len(pending) < workers:
+                    query = next(waiting, None)
+                    if query is None:
+                        break
+                    (title, year, type_filter), indexes = query
+                    future = executor.submit(self.search_movie_by_title, title, year, type_filter,
+                                             min_rating, max_rating, per_query_workers, timeout)
+                    pending[future] = indexes
+                if not pending or (cancel_event is not None and cancel_event.is_set()):
+                    return
+                done, _ = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results = future.result()
+                    for index in pending.pop(future):
+                        yield index, results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_enriched(self, queue: deque, min_rating: float, max_rating: float, max_workers: int,
+                       limit: int = MAX_SEARCH_RESULTS, on_progress=None,
+                       cancel_event: threading.Event | None = None, deadline: Deadline | None = None,
+                       failed: list | None = None) -> Iterator[tuple[int, MovieSummary]]:
+        """
+        Параллельно загружает детали кандидатов из очереди (позиция в выдаче, результат ?s=)
+        и отдаёт пары (позиция, дополненный результат) для прошедших фильтр.
+        В работе одновременно не больше запросов, чем результатов ещё не хватает до limit,
+        поэтому набор результатов совпадает с последовательным обходом, а необработанные
+        кандидаты остаются в очереди. Кандидаты, которых локальный индекс рейтингов
+        отсеивает фильтром, отбрасываются без запроса деталей, а кандидаты, детали которых
+        уже известны (строки каталога), отдаются без обращения к OMDb. Когда истекает deadline,
+        обход прекращается, а кандидаты без деталей возвращаются в начало очереди.
+        Кандидаты, детали которых не загрузились по другой причине, складываются в failed
+        (а не отбрасываются как фильмы без данных), чтобы их можно было запросить позже.
+        С адаптивным пределом concurrency число запросов в работе не превышает его текущего значения.
+        """
+        if not queue or limit <= 0:
+            return
+        fetch_details = partial(self._fetch_for_search, deadline=deadline)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, limit, len(queue))))
+        pending = {}
+        unfinished = []
+        completed = 0
+        accepted = 0
+        try:
+            while True:
+                workers = max_workers if self.concurrency is None else min(max_workers, self.concurrency.limit)
+                while queue and len(pending) < min(max(1, workers), limit - accepted):
+                    candidate = queue.popleft()
+                    if self._rating_excluded(candidate[1].imdb_id, min_rating, max_rating):
+                        continue
+                    if candidate[1].details is None:
+                        pending[executor.submit(fetch_details, candidate[1].imdb_id)] = candidate
+                        continue
+                    completed += 1
+                    if on_progress is not None:
+                        on_progress(completed, completed + len(pending) + len(queue))
+                    if _rating_accepted(candidate[1], min_rating, max_rating):
+                        accepted += 1
+                        yield candidate
+                if deadline is not None and deadline.expired:
+                    queue.extendleft(sorted([*pending.values(), *unfinished], key=lambda item: item[0],
+                                            reverse=True))
+                    return
+                if not pending or (cancel_event is not None and cancel_event.is_set()):
+                    return
+
+                poll_interval = CANCEL_POLL_INTERVAL if deadline is None else min(CANCEL_POLL_INTERVAL,
+                                                                                  deadline.remaining())
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    index, basic_result = pending.pop(future)
+                    detailed_data = future.result()
+                    if detailed_data is FETCH_FAILED:
+                        # Детали не загрузились, а не отсутствуют: кандидат ждёт следующей порции.
+                        if deadline is not None and deadline.expired:
+                            unfinished.append((index, basic_result))
+                        elif failed is not None:
+                            failed.append((index, basic_result))
+                        continue
+                    completed += 1
+                    if on_progress is not None:
+                        on_progress(completed, completed + len(pending) + len(queue))
+                    full_result = _enrich_result(basic_result, detailed_data, min_rating, max_rating)
+                    if full_result is not None:
+                        accepted += 1
+                        yield index, full_result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_search_page(self, params: dict, deadline: Deadline | None = None) -> dict:
+        """Загружает страницу выдачи ?s=, используя кэш для уже просмотренных запросов."""
+        cache_key = _cache_key(params)
+        cached = self._cached_search_page(cache_key, params)
+        if cached is not None:
+            return cached
+        return self._shared(cache_key, deadline, self._load_search_page, cache_key, params, deadline)
+
+    def _get_details(self, params: dict, deadline: Deadline | None = None) -> dict:
+        """Запрос ?i=; с политикой hedge медленный запрос дублируется (см. _get_hedged)."""
+        if self.hedge is None:
+            return self._get(params, DETAIL_TIMEOUT, deadline)
+        return self._get_hedged(params, deadline)
+
+    def _get_hedged(self, params: dict, deadline: Deadline | None) -> dict:
+        """
+        Отправляет запрос и, если ответа нет дольше hedge.hedge_delay() и бюджет дублей позволяет,
+        отправляет второй такой же; возвращается первый успешный ответ, проигравший запрос
+        просто дорабатывает в фоне. Исключение — только если не удались оба запроса.
+        """
+        hedge = self.hedge
+        hedge.record_request()
+        executor = self._get_hedge_executor()
+        primary = executor.submit(self._timed_get, params, deadline)
+        delay = hedge.hedge_delay()
+        if delay is None or wait([primary], timeout=delay).done or not hedge.try_hedge():
+            return primary.result()
+
+        backup = executor.submit(self._timed_get, params, deadline)
+        remaining = {primary, backup}
+        error: BaseException | None = None
+        while remaining:
+            done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is backup:
+                    hedge.record_win()
+                return future.result()
+        raise error
+
+    def _timed_get(self, params: dict, deadline: Deadline | None) -> dict:
+        started = time.monotonic()
+        data = self._get(params, DETAIL_TIMEOUT, deadline)
+        self.hedge.tracker.record(time.monotonic() - started)
+        return data
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=self.pool_size * 2,
+                                                          thread_name_prefix="omdb-hedge")
+            return self._hedge_executor
+
+    def _load_details(self, imdb_id: str, cache_key: str, params: dict,
+                      deadline: Deadline | None = None) -> dict | None:
+        return self._store_details(imdb_id, cache_key, self._get_details(params, deadline))
+
+    def _refresh_details(self, imdb_id: str, cache_key: str, params: dict) -> dict | None:
+        """Как _load_details, но ответ без данных не вытесняет устаревшую запись из кэша."""
+        data = self._get_details(params)
+        return self._store_details(imdb_id, cache_key, data) if data.get("Response") == "True" else None
+
+    def _load_full_details(self, imdb_id: str, cache_key: str, params: dict) -> dict | None:
+        return self._store_full_details(imdb_id, cache_key, self._get_details(params))
+
+    def _load_search_page(self, cache_key: str, params: dict, deadline: Deadline | None = None) -> dict:
+        data = self._get(params, SEARCH_TIMEOUT, deadline)
+        self._store_search_page(cache_key, data)
+        return data
+
+
+class SearchCursor:
     """
-    Ищет фильмы/сериалы по названию, фильтрует по году/типу,
-    затем фильтрует по диапазону рейтинга IMDb.
-    Возвращает не более 15 результатов с рейтингом для каждого фильма.
+    Курсор по выдаче OMDb для одного запроса: страницы ?s= загружаются по требованию,
+    уже дополненные результаты сохраняются в results, повторяющиеся imdbID отбрасываются.
+    Если у клиента есть локальный каталог и его совпадений хватает на первую порцию, курсор
+    сначала листает каталог (source == 'catalog'): детали запрашиваются из OMDb только для строк,
+    у которых их нет (например, загруженных из дампа IMDb). Когда каталог заканчивается,
+    выдача продолжается страницами OMDb без повторов.
+    time_budget (в секундах) ограничивает каждую порцию выдачи: если срок истёк,
+    порция обрывается, truncated становится True, а необработанные кандидаты остаются в очереди.
+    Курсор не потокобезопасен: одновременно им должен пользоваться один поток.
     """
-    if not OMDB_API_KEY:
-        print("API ключ OMDb не настроен.", file=sys.stderr)
-        return None
-    if not title:
-        return []
 
-    initial_results = []
-    max_initial_results = 20
-    total_results_api = 0
+    def __init__(self, client: OmdbClient, title: str, year: str | None = None, type_filter: str | None = None,
+                 min_rating: float = 0.0, max_rating: float = 10.0, max_workers: int = DETAIL_FETCH_WORKERS,
+                 time_budget: float | None = None):
+        self.client = client
+        self.title = title
+        self.year = year
+        self.type_filter = type_filter
+        self.min_rating = min_rating
+        self.max_rating = max_rating
+        self.max_workers = max_workers
+        self.time_budget = time_budget
+        self.truncated = False
+        self.results: list[MovieSummary] = []
+        self.next_page = 1
+        self.total_results: int | None = None
+        self._queue: deque[tuple[int, MovieSummary]] = deque()
+        self._seen_ids: set[str] = set()
+        self._positions = 0
+        self._pages_exhausted = not title
+        self.source: str | None = None
+        self._catalog_rows: list[MovieSummary] | None = None
+        self._catalog_offset = 0
+
+    @property
+    def last_page(self) -> int | None:
+        if self.total_results is None:
+            return None
+        return min(MAX_OMDB_PAGE, -(-self.total_results // OMDB_PAGE_SIZE))
+
+    @property
+    def has_more(self) -> bool:
+        """Есть ли ещё необработанные кандидаты, строки каталога или незагруженные страницы."""
+        return bool(self._queue) or self.source == 'catalog' or not self._pages_exhausted
+
+    def _choose_source(self, count: int) -> None:
+        """
+        Выбирает источник выдачи: каталог, если его совпадений хватает на порцию из count
+        результатов (и их не меньше min_results), иначе OMDb.
+        """
+        catalog = self.client.catalog
+        self.source = 'omdb'
+        if catalog is None or not self.title:
+            return
+        rows = self._search_catalog(count + 1)
+        if rows is not None and len(rows) >= max(count, catalog.min_results, 1):
+            self.source = 'catalog'
+            self._catalog_rows = rows
+
+    def _search_catalog(self, limit: int) -> list[MovieSummary] | None:
+        return self.client.catalog.search(self.title, self.year, self.type_filter, self.min_rating,
+                                          self.max_rating, limit=limit, offset=self._catalog_offset)
 
-    for page in range(1, 3):
-        if len(initial_results) >= max_initial_results and page > 1:
-            break
+    def _load_catalog(self, count: int, on_candidates=None) -> None:
+        """
+        Ставит в очередь до count следующих строк каталога; строка сверх count лишь показывает,
+        что в каталоге есть ещё. Когда каталог заканчивается, дальше выдачу продолжает OMDb.
+        """
+        rows = self._catalog_rows if self._catalog_rows is not None else self._search_catalog(count + 1)
+        rows = rows or []
+        batch = rows[:count]
+        self._catalog_rows = None
+        self._catalog_offset += len(batch)
+        if len(rows) <= count:
+            self.source = 'omdb'
+        candidates = []
+        for summary in batch:
+            if summary.imdb_id in self._seen_ids:
+                continue
+            self._seen_ids.add(summary.imdb_id)
+            self._queue.append((self._positions, summary))
+            candidates.append(summary)
+            self._positions += 1
+        if candidates and on_candidates is not None:
+            on_candidates(candidates)
 
-        params = {'apikey': OMDB_API_KEY, 's': title, 'page': page}
-        if year and year.strip().isdigit():
-            params['y'] = year.strip()
-        if type_filter and type_filter in ['movie', 'series', 'episode']:
-            params['type'] = type_filter
+    def _fetch_page(self, page: int, deadline: Deadline | None = None) -> dict:
+        api_key = self.client.api_key
+        if not api_key:
+            print("API ключ OMDb не настроен.", file=sys.stderr)
+            raise OmdbSearchError("API ключ OMDb не настроен.")
+        return self.client._fetch_search_page(_search_params(api_key, self.title, page, self.year, self.type_filter),
+                                              deadline)
 
+    def _load_page(self, on_candidates=None, deadline: Deadline | None = None) -> bool:
+        """
+        Загружает следующую страницу выдачи в очередь; False, если дальше страниц нет или произошла ошибка.
+        on_candidates получает новые (ещё не дополненные деталями) результаты страницы.
+        """
         try:
-            response = requests.get(BASE_URL, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("Response") == "True":
-                found_now = data.get("Search", [])
-                initial_results.extend(found_now)
-                if page == 1:
-                    try:
-                        total_results_api = int(data.get("totalResults", 0))
-                    except ValueError:
-                        total_results_api = 0
-                if total_results_api <= page * 10:
-                    break
+            data = self._fetch_page(self.next_page, deadline)
+        except OmdbSearchError:
+            raise
         except Exception as e:
-            print(f"Ошибка при поиске (страница {page}): {e}", file=sys.stderr)
-            if page == 1:
-                return None
-            break
+            return self._page_failed(self.next_page, e, deadline)
+        return self._apply_page(data, on_candidates)
+
+    def _load_pages(self, missing: int, max_pages: int, on_candidates=None,
+                    deadline: Deadline | None = None, reserve_for_details: bool = False) -> tuple[int, bool]:
+        """
+        Догружает страницы, пока кандидатов в очереди не хватает ещё на missing результатов
+        (не больше max_pages страниц); возвращает (сколько страниц загружено, можно ли грузить дальше).
+        Первая страница загружается одна — из неё известно totalResults; остальные нужные
+        запрашиваются одновременно и добавляются в очередь в порядке страниц.
+        С reserve_for_details следующие страницы откладываются, если в очереди уже есть кандидаты,
+        а до deadline осталось меньше SEARCH_TIMEOUT: медленная страница не должна съесть время,
+        нужное на детали уже найденных фильмов.
+        """
+        loaded = 0
+        if self.total_results is None and not self._pages_exhausted and max_pages > 0:
+            queued = len(self._queue)
+            loaded += 1
+            if not self._load_page(on_candidates, deadline):
+                return loaded, False
+            missing -= len(self._queue) - queued
+        if missing <= 0 or self._pages_exhausted or loaded >= max_pages:
+            return loaded, True
+        if reserve_for_details and self._queue and deadline is not None and deadline.remaining() < SEARCH_TIMEOUT:
+            return loaded, True
+
+        first = self.next_page
+        pages = list(range(first, min(self.last_page, first + min(max_pages - loaded,
+                                                                   -(-missing // OMDB_PAGE_SIZE)) - 1) + 1))
+        if len(pages) == 1:
+            return loaded + 1, self._load_page(on_candidates, deadline)
+        with ThreadPoolExecutor(max_workers=len(pages), thread_name_prefix="omdb-pages") as executor:
+            futures = [executor.submit(self._fetch_page, page, deadline) for page in pages]
+        for page, future in zip(pages, futures):
+            loaded += 1
+            try:
+                data = future.result()
+            except Exception as e:
+                # Следующие страницы не добавляются, чтобы порядок выдачи не нарушился; они будут запрошены снова.
+                return loaded, self._page_failed(page, e, deadline)
+            if not self._apply_page(data, on_candidates):
+                return loaded, False
+        return loaded, True
+
+    def _page_failed(self, page: int, error: Exception, deadline: Deadline | None = None) -> bool:
+        print(f"Ошибка при поиске (страница {page}): {error}", file=sys.stderr)
+        # Оборванная по сроку первая страница — не ошибка поиска: её запросит следующая порция.
+        if page == 1 and (deadline is None or not deadline.expired):
+            self._pages_exhausted = True
+            raise OmdbSearchError(str(error)) from error
+        return False
+
+    def _apply_page(self, data: dict, on_candidates=None) -> bool:
+        """Добавляет в очередь новые (по imdbID) результаты очередной страницы выдачи."""
+        self.next_page += 1
+        if data.get("Response") != "True":
+            self._pages_exhausted = True
+            return False
+        if self.total_results is None:
+            self.total_results = _parse_total_results(data)
+        candidates = []
+        for basic_result in data.get("Search", []):
+            imdb_id = basic_result.get('imdbID')
+            if not imdb_id or imdb_id in self._seen_ids:
+                continue
+            self._seen_ids.add(imdb_id)
+            summary = MovieSummary.from_omdb(basic_result)
+            self._queue.append((self._positions, summary))
+            candidates.append(summary)
+            self._positions += 1
+        if candidates and on_candidates is not None:
+            on_candidates(candidates)
+        if self.next_page > self.last_page:
+            self._pages_exhausted = True
+        return True
+
+    def iter_positions(self, count: int = MAX_SEARCH_RESULTS, on_progress=None,
+                       cancel_event: threading.Event | None = None,
+                       on_candidates=None) -> Iterator[tuple[int, MovieSummary]]:
+        """
+        Отдаёт до count новых результатов вместе с их позицией в выдаче OMDb.
+        Страниц загружается ровно столько, чтобы кандидатов хватило на count результатов;
+        если фильтр по рейтингу отсеивает кандидатов, догружаются следующие
+        (не больше MAX_PAGES_PER_FETCH страниц за вызов). on_candidates(list) вызывается
+        с названиями и годами каждой загруженной страницы ещё до запроса деталей.
+        Если детали части кандидатов не загрузились (сбой сети, разомкнутый предохранитель),
+        порция помечается truncated, а эти кандидаты будут запрошены в следующей.
+        """
+        self.truncated = False
+        if self.source is None:
+            self._choose_source(count)
+        deadline = Deadline(self.time_budget) if self.time_budget is not None else None
+
+        accepted = 0
+        pages_loaded = 0
+        progress = {'base': 0, 'done': 0}
+
+        def report(done: int, total: int):
+            progress['done'] = done
+            if on_progress is not None:
+                on_progress(progress['base'] + done, progress['base'] + total)
+
+        # Кандидаты, детали которых не загрузились, в этой порции больше не запрашиваются
+        # и возвращаются в очередь к следующей; пока они есть, выдача считается неполной.
+        failed = []
+        try:
+            can_load = True
+            while accepted < count:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                if deadline is not None and deadline.expired:
+                    self.truncated = True
+                    return
+                if self.source == 'catalog' and len(self._queue) < count - accepted:
+                    self._load_catalog(count - accepted - len(self._queue), on_candidates)
+                if (self.source == 'omdb' and can_load and len(self._queue) < count - accepted
+                        and not self._pages_exhausted):
+                    loaded, can_load = self._load_pages(count - accepted - len(self._queue),
+                                                        MAX_PAGES_PER_FETCH - pages_loaded, on_candidates, deadline,
+                                                        reserve_for_details=True)
+                    pages_loaded += loaded
+                if not self._queue:
+                    self.truncated = deadline is not None and deadline.expired and not self._pages_exhausted
+                    return
+
+                for index, result in self.client._iter_enriched(self._queue, self.min_rating, self.max_rating,
+                                                                 self.max_workers, count - accepted, report,
+                                                                 cancel_event, deadline, failed):
+                    accepted += 1
+                    self.results.append(result)
+                    yield index, result
+                progress['base'] += progress['done']
+                progress['done'] = 0
+        finally:
+            if failed:
+                self._queue = deque(sorted([*failed, *self._queue], key=lambda item: item[0]))
+                self.truncated = True
+
+    def fetch_more(self, count: int = MAX_SEARCH_RESULTS, on_progress=None,
+                   cancel_event: threading.Event | None = None, on_candidates=None) -> Iterator[MovieSummary]:
+        """Отдаёт до count следующих результатов по мере готовности (см. iter_positions)."""
+        for _, result in self.iter_positions(count, on_progress, cancel_event, on_candidates):
+            yield result
 
-    if not initial_results:
-        return []
+    def fetch_candidates(self, count: int = MAX_SEARCH_RESULTS,
+                         cancel_event: threading.Event | None = None) -> list[MovieSummary]:
+        """
+        До count следующих результатов без запроса деталей: из OMDb — только поля выдачи ?s=
+        (детали вызывающая сторона загружает сама, например лишь для видимых строк), из каталога — как есть
+        (строки без деталей тоже дополняет вызывающая сторона).
+        Фильтр по рейтингу требует деталей, поэтому здесь не применяется.
+        Страницы загружаются не дольше time_budget; если срок истёк раньше, чем набралось
+        count кандидатов, отдаётся то, что успело прийти, с пометкой truncated.
+        """
+        self.truncated = False
+        if self.source is None:
+            self._choose_source(count)
+        if cancel_event is not None and cancel_event.is_set():
+            return []
+        if self.source == 'catalog' and len(self._queue) < count:
+            self._load_catalog(count - len(self._queue))
+        deadline = Deadline(self.time_budget) if self.time_budget is not None else None
+        if self.source == 'omdb' and len(self._queue) < count and not self._pages_exhausted:
+            self._load_pages(count - len(self._queue), MAX_PAGES_PER_FETCH, deadline=deadline)
+        batch = [self._queue.popleft()[1] for _ in range(min(count, len(self._queue)))]
+        self.truncated = (len(batch) < count and deadline is not None and deadline.expired
+                          and not self._pages_exhausted)
+        self.results.extend(batch)
+        return batch
 
-    final_results = []
-    needs_rating_filter = not (min_rating <= 0.0 and max_rating >= 10.0)
 
-    for basic_result in initial_results:
-        if len(final_results) >= 15:
-            break
+class AsyncOmdbClient(_BaseOmdbClient):
+    """
+    Асинхронный клиент OMDb API поверх aiohttp.
+    Все запросы идут через один ClientSession с общим пулом соединений,
+    а число одновременных запросов ограничено семафором.
+    Экземпляр нужно использовать внутри одного event loop (async with AsyncOmdbClient() as client: ...).
+    """
+
+    def __init__(self, api_key: str | None = None, base_url: str = BASE_URL,
+                 max_concurrency: int = DETAIL_FETCH_WORKERS, **kwargs):
+        super().__init__(api_key, base_url, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: aiohttp.ClientSession | None = None
+        self.inflight = AsyncSingleFlight()
+        self._revalidation_tasks: set[asyncio.Task] = set()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
 
-        imdb_id = basic_result.get('imdbID')
-        if not imdb_id:
-            continue
+    async def close(self) -> None:
+        for task in list(self._revalidation_tasks):
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
-        detailed_data = get_movie_by_id(imdb_id)
-        if not detailed_data:
-            continue
+    async def __aenter__(self):
+        return self
 
-        rating_str = detailed_data.get('imdbRating', 'N/A')
-        rating = None
-        if rating_str != 'N/A':
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _revalidate(self, kind: str, key: str, cache_key: str, loader, *args) -> None:
+        if not self._start_revalidation(cache_key):
+            return
+        task = asyncio.get_running_loop().create_task(self._run_revalidation(kind, key, cache_key, loader, args))
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
+
+    async def _run_revalidation(self, kind: str, key: str, cache_key: str, loader, args: tuple) -> None:
+        try:
+            data = await self.inflight.do(cache_key, loader, *args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Не удалось обновить устаревшие данные OMDb ({key}): {e}", file=sys.stderr)
+            return
+        finally:
+            self._finish_revalidation(cache_key)
+        if data:
+            self._notify_update(kind, key, data)
+
+    async def _get(self, params: dict, timeout: float, deadline: Deadline | None = None) -> dict:
+        """GET-запрос к OMDb с повторами; возвращает разобранный JSON (deadline — как у OmdbClient._get)."""
+        session = self._get_session()
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.timeout(timeout)
+            delay = self._reserve_request()
+            if delay > 0:
+                if deadline is not None:
+                    deadline.check_wait(delay)
+                await asyncio.sleep(delay)
             try:
-                rating = float(rating_str)
-            except ValueError:
-                rating = None
-
-        if needs_rating_filter and (rating is None or not (min_rating <= rating <= max_rating)):
-            continue
-
-        full_result = {
-            **basic_result,
-            'imdbRating': rating_str,
-            'imdbRatingValue': rating,
-            'Plot': detailed_data.get('Plot'),
-            'Director': detailed_data.get('Director'),
-            'Actors': detailed_data.get('Actors'),
-            'Genre': detailed_data.get('Genre'),
-            'Runtime': detailed_data.get('Runtime'),
-            'Poster': detailed_data.get('Poster')
-        }
-
-        final_results.append(full_result)
-        time.sleep(0.05)
-
-    return final_results[:15]
+                async with self._semaphore:
+                    request_timeout = timeout if deadline is None else deadline.timeout(timeout)
+                    async with session.get(self.base_url, params=params,
+                                           timeout=aiohttp.ClientTimeout(total=request_timeout)) as response:
+                        self._record_health(response.status)
+                        if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                            response.raise_for_status()
+                            if self.fast_json:
+                                return decode_omdb(await response.read(), params)
+                            return await response.json(content_type=None)
+            except aiohttp.ClientConnectionError:
+                self._record_health(failed=True)
+                if attempt >= self.max_retries:
+                    raise
+            except asyncio.TimeoutError:
+                self._record_health(failed=True)
+                raise
+            backoff = self._backoff_delay(attempt)
+            if deadline is not None:
+                deadline.check_wait(backoff)
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+    async def get_movie_by_id(self, imdb_id, deadline: Deadline | None = None):
+        api_key = self.api_key
+        if not api_key: print("API ключ OMDb не настроен.", file=sys.stderr); return None
+        params = {'apikey': api_key, 'i': imdb_id, 'plot': 'short'}
+        cache_key = _cache_key(params)
+        cached = self._cached_details(imdb_id, cache_key, params)
+        if cached is not MISSING:
+            return cached
+        try:
+            return await self.inflight.do(cache_key, self._load_details, imdb_id, cache_key, params, deadline)
+        except (QuotaExceededError, CircuitOpenError) as e:
+            print(f"{e} ({imdb_id})", file=sys.stderr)
+            return None
+        except DeadlineExceeded:
+            return None
+        except asyncio.TimeoutError:
+            print(f"Таймаут при получении деталей для {imdb_id}", file=sys.stderr)
+            return None
+        except aiohttp.ClientError as e:
+            print(f"Ошибка сети при получении деталей {imdb_id}: {e}", file=sys.stderr)
+            return None
+        except Exception as e:
+            print(f"Неожиданная ошибка при получении деталей {imdb_id}: {e}", file=sys.stderr)
+            return None
+
+    async def search_movie_by_title(
+            self,
+            title: str,
+            year: str | None = None,
+            type_filter: str | None = None,
+            min_rating: float = 0.0,
+            max_rating: float = 10.0,
+            timeout: float | None = None
+    ) -> SearchResults | None:
+        """Асинхронный аналог OmdbClient.search_movie_by_title с тем же форматом результатов."""
+        api_key = self.api_key
+        if not api_key:
+            print("API ключ OMDb не настроен.", file=sys.stderr)
+            return None
+        if not title:
+            return SearchResults()
+        deadline = Deadline(timeout) if timeout is not None else None
+        results = SearchResults()
+
+        initial_results = []
+        max_initial_results = 20
+
+        try:
+            data = await self._fetch_search_page(_search_params(api_key, title, 1, year, type_filter), deadline)
+        except Exception as e:
+            print(f"Ошибка при поиске (страница 1): {e}", file=sys.stderr)
+            return None
+        if data.get("Response") == "True":
+            initial_results.extend(data.get("Search", []))
+            # Остальные нужные страницы известны по totalResults и запрашиваются одновременно.
+            last_page = min(-(-_parse_total_results(data) // OMDB_PAGE_SIZE),
+                            -(-max_initial_results // OMDB_PAGE_SIZE))
+            pages = range(2, last_page + 1)
+            responses = await asyncio.gather(
+                *(self._fetch_search_page(_search_params(api_key, title, page, year, type_filter), deadline)
+                  for page in pages),
+                return_exceptions=True
+            )
+            for page, response in zip(pages, responses):
+                if isinstance(response, Exception):
+                    print(f"Ошибка при поиске (страница {page}): {response}", file=sys.stderr)
+                    results.truncated = deadline is not None and deadline.expired
+                    break
+                if response.get("Response") == "True":
+                    initial_results.extend(response.get("Search", []))
 
+        candidates = []
+        seen_ids = set()
+        for basic_result in initial_results:
+            imdb_id = basic_result.get('imdbID')
+            # Выдача OMDb между страницами может сдвигаться, поэтому фильм встречается дважды.
+            if not imdb_id or imdb_id in seen_ids:
+                continue
+            seen_ids.add(imdb_id)
+            if not self._rating_excluded(imdb_id, min_rating, max_rating):
+                candidates.append(MovieSummary.from_omdb(basic_result))
+        position = 0
+
+        while position < len(candidates) and len(results) < MAX_SEARCH_RESULTS:
+            if deadline is not None and deadline.expired:
+                results.truncated = True
+                break
+            batch = candidates[position:position + MAX_SEARCH_RESULTS - len(results)]
+            position += len(batch)
+
+            details = await asyncio.gather(*(self.get_movie_by_id(candidate.imdb_id, deadline)
+                                             for candidate in batch))
+            for summary, detailed_data in zip(batch, details):
+                full_result = _enrich_result(summary, detailed_data, min_rating, max_rating)
+                if full_result is not None:
+                    results.append(full_result)
+            if deadline is not None and deadline.expired and None in details:
+                results.truncated = True
+
+        del results[MAX_SEARCH_RESULTS:]
+        return results
+
+    async def _fetch_search_page(self, params: dict, deadline: Deadline | None = None) -> dict:
+        cache_key = _cache_key(params)
+        cached = self._cached_search_page(cache_key, params)
+        if cached is not None:
+            return cached
+        return await self.inflight.do(cache_key, self._load_search_page, cache_key, params, deadline)
+
+    async def _load_details(self, imdb_id: str, cache_key: str, params: dict,
+                            deadline: Deadline | None = None) -> dict | None:
+        return self._store_details(imdb_id, cache_key, await self._get(params, DETAIL_TIMEOUT, deadline))
+
+    async def _refresh_details(self, imdb_id: str, cache_key: str, params: dict) -> dict | None:
+        data = await self._get(params, DETAIL_TIMEOUT)
+        return self._store_details(imdb_id, cache_key, data) if data.get("Response") == "True" else None
+
+    async def _load_search_page(self, cache_key: str, params: dict, deadline: Deadline | None = None) -> dict:
+        data = await self._get(params, SEARCH_TIMEOUT, deadline)
+        self._store_search_page(cache_key, data)
+        return data
+
+
+def create_default_client() -> OmdbClient:
+    """
+    Клиент с кэшами, ограничителем частоты, дневной квотой, индексом рейтингов, каталогом,
+    адаптивным пределом параллельных запросов и предохранителем из Settings.
+    """
+    response_cache = DiskCache(
+        settings.OMDB_CACHE_PATH or default_cache_dir() / "omdb_cache.sqlite3",
+        max_entries=settings.OMDB_CACHE_MAX_ENTRIES
+    ) if settings.OMDB_CACHE_ENABLED else None
+    detail_cache = MemoryCache(
+        max_entries=settings.OMDB_MEMORY_CACHE_SIZE,
+        ttl=settings.OMDB_MEMORY_CACHE_TTL,
+        negative_ttl=settings.OMDB_MEMORY_CACHE_NEGATIVE_TTL
+    )
+    rate_limiter = TokenBucket(rate=settings.OMDB_RATE_LIMIT, burst=settings.OMDB_RATE_BURST)
+    quota = DailyQuota(
+        settings.OMDB_QUOTA_PATH or default_cache_dir() / "omdb_quota.json",
+        limit=settings.OMDB_DAILY_QUOTA,
+        reserve=settings.OMDB_QUOTA_RESERVE
+    ) if settings.OMDB_DAILY_QUOTA > 0 else None
+    ratings_index = RatingsIndex(
+        settings.OMDB_RATINGS_INDEX_PATH or default_cache_dir() / "omdb_ratings.sqlite3",
+        unrated_ttl=settings.OMDB_RATINGS_UNRATED_TTL
+    ) if settings.OMDB_RATINGS_INDEX_ENABLED else None
+    catalog = MovieCatalog(min_results=settings.MOVIE_CATALOG_MIN_RESULTS) if settings.MOVIE_CATALOG_ENABLED else None
+    hedge = HedgePolicy(
+        percentile=settings.OMDB_HEDGE_PERCENTILE,
+        budget=settings.OMDB_HEDGE_BUDGET
+    ) if settings.OMDB_HEDGE_ENABLED else None
+    concurrency = AdaptiveConcurrencyLimit(
+        initial=settings.OMDB_CONCURRENCY_INITIAL,
+        min_limit=settings.OMDB_CONCURRENCY_MIN,
+        max_limit=settings.OMDB_CONCURRENCY_MAX
+    ) if settings.OMDB_ADAPTIVE_CONCURRENCY else None
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=settings.OMDB_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.OMDB_CIRCUIT_RESET_TIMEOUT
+    ) if settings.OMDB_CIRCUIT_BREAKER_ENABLED else None
+    return OmdbClient(response_cache=response_cache, detail_cache=detail_cache, rate_limiter=rate_limiter,
+                      quota=quota, ratings_index=ratings_index, catalog=catalog, hedge=hedge,
+                      concurrency=concurrency, fast_json=settings.OMDB_FAST_JSON,
+                      circuit_breaker=circuit_breaker)
+
+
+default_client = create_default_client()
+
+
+def get_movie_by_id(imdb_id):
+    return default_client.get_movie_by_id(imdb_id)
+
+
+def get_full_details(imdb_id: str) -> MovieFullDetails | None:
+    return default_client.get_full_details(imdb_id)
+
+
+def search_movie_by_title(
+        title: str,
+        year: str | None = None,
+        type_filter: str | None = None,
+        min_rating: float = 0.0,
+        max_rating: float = 10.0,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        timeout: float | None = None
+) -> SearchResults | None:
+    return default_client.search_movie_by_title(title, year, type_filter, min_rating, max_rating, max_workers,
+                                                timeout)
+
+
+def search_many(
+        queries,
+        min_rating: float = 0.0,
+        max_rating: float = 10.0,
+        max_queries: int = BATCH_SEARCH_QUERIES,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None
+) -> Iterator[tuple[int, SearchResults | None]]:
+    return default_client.search_many(queries, min_rating, max_rating, max_queries, max_workers,
+                                      cancel_event, timeout)
+
+
+def add_update_listener(listener) -> None:
+    default_client.add_update_listener(listener)
+
+
+def remove_update_listener(listener) -> None:
+    default_client.remove_update_listener(listener)
+
+
+def add_circuit_listener(listener) -> None:
+    """Подписывает listener(state) на смену состояния предохранителя OMDb (если он включён)."""
+    if default_client.circuit_breaker is not None:
+        default_client.circuit_breaker.add_listener(listener)
+
+
+def remove_circuit_listener(listener) -> None:
+    if default_client.circuit_breaker is not None:
+        default_client.circuit_breaker.remove_listener(listener)
+
+
+def probe_omdb() -> bool:
+    return default_client.probe()
+
+
+def circuit_state() -> tuple[str, float]:
+    """Состояние предохранителя OMDb и через сколько секунд будет пробный запрос ('closed', если он выключен)."""
+    breaker = default_client.circuit_breaker
+    if breaker is None:
+        return CIRCUIT_CLOSED, 0.0
+    return breaker.state, breaker.retry_after()
+
+
+def create_search_cursor(
+        title: str,
+        year: str | None = None,
+        type_filter: str | None = None,
+        min_rating: float = 0.0,
+        max_rating: float = 10.0,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        time_budget: float | None = settings.OMDB_SEARCH_DEADLINE
+) -> SearchCursor:
+    return SearchCursor(default_client, title, year, type_filter, min_rating, max_rating, max_workers, time_budget)
+
+
+def iter_search(
+        title: str,
+        year: str | None = None,
+        type_filter: str | None = None,
+        min_rating: float = 0.0,
+        max_rating: float = 10.0,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        on_progress=None,
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None
+) -> Iterator[MovieSummary]:
+    return default_client.iter_search(title, year, type_filter, min_rating, max_rating, max_workers,
+                                      on_progress, cancel_event, timeout)
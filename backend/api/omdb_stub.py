@@ -0,0 +1,332 @@
+import asyncio
+import json
+import math
+import random
+import sys
+import threading
+import zlib
+from pathlib import Path
+from aiohttp import web
+from backend.api.rate_limiter import TokenBucket
+from backend.config.config import OMDB_PUBLIC_URL
+
+FIXTURES_DIR = Path(__file__).with_name("omdb_fixtures")
+PAGE_SIZE = 10
+MAX_SYNTHETIC_RESULTS = 1000
+
+
+class LatencyModel:
+    """
+    Распределение задержки ответа заглушки в секундах, задаётся строкой:
+    'fixed:0.05', 'uniform:0.02,0.2', 'lognormal:0.08,0.6' (медиана, sigma)
+    или 'pareto:0.05,2.5' (минимум, alpha — тяжёлый хвост). '0' или '' — без задержки.
+    """
+
+    KINDS = ('fixed', 'uniform', 'lognormal', 'pareto')
+
+    def __init__(self, spec: str = ''):
+        self.spec = spec or '0'
+        kind, _, raw_args = self.spec.partition(':')
+        if kind in ('', '0'):
+            self.kind, self.args = 'fixed', (0.0,)
+            return
+        if kind not in self.KINDS:
+            raise ValueError(f"Неизвестное распределение задержки: {kind}")
+        try:
+            self.args = tuple(float(arg) for arg in raw_args.split(','))
+        except ValueError as e:
+            raise ValueError(f"Некорректные параметры задержки: {self.spec}") from e
+        expected = 1 if kind == 'fixed' else 2
+        if len(self.args) != expected:
+            raise ValueError(f"Распределение {kind} ожидает {expected} параметр(а): {self.spec}")
+        self.kind = kind
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'fixed':
+            return self.args[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.args)
+        if self.kind == 'lognormal':
+            median, sigma = self.args
+            return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        scale, alpha = self.args
+        return scale * rng.paretovariate(alpha)
+
+
+def _load_fixture(directory: Path, name: str) -> dict:
+    path = directory / name
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _normalize_query(title: str) -> str:
+    return ' '.join(title.lower().split())
+
+
+class OmdbStub:
+    """
+    Совместимая с OMDb заглушка: отвечает на ?s= и ?i= записанными фикстурами
+    (omdb_fixtures/search.json, details.json, plots_full.json) и умеет имитировать
+    задержки, ошибки сервера и ограничение частоты запросов.
+    """
+
+    def __init__(
+            self,
+            fixtures_dir: str | Path = FIXTURES_DIR,
+            latency: LatencyModel | str = '',
+            error_rate: float = 0.0,
+            error_status: int = 503,
+            rate_limit: float | None = None,
+            daily_limit: int | None = None,
+            synthetic_results: int = 0,
+            seed: int | None = None
+    ):
+        fixtures_dir = Path(fixtures_dir)
+        self.search_fixtures: dict[str, list[dict]] = _load_fixture(fixtures_dir, "search.json")
+        self.details_fixtures: dict[str, dict] = _load_fixture(fixtures_dir, "details.json")
+        self.full_plots: dict[str, str] = _load_fixture(fixtures_dir, "plots_full.json")
+        self.latency = latency if isinstance(latency, LatencyModel) else LatencyModel(latency)
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limiter = TokenBucket(rate_limit, max(1, math.ceil(rate_limit))) if rate_limit else None
+        self.daily_limit = daily_limit
+        self.synthetic_results = min(synthetic_results, MAX_SYNTHETIC_RESULTS)
+        self._rng = random.Random(seed)
+        self._synthetic_titles: dict[str, str] = {}
+        self._synthetic_searches: dict[str, list[dict]] = {}
+        self.stats = {'requests': 0, 'search': 0, 'details': 0, 'errors': 0, 'throttled': 0}
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/', self.handle)
+        app.router.add_get('/__stats', self.handle_stats)
+        return app
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.stats['requests'] += 1
+        query = request.query
+        if not query.get('apikey'):
+            return web.json_response({"Response": "False", "Error": "No API key provided."}, status=401)
+        if self.daily_limit is not None and self.stats['requests'] > self.daily_limit:
+            self.stats['throttled'] += 1
+            return web.json_response({"Response": "False", "Error": "Request limit reached!"}, status=401)
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            self.stats['throttled'] += 1
+            return web.json_response({"Response": "False", "Error": "Too many requests."}, status=429)
+
+        delay = self.latency.sample(self._rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats['errors'] += 1
+            return web.Response(status=self.error_status, text="Injected error")
+
+        if 'i' in query:
+            self.stats['details'] += 1
+            return web.json_response(self.details(query['i'], query.get('plot', 'short')))
+        if 's' in query:
+            self.stats['search'] += 1
+            return web.json_response(self.search(query['s'], query.get('page', '1'), query.get('y'), query.get('type')))
+        return web.json_response({"Response": "False", "Error": "Something went wrong."})
+
+    def search(self, title: str, page: str = '1', year: str | None = None, type_filter: str | None = None) -> dict:
+        """Ответ ?s= для страницы выдачи, собранной из фикстур (или синтетической выдачи)."""
+        items = self._search_items(_normalize_query(title))
+        if year:
+            items = [item for item in items if item.get('Year', '').startswith(year)]
+        if type_filter:
+            items = [item for item in items if item.get('Type') == type_filter]
+        try:
+            page_number = int(page)
+        except ValueError:
+            page_number = 0
+        start = (page_number - 1) * PAGE_SIZE
+        if not items or page_number < 1 or start >= len(items):
+            return {"Response": "False", "Error": "Movie not found!"}
+        return {"Search": items[start:start + PAGE_SIZE], "totalResults": str(len(items)), "Response": "True"}
+
+    def _search_items(self, query: str) -> list[dict]:
+        if not query:
+            return []
+        if query in self.search_fixtures:
+            return self.search_fixtures[query]
+        seen, items = set(), []
+        for fixture_items in self.search_fixtures.values():
+            for item in fixture_items:
+                if query in item.get('Title', '').lower() and item['imdbID'] not in seen:
+                    seen.add(item['imdbID'])
+                    items.append(item)
+        if items or not self.synthetic_results:
+            return items
+        return self._synthetic_search(query)
+
+    def _synthetic_search(self, query: str) -> list[dict]:
+        if query in self._synthetic_searches:
+            return self._synthetic_searches[query]
+        prefix = zlib.crc32(query.encode('utf-8')) % 10 ** 6
+        items = []
+        for index in range(self.synthetic_results):
+            imdb_id = f"tt9{prefix:06d}{index:03d}"
+            title = f"{query.title()} {index + 1}"
+            self._synthetic_titles[imdb_id] = title
+            items.append({"Title": title, "Year": str(1950 + index % 75), "imdbID": imdb_id,
+                          "Type": "movie", "Poster": "N/A"})
+        self._synthetic_searches[query] = items
+        return items
+
+    def details(self, imdb_id: str, plot: str = 'short') -> dict:
+        """Ответ ?i=: запись из фикстур, синтетический фильм или ошибка OMDb."""
+        data = self.details_fixtures.get(imdb_id)
+        if data is None and imdb_id in self._synthetic_titles:
+            checksum = zlib.crc32(imdb_id.encode('utf-8'))
+            data = {"Title": self._synthetic_titles[imdb_id], "Year": "2000", "Runtime": f"{80 + checksum % 80} min",
+                    "Genre": "Drama", "Director": "N/A", "Actors": "N/A", "Plot": "Synthetic plot.",
+                    "Poster": "N/A", "imdbRating": f"{1 + checksum % 90 / 10:.1f}", "imdbID": imdb_id,
+                    "Type": "movie", "Response": "True"}
+        if data is None:
+            return {"Response": "False", "Error": "Incorrect IMDb ID."}
+        if plot == 'full' and imdb_id in self.full_plots:
+            return {**data, "Plot": self.full_plots[imdb_id]}
+        return data
+
+
+class StubServer:
+    """
+    Запускает OmdbStub в отдельном потоке со своим event loop — для тестов и бенчмарков
+    синхронного клиента: with StubServer(OmdbStub(latency='uniform:0.01,0.05')) as server: ... server.url
+    """
+
+    def __init__(self, stub: OmdbStub | None = None, host: str = '127.0.0.1', port: int = 0):
+        self.stub = stub or OmdbStub()
+        self.host = host
+        self.port = port
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._startup_error: BaseException | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> 'StubServer':
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="omdb-stub", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self._startup_error is not None:
+            self._thread.join()
+            raise self._startup_error
+        return self
+
+    def _run(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        runner = web.AppRunner(self.stub.create_app())
+        try:
+            self._loop.run_until_complete(runner.setup())
+            self._loop.run_until_complete(web.TCPSite(runner, self.host, self.port).start())
+            self.port = runner.addresses[0][1]
+        except BaseException as e:
+            self._startup_error = e
+            ready.set()
+            self._loop.close()
+            return
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(runner.cleanup())
+            self._loop.close()
+
+    def stop(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def record_fixtures(queries: list[str], fixtures_dir: str | Path = FIXTURES_DIR, pages: int = 2,
+                    base_url: str = OMDB_PUBLIC_URL) -> int:
+    """
+    Записывает ответы настоящего OMDb (ключ из settings.OMDB_API_KEY) для запросов
+    в фикстуры заглушки; возвращает число записанных фильмов.
+    Ответы ?i= записываются целиком, в обход кэша клиента, который хранит лишь поля выдачи поиска.
+    """
+    import requests
+    from backend.api.omdb_client import DETAIL_TIMEOUT, OmdbClient, _search_params
+
+    fixtures_dir = Path(fixtures_dir)
+    search_fixtures = _load_fixture(fixtures_dir, "search.json")
+    details_fixtures = _load_fixture(fixtures_dir, "details.json")
+    full_plots = _load_fixture(fixtures_dir, "plots_full.json")
+    recorded = 0
+    with OmdbClient(base_url=base_url) as client:
+        for query in queries:
+            items = []
+            for page in range(1, pages + 1):
+                data = client._fetch_search_page(_search_params(client.api_key, query, page, None, None))
+                if data.get("Response") != "True":
+                    break
+                items.extend(data.get("Search", []))
+                if len(items) >= int(data.get("totalResults", 0)):
+                    break
+            search_fixtures[_normalize_query(query)] = items
+            for item in items:
+                imdb_id = item['imdbID']
+                try:
+                    details = client._get({'apikey': client.api_key, 'i': imdb_id, 'plot': 'short'}, DETAIL_TIMEOUT)
+                    full = client._get({'apikey': client.api_key, 'i': imdb_id, 'plot': 'full'}, DETAIL_TIMEOUT)
+                except requests.exceptions.RequestException as e:
+                    print(f"Не удалось записать детали {imdb_id}: {e}", file=sys.stderr)
+                    continue
+                if details.get("Response") != "True":
+                    continue
+                details_fixtures[imdb_id] = details
+                if full.get("Plot") and full["Plot"] != details.get("Plot"):
+                    full_plots[imdb_id] = full["Plot"]
+                recorded += 1
+
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    for name, data in (("search.json", search_fixtures), ("details.json", details_fixtures),
+                       ("plots_full.json", full_plots)):
+        (fixtures_dir / name).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+    return recorded
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Локальная заглушка OMDb API на записанных фикстурах.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help="запустить заглушку")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--fixtures', default=str(FIXTURES_DIR))
+    serve_parser.add_argument('--latency', default='', help="например uniform:0.02,0.2 или lognormal:0.08,0.6")
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help="доля ответов с ошибкой сервера")
+    serve_parser.add_argument('--error-status', type=int, default=503)
+    serve_parser.add_argument('--rate-limit', type=float, default=None, help="запросов в секунду, сверх — 429")
+    serve_parser.add_argument('--daily-limit', type=int, default=None, help="после N запросов — 'Request limit reached!'")
+    serve_parser.add_argument('--synthetic', type=int, default=0, help="размер синтетической выдачи для запросов без фикстур")
+    serve_parser.add_argument('--seed', type=int, default=None)
+    record_parser = subparsers.add_parser('record', help="записать ответы настоящего OMDb в фикстуры")
+    record_parser.add_argument('queries', nargs='+')
+    record_parser.add_argument('--fixtures', default=str(FIXTURES_DIR))
+    record_parser.add_argument('--pages', type=int, default=2)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        print(f"Записано фильмов: {record_fixtures(args.queries, args.fixtures, args.pages)}")
+    else:
+        stub = OmdbStub(args.fixtures, args.latency, args.error_rate, args.error_status,
+                        args.rate_limit, args.daily_limit, args.synthetic, args.seed)
+        print(f"Заглушка OMDb: http://{args.host}:{args.port}/ (OMDB_BASE_URL)", file=sys.stderr)
+        web.run_app(stub.create_app(), host=args.host, port=args.port, print=None)
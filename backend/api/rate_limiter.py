@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class QuotaExceededError(Exception):
+    """Дневной лимит запросов к OMDb (за вычетом резерва) исчерпан."""
+
+
+class TokenBucket:
+    """
+    Потокобезопасный ограничитель частоты по алгоритму token bucket:
+    rate токенов в секунду, не более burst токенов в запасе.
+    """
+
+    def __init__(self, rate: float, burst: int, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self) -> bool:
+        """Забирает токен, если он есть прямо сейчас."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def reserve(self) -> float:
+        """
+        Резервирует токен и возвращает, сколько секунд нужно подождать до его появления.
+        Запас может уйти в минус — так очередь ожидающих обслуживается по порядку.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Блокирует поток до получения токена."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class DailyQuota:
+    """
+    Счётчик запросов к OMDb за текущие сутки (UTC), сохраняемый на диск.
+    Последние reserve запросов из limit не расходуются: после этого клиент работает только из кэша.
+    """
+
+    def __init__(self, path: str | Path, limit: int = 1000, reserve: int = 50, today=None):
+        self.path = Path(path)
+        self.limit = limit
+        self.reserve = reserve
+        self._today = today or (lambda: datetime.now(timezone.utc).date().isoformat())
+        self._lock = threading.Lock()
+        self._day, self._used = self._load()
+
+    def _load(self) -> tuple[str, int]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            return str(data['day']), int(data['used'])
+        except FileNotFoundError:
+            return self._today(), 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Не удалось прочитать счётчик квоты OMDb ({self.path}): {e}", file=sys.stderr)
+            return self._today(), 0
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            temp_path.write_text(json.dumps({'day': self._day, 'used': self._used}), encoding='utf-8')
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Не удалось сохранить счётчик квоты OMDb ({self.path}): {e}", file=sys.stderr)
+
+    def _roll_over(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day, self._used = today, 0
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._roll_over()
+            return self._used
+
+    @property
+    def remaining(self) -> int:
+        """Сколько запросов ещё можно сделать сегодня до резерва."""
+        with self._lock:
+            self._roll_over()
+            return max(0, self.limit - self.reserve - self._used)
+
+    def consume(self) -> None:
+        """Учитывает один запрос; бросает QuotaExceededError, если квота исчерпана."""
+        with self._lock:
+            self._roll_over()
+            if self._used >= self.limit - self.reserve:
+                raise QuotaExceededError(
+                    f"Дневной лимит запросов OMDb почти исчерпан ({self._used}/{self.limit}), "
+                    f"используются только данные из кэша."
+                )
+            self._used += 1
+            self._save()
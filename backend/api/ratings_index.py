@@ -0,0 +1,161 @@
+import csv
+import gzip
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from backend.api.cache import MISSING
+from backend.api.movie_records import parse_rating
+
+LOAD_BATCH_SIZE = 10_000
+UNRATED_TTL = 7 * 24 * 60 * 60
+
+
+class RatingsIndex:
+    """
+    Локальный индекс рейтингов IMDb по imdbID в SQLite.
+    Пополняется каждым ответом ?i= и может быть загружен целиком из дампа
+    title.ratings.tsv(.gz); позволяет отсеять кандидатов поиска по рейтингу
+    до запроса деталей. Отсутствие рейтинга ('N/A') тоже запоминается (NULL), но только
+    на unrated_ttl секунд: у новых фильмов рейтинг появляется позже.
+    """
+
+    def __init__(self, path: str | Path, unrated_ttl: float = UNRATED_TTL, clock=time.time):
+        self.path = Path(path)
+        self.unrated_ttl = unrated_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ratings ("
+                " imdb_id TEXT PRIMARY KEY,"
+                " rating REAL,"
+                " updated_at REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, imdb_id: str):
+        """
+        Рейтинг фильма, None, если у фильма нет рейтинга, или MISSING, если фильм не известен индексу
+        либо отметка об отсутствии рейтинга старше unrated_ttl.
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT rating, updated_at FROM ratings WHERE imdb_id = ?", (imdb_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Ошибка чтения индекса рейтингов ({imdb_id}): {e}", file=sys.stderr)
+            return MISSING
+        if row is None:
+            return MISSING
+        rating, updated_at = row
+        if rating is None and self._clock() - updated_at >= self.unrated_ttl:
+            return MISSING
+        return rating
+
+    def set(self, imdb_id: str, rating: float | None) -> None:
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO ratings (imdb_id, rating, updated_at) VALUES (?, ?, ?)",
+                    (imdb_id, rating, self._clock())
+                )
+                connection.commit()
+        except sqlite3.Error as e:
+            print(f"Ошибка записи в индекс рейтингов ({imdb_id}): {e}", file=sys.stderr)
+
+    def record(self, details: dict) -> None:
+        """Запоминает рейтинг из ответа OMDb ?i=."""
+        imdb_id = details.get('imdbID')
+        if imdb_id:
+            self.set(imdb_id, parse_rating(details.get('imdbRating')))
+
+    def excludes(self, imdb_id: str, min_rating: float, max_rating: float) -> bool:
+        """
+        True, если по данным индекса фильм заведомо не пройдёт фильтр по рейтингу.
+        Без активного фильтра и для неизвестных индексу фильмов всегда False.
+        """
+        if min_rating <= 0.0 and max_rating >= 10.0:
+            return False
+        rating = self.get(imdb_id)
+        if rating is MISSING:
+            return False
+        return rating is None or not (min_rating <= rating <= max_rating)
+
+    def load_dump(self, path: str | Path) -> int:
+        """
+        Загружает дамп рейтингов IMDb (TSV с колонками tconst, averageRating, numVotes,
+        допускается .gz) и возвращает число загруженных записей.
+        """
+        path = Path(path)
+        opener = gzip.open if path.suffix == '.gz' else open
+        loaded = 0
+        now = self._clock()
+        with opener(path, 'rt', encoding='utf-8', newline='') as dump:
+            reader = csv.DictReader(dump, delimiter='\t')
+            batch = []
+            for row in reader:
+                rating = parse_rating(row.get('averageRating'))
+                if not row.get('tconst') or rating is None:
+                    continue
+                batch.append((row['tconst'], rating, now))
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    loaded += self._insert_many(batch)
+                    batch = []
+            if batch:
+                loaded += self._insert_many(batch)
+        return loaded
+
+    def _insert_many(self, rows: list[tuple[str, float, float]]) -> int:
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                "INSERT OR REPLACE INTO ratings (imdb_id, rating, updated_at) VALUES (?, ?, ?)", rows
+            )
+            connection.commit()
+        return len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, unrated = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(rating IS NULL), 0) FROM ratings"
+            ).fetchone()
+        return {'path': str(self.path), 'entries': entries, 'unrated': unrated}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+if __name__ == '__main__':
+    import argparse
+    from backend.api.omdb_client import default_client
+
+    ratings_index = default_client.ratings_index
+
+    parser = argparse.ArgumentParser(description="Локальный индекс рейтингов IMDb для фильтра поиска.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats')
+    load_parser = subparsers.add_parser('load', help="загрузить дамп title.ratings.tsv(.gz)")
+    load_parser.add_argument('dump')
+    args = parser.parse_args()
+
+    if ratings_index is None:
+        print("Индекс рейтингов отключён (OMDB_RATINGS_INDEX_ENABLED=false).")
+    elif args.command == 'stats':
+        for name, value in ratings_index.stats().items():
+            print(f"{name}: {value}")
+    else:
+        print(f"Загружено рейтингов: {ratings_index.load_dump(args.dump)}")
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Объединяет одновременные вызовы с одинаковым ключом: функция выполняется один раз,
+    остальные потоки ждут и получают тот же результат (или то же исключение).
+    Если ожидавший получил исключение, для которого retry_on(error) истинно, он выполняет
+    вызов заново (сам или присоединившись к более новому вызову) — например, когда общий
+    запрос оборвался по сроку другого потока.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.executed = 0
+        self.deduplicated = 0
+
+    def do(self, key: str, function, *args, retry_on=None):
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.deduplicated += 1
+                    leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.executed += 1
+                    leader = True
+
+            if leader:
+                break
+            call.event.wait()
+            if call.error is None:
+                return call.result
+            if retry_on is None or not retry_on(call.error):
+                raise call.error
+
+        try:
+            call.result = function(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'executed': self.executed, 'deduplicated': self.deduplicated, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Асинхронный аналог SingleFlight для одного event loop: ожидающие разделяют одну задачу."""
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+        self.executed = 0
+        self.deduplicated = 0
+
+    async def do(self, key: str, coroutine_function, *args):
+        task = self._tasks.get(key)
+        if task is not None:
+            self.deduplicated += 1
+        else:
+            task = asyncio.ensure_future(coroutine_function(*args))
+            self._tasks[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda done_task: self._forget(key, done_task))
+        # shield: отмена одного из ожидающих не должна отменять общий запрос для остальных.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def stats(self) -> dict:
+        return {'executed': self.executed, 'deduplicated': self.deduplicated, 'in_flight': len(self._tasks)}
@@ -1,15 +1,52 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+OMDB_PUBLIC_URL = "https://www.omdbapi.com/"
+
 
 class Settings(BaseSettings):
     OMDB_API_KEY: str = Field()
+    OMDB_BASE_URL: str = Field(default=OMDB_PUBLIC_URL)
     DB_NAME: str = Field()
     DB_USER: str = Field()
     DB_PASSWORD: str = Field()
     DB_HOST: str = Field()
     DB_PORT: str = Field()
 
+    OMDB_CACHE_ENABLED: bool = Field(default=True)
+    OMDB_CACHE_PATH: str | None = Field(default=None)
+    OMDB_CACHE_MAX_ENTRIES: int = Field(default=5000)
+    OMDB_CACHE_DETAIL_TTL: int = Field(default=7 * 24 * 60 * 60)
+    OMDB_CACHE_SEARCH_TTL: int = Field(default=24 * 60 * 60)
+    OMDB_CACHE_STALE_WHILE_REVALIDATE: bool = Field(default=True)
+    OMDB_CACHE_DETAIL_HARD_TTL: int = Field(default=90 * 24 * 60 * 60)
+    OMDB_CACHE_SEARCH_HARD_TTL: int = Field(default=7 * 24 * 60 * 60)
+    OMDB_MEMORY_CACHE_SIZE: int = Field(default=1000)
+    OMDB_MEMORY_CACHE_TTL: int = Field(default=10 * 60)
+    OMDB_MEMORY_CACHE_NEGATIVE_TTL: int = Field(default=60)
+    OMDB_RATE_LIMIT: float = Field(default=10.0)
+    OMDB_RATE_BURST: int = Field(default=15)
+    OMDB_DAILY_QUOTA: int = Field(default=1000)
+    OMDB_QUOTA_RESERVE: int = Field(default=50)
+    OMDB_QUOTA_PATH: str | None = Field(default=None)
+    OMDB_RATINGS_INDEX_ENABLED: bool = Field(default=True)
+    OMDB_RATINGS_INDEX_PATH: str | None = Field(default=None)
+    OMDB_RATINGS_UNRATED_TTL: int = Field(default=7 * 24 * 60 * 60)
+    MOVIE_CATALOG_ENABLED: bool = Field(default=True)
+    MOVIE_CATALOG_MIN_RESULTS: int = Field(default=1)
+    OMDB_FAST_JSON: bool = Field(default=True)
+    OMDB_SEARCH_DEADLINE: float = Field(default=20.0)
+    OMDB_HEDGE_ENABLED: bool = Field(default=False)
+    OMDB_HEDGE_PERCENTILE: float = Field(default=0.95)
+    OMDB_HEDGE_BUDGET: float = Field(default=0.05)
+    OMDB_ADAPTIVE_CONCURRENCY: bool = Field(default=True)
+    OMDB_CONCURRENCY_INITIAL: int = Field(default=4)
+    OMDB_CONCURRENCY_MIN: int = Field(default=1)
+    OMDB_CONCURRENCY_MAX: int = Field(default=15)
+    OMDB_CIRCUIT_BREAKER_ENABLED: bool = Field(default=True)
+    OMDB_CIRCUIT_FAILURE_THRESHOLD: int = Field(default=5)
+    OMDB_CIRCUIT_RESET_TIMEOUT: float = Field(default=30.0)
+
     model_config = SettingsConfigDict(env_file="backend/config/config.env")
 
 
@@ -0,0 +1,240 @@
+import csv
+import gzip
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from sqlalchemy import select, func, exc
+from backend.api.movie_records import MovieSummary, parse_rating, parse_votes
+from backend.database.database import engine, get_session
+from backend.models.movie import Movie
+
+CATALOG_COLUMNS = ('imdb_id', 'title', 'year', 'type_', 'imdb_rating', 'imdb_votes', 'runtime',
+                   'genre', 'director', 'actors', 'plot', 'poster_url', 'source')
+IMDB_TITLE_TYPES = {
+    'movie': 'movie', 'tvMovie': 'movie', 'short': 'movie', 'video': 'movie',
+    'tvSeries': 'series', 'tvMiniSeries': 'series',
+    'tvEpisode': 'episode'
+}
+SEARCH_TYPES = ('movie', 'series', 'episode')
+IMDB_NULL = '\\N'
+
+
+def _copy_value(value) -> str:
+    """Значение в текстовом формате COPY: NULL как \\N, служебные символы экранируются."""
+    if value is None:
+        return IMDB_NULL
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class _CopyStream:
+    """Файлоподобный поток для cursor.copy_expert: строки COPY формируются лениво, по мере чтения."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._lines = ('\t'.join(_copy_value(value) for value in row) + '\n' for row in rows)
+        self._buffer = ''
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        buffered = len(self._buffer)
+        while size < 0 or buffered < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            buffered += len(line)
+        data = ''.join(chunks)
+        if size < 0:
+            self._buffer = ''
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+@contextmanager
+def _open_tsv(path: str | Path):
+    """Открывает TSV-дамп IMDb (в том числе .gz) в текстовом режиме."""
+    path = Path(path)
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as dump:
+        yield dump
+
+
+def _optional(value: str | None) -> str | None:
+    return None if value in (None, '', IMDB_NULL, 'N/A') else value
+
+
+def _imdb_year(row: dict, type_: str) -> str | None:
+    start, end = _optional(row.get('startYear')), _optional(row.get('endYear'))
+    if type_ != 'series' or start is None:
+        return start
+    return f"{start}–{end or ''}"
+
+
+def iter_imdb_basics_rows(dump: Iterable[str]) -> Iterator[tuple]:
+    """Строки каталога из дампа title.basics.tsv; взрослый контент и прочие типы пропускаются."""
+    for row in csv.DictReader(dump, delimiter='\t', quoting=csv.QUOTE_NONE):
+        type_ = IMDB_TITLE_TYPES.get(row.get('titleType'))
+        if type_ is None or row.get('isAdult') == '1' or not _optional(row.get('primaryTitle')):
+            continue
+        runtime = _optional(row.get('runtimeMinutes'))
+        genres = _optional(row.get('genres'))
+        yield (row['tconst'], row['primaryTitle'], _imdb_year(row, type_), type_, None, None,
+               f"{runtime} min" if runtime else None, genres.replace(',', ', ') if genres else None,
+               None, None, None, None, 'imdb')
+
+
+def iter_omdb_rows(responses: Iterable[dict]) -> Iterator[tuple]:
+    """Строки каталога из ответов OMDb ?i=."""
+    for data in responses:
+        if data.get('Response') != 'True' or not data.get('imdbID') or not data.get('Title'):
+            continue
+        yield (data['imdbID'], data['Title'], _optional(data.get('Year')), _optional(data.get('Type')),
+               parse_rating(data.get('imdbRating')), parse_votes(data.get('imdbVotes')),
+               _optional(data.get('Runtime')), _optional(data.get('Genre')), _optional(data.get('Director')),
+               _optional(data.get('Actors')), _optional(data.get('Plot')), _optional(data.get('Poster')), 'omdb')
+
+
+def _upsert_rows(rows: Iterable[tuple]) -> int:
+    """
+    Потоково загружает строки через COPY во временную таблицу и переносит их в movies
+    одним INSERT ... ON CONFLICT; уже известные поля не затираются пустыми значениями.
+    """
+    columns = ', '.join(CATALOG_COLUMNS)
+    updates = ', '.join(f"{column} = COALESCE(EXCLUDED.{column}, movies.{column})"
+                        for column in CATALOG_COLUMNS if column != 'imdb_id')
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("CREATE TEMP TABLE movies_import (LIKE public.movies) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY movies_import ({columns}) FROM STDIN", _CopyStream(rows))
+        cursor.execute(
+            f"INSERT INTO public.movies ({columns}, updated_at) "
+            f"SELECT DISTINCT ON (imdb_id) {columns}, now() FROM movies_import "
+            f"ON CONFLICT (imdb_id) DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at"
+        )
+        loaded = cursor.rowcount
+        connection.commit()
+        return loaded
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+def load_imdb_basics(path: str | Path) -> int:
+    """Загружает дамп IMDb title.basics.tsv(.gz) в каталог; возвращает число записей."""
+    with _open_tsv(path) as dump:
+        return _upsert_rows(iter_imdb_basics_rows(dump))
+
+
+def load_imdb_ratings(path: str | Path) -> int:
+    """Обновляет рейтинги каталога из дампа IMDb title.ratings.tsv(.gz); строки дампа идут в COPY как есть."""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            "CREATE TEMP TABLE ratings_import (imdb_id text, imdb_rating real, imdb_votes integer) ON COMMIT DROP"
+        )
+        with _open_tsv(path) as dump:
+            dump.readline()
+            cursor.copy_expert("COPY ratings_import FROM STDIN", dump)
+        cursor.execute(
+            "UPDATE public.movies AS m SET imdb_rating = r.imdb_rating, imdb_votes = r.imdb_votes "
+            "FROM ratings_import AS r WHERE m.imdb_id = r.imdb_id"
+        )
+        updated = cursor.rowcount
+        connection.commit()
+        return updated
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+def load_omdb_responses(responses: Iterable[dict]) -> int:
+    """Загружает в каталог накопленные ответы OMDb ?i= (например, из DiskCache.iter_values('i='))."""
+    return _upsert_rows(iter_omdb_rows(responses))
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def build_search_statement(title: str, year: str | None = None, type_filter: str | None = None,
+                           min_rating: float = 0.0, max_rating: float = 10.0, limit: int = 15, offset: int = 0):
+    """
+    Запрос к каталогу по подстроке названия (ILIKE обслуживается GIN-индексом pg_trgm);
+    сначала наиболее похожие названия, затем самые популярные фильмы.
+    """
+    query = ' '.join(title.split())
+    statement = select(Movie).where(Movie.title.ilike(f"%{_escape_like(query)}%", escape='\\'))
+    if year and year.strip().isdigit():
+        statement = statement.where(Movie.year.startswith(year.strip()))
+    if type_filter in SEARCH_TYPES:
+        statement = statement.where(Movie.type_ == type_filter)
+    if not (min_rating <= 0.0 and max_rating >= 10.0):
+        statement = statement.where(Movie.imdb_rating.between(min_rating, max_rating))
+    return (statement
+            .order_by(func.similarity(Movie.title, query).desc(), Movie.imdb_votes.desc().nulls_last(),
+                      Movie.imdb_id)
+            .offset(offset)
+            .limit(limit))
+
+
+class MovieCatalog:
+    """
+    Поиск по локальному каталогу movies. Если совпадений в каталоге не хватает на порцию выдачи
+    (или их меньше min_results), поиск считается промахом и выполняется через OMDb.
+    """
+
+    def __init__(self, min_results: int = 1):
+        self.min_results = min_results
+
+    def search(self, title: str, year: str | None = None, type_filter: str | None = None,
+               min_rating: float = 0.0, max_rating: float = 10.0,
+               limit: int = 15, offset: int = 0) -> list[MovieSummary] | None:
+        """Результаты поиска (без деталей, если их нет в каталоге) или None, если каталог недоступен."""
+        session = get_session()
+        try:
+            movies = session.execute(
+                build_search_statement(title, year, type_filter, min_rating, max_rating, limit, offset)
+            ).scalars().all()
+            return [movie.to_summary() for movie in movies]
+        except exc.SQLAlchemyError as e:
+            print(f"Ошибка поиска в каталоге фильмов ({title}): {e}", file=sys.stderr)
+            return None
+        finally:
+            session.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Загрузка локального каталога фильмов.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    basics_parser = subparsers.add_parser('load-imdb', help="загрузить дампы IMDb title.basics/title.ratings")
+    basics_parser.add_argument('basics')
+    basics_parser.add_argument('--ratings')
+    subparsers.add_parser('load-cache', help="загрузить накопленные ответы OMDb из кэша на диске")
+    search_parser = subparsers.add_parser('search')
+    search_parser.add_argument('title')
+    args = parser.parse_args()
+
+    if args.command == 'load-imdb':
+        print(f"Загружено записей: {load_imdb_basics(args.basics)}")
+        if args.ratings:
+            print(f"Обновлено рейтингов: {load_imdb_ratings(args.ratings)}")
+    elif args.command == 'load-cache':
+        from backend.api.omdb_client import default_client
+
+        if default_client.response_cache is None:
+            print("Кэш OMDb отключён (OMDB_CACHE_ENABLED=false).")
+        else:
+            print(f"Загружено записей: {load_omdb_responses(default_client.response_cache.iter_values('i='))}")
+    else:
+        for result in MovieCatalog().search(args.title) or []:
+            print(f"{result.imdb_id}\t{result.title} ({result.year_label})\t{result.rating}")
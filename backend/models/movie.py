@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, Float, String, DateTime, Index
+from sqlalchemy.types import Text
+from backend.api.movie_records import MovieDetails, MovieSummary, parse_runtime, parse_year
+from .base import Base
+
+
+class Movie(Base):
+    """Локальный каталог фильмов: загружается из дампов IMDb и накопленных ответов OMDb."""
+    __tablename__ = "movies"
+    __table_args__ = (
+        Index('movies_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        {'schema': 'public'}
+    )
+
+    imdb_id = Column(String(20), primary_key=True)
+    title = Column(Text, nullable=False)
+    year = Column(Text)
+    type_ = Column(Text)
+    imdb_rating = Column(Float)
+    imdb_votes = Column(Integer)
+    runtime = Column(Text)
+    genre = Column(Text)
+    director = Column(Text)
+    actors = Column(Text)
+    plot = Column(Text)
+    poster_url = Column(Text)
+    source = Column(Text)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    @property
+    def has_details(self) -> bool:
+        """Есть ли у записи поля карточки фильма (в дампе IMDb нет ни постера, ни описания, ни съёмочной группы)."""
+        return any(value is not None for value in (self.plot, self.poster_url, self.director, self.actors))
+
+    def to_summary(self) -> MovieSummary:
+        """
+        Запись каталога в виде результата поиска: с деталями, если они есть в каталоге,
+        иначе — как кандидат, детали которого нужно загрузить из OMDb.
+        """
+        return MovieSummary(
+            imdb_id=self.imdb_id,
+            title=self.title,
+            year=parse_year(self.year),
+            year_label=self.year,
+            type_=self.type_,
+            poster_url=self.poster_url,
+            details=MovieDetails(
+                rating=self.imdb_rating,
+                votes=self.imdb_votes,
+                runtime=parse_runtime(self.runtime),
+                genre=self.genre,
+                director=self.director,
+                actors=self.actors,
+                plot=self.plot,
+                poster_url=self.poster_url
+            ) if self.has_details else None
+        )
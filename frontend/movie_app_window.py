@@ -136,4 +136,8 @@ class MovieAppWindow(QMainWindow):
 
     def closeEvent(self, event):
         print("Закрытие основного приложения MovieApp...")
+        self.search_tab.cancel_search(wait=True)
+        self.search_tab.poster_loader.shutdown()
+        self.search_tab.detail_loader.shutdown()
+        self.search_tab.update_notifier.detach()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,117 @@
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QFrame, QFormLayout
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPalette
+from backend.api.movie_records import MovieFullDetails, MovieSummary
+from frontend.search_worker import FullDetailsWorker
+
+
+class MovieDetailsDialog(QDialog):
+    """
+    Карточка фильма из выдачи поиска. Полные детали (описание plot=full, награды, сборы,
+    оценки других источников) загружаются в фоне только при открытии карточки.
+    """
+
+    def __init__(self, movie: MovieSummary, parent=None):
+        super().__init__(parent)
+        self.movie = movie
+
+        self.bg_color = QColor(240, 240, 245)
+        self.text_color = QColor(50, 50, 50)
+        self.border_color = QColor(200, 200, 200)
+
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, self.bg_color)
+        palette.setColor(QPalette.ColorRole.WindowText, self.text_color)
+        self.setPalette(palette)
+
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {self.bg_color.name()};
+            }}
+
+            QLabel {{
+                color: {self.text_color.name()};
+                font-size: 14px;
+            }}
+
+            QLabel#titleLabel {{
+                font-size: 18px;
+                font-weight: 600;
+                margin-bottom: 15px;
+            }}
+
+            QDialogButtonBox QPushButton {{
+                min-width: 80px;
+                padding: 8px 16px;
+                border-radius: 6px;
+                font-size: 14px;
+                background-color: {self.border_color.name()};
+            }}
+        """)
+
+        title = movie.title or 'Нет названия'
+        self.setWindowTitle(title)
+        self.setMinimumWidth(500)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+
+        self.title_label = QLabel(f"{title} ({movie.year_label})" if movie.year_label else title)
+        self.title_label.setObjectName("titleLabel")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setWordWrap(True)
+        main_layout.addWidget(self.title_label)
+
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setStyleSheet(f"color: {self.border_color.name()};")
+        separator.setFixedHeight(1)
+        main_layout.addWidget(separator)
+
+        self.status_label = QLabel("Загрузка подробностей...")
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.status_label)
+
+        self.form_layout = QFormLayout()
+        self.form_layout.setVerticalSpacing(10)
+        self.form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
+        main_layout.addLayout(self.form_layout)
+
+        self.button_box = QDialogButtonBox()
+        self.button_box.addButton("Закрыть", QDialogButtonBox.ButtonRole.RejectRole)
+        self.button_box.setCenterButtons(True)
+        self.button_box.rejected.connect(self.reject)
+        main_layout.addWidget(self.button_box)
+
+        # Поток принадлежит родителю карточки, чтобы пережить её закрытие до окончания запроса.
+        self.worker = FullDetailsWorker(movie.imdb_id, parent=parent)
+        self.worker.details_loaded.connect(self.show_full_details)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.start()
+
+    def _add_row(self, label: str, value: str | None):
+        if not value:
+            return
+        value_label = QLabel(value)
+        value_label.setWordWrap(True)
+        value_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.form_layout.addRow(f"{label}:", value_label)
+
+    def show_full_details(self, details: MovieFullDetails | None):
+        if details is None:
+            self.status_label.setText("Не удалось загрузить подробности, показано краткое описание.")
+            short = self.movie.details
+            self._add_row("Описание", short.plot if short is not None else None)
+            return
+        self.status_label.hide()
+        self._add_row("Описание", details.plot)
+        self._add_row("Выход", details.released)
+        self._add_row("Возрастной рейтинг", details.rated)
+        self._add_row("Сценарий", details.writer)
+        self._add_row("Страна", details.country)
+        self._add_row("Язык", details.language)
+        self._add_row("Награды", details.awards)
+        self._add_row("Сборы", details.box_office)
+        self._add_row("Metascore", str(details.metascore) if details.metascore is not None else None)
+        self._add_row("Оценки", "\n".join(f"{source}: {value}" for source, value in details.ratings))
@@ -0,0 +1,156 @@
+import hashlib
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QLabel
+from backend.api.cache import default_cache_dir
+
+POSTER_WIDTH = 120
+POSTER_HEIGHT = 160
+POSTER_TIMEOUT = 10
+POSTER_WORKERS = 8
+POSTER_MEMORY_CACHE_KB = 20 * 1024
+POSTER_DISK_CACHE_MAX_FILES = 2000
+
+
+def _poster_key(url: str) -> str:
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _placeholder_pixmap(text: str) -> QPixmap:
+    pixmap = QPixmap(POSTER_WIDTH, POSTER_HEIGHT)
+    pixmap.fill(QColor(225, 225, 232))
+    painter = QPainter(pixmap)
+    painter.setPen(QColor(140, 140, 150))
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return pixmap
+
+
+class PosterLoader(QObject):
+    """
+    Загружает постеры в пуле потоков и показывает их в QLabel по мере готовности.
+    Загрузка, декодирование и масштабирование до 120x160 выполняются вне GUI-потока;
+    готовые миниатюры хранятся в QPixmapCache (ограничен по памяти) и на диске по ключу URL.
+    """
+    _image_loaded = pyqtSignal(str, QImage)
+
+    def __init__(self, cache_dir: str | Path | None = None, max_workers: int = POSTER_WORKERS, parent=None):
+        super().__init__(parent)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir() / "posters"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="poster")
+        self._waiting: dict[str, list[QLabel]] = {}
+        self._futures: dict[str, Future] = {}
+        self._placeholder: QPixmap | None = None
+        self._missing: QPixmap | None = None
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), POSTER_MEMORY_CACHE_KB))
+        self._image_loaded.connect(self._deliver)
+        self._executor.submit(self._prune_disk_cache)
+
+    @property
+    def placeholder(self) -> QPixmap:
+        if self._placeholder is None:
+            self._placeholder = _placeholder_pixmap("Постер\nзагружается")
+        return self._placeholder
+
+    @property
+    def missing(self) -> QPixmap:
+        """Заглушка вместо постера, который не удалось загрузить или декодировать."""
+        if self._missing is None:
+            self._missing = _placeholder_pixmap("Нет постера")
+        return self._missing
+
+    def load(self, url: str, label: QLabel) -> None:
+        """Показывает постер в label: сразу из кэша в памяти или заглушку до окончания загрузки."""
+        pixmap = QPixmapCache.find(_poster_key(url))
+        if pixmap is not None and not pixmap.isNull():
+            label.setPixmap(pixmap)
+            return
+        label.setPixmap(self.placeholder)
+        waiting = self._waiting.setdefault(url, [])
+        waiting.append(label)
+        if len(waiting) == 1:
+            self._futures[url] = self._executor.submit(self._fetch, url)
+
+    def cancel(self, url: str) -> bool:
+        """Отменяет ещё не начатую загрузку постера (подписи остаются с заглушкой); True, если отменена."""
+        future = self._futures.get(url)
+        if future is None or not future.cancel():
+            return False
+        del self._futures[url]
+        self._waiting.pop(url, None)
+        return True
+
+    def is_pending(self, url: str) -> bool:
+        return url in self._waiting
+
+    def pending(self) -> int:
+        return len(self._waiting)
+
+    def shutdown(self) -> None:
+        self._waiting.clear()
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _disk_path(self, url: str) -> Path:
+        return self.cache_dir / f"{_poster_key(url)}.png"
+
+    def _fetch(self, url: str) -> None:
+        """Выполняется в пуле: миниатюра с диска или из сети; пустой QImage означает ошибку."""
+        path = self._disk_path(url)
+        image = QImage(str(path)) if path.exists() else QImage()
+        if image.isNull():
+            image = self._download(url)
+            if not image.isNull():
+                try:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    image.save(str(path), "PNG")
+                except OSError as e:
+                    print(f"Не удалось сохранить постер в кэш ({url}): {e}", file=sys.stderr)
+        self._image_loaded.emit(url, image)
+
+    def _download(self, url: str) -> QImage:
+        try:
+            response = self.session.get(url, timeout=POSTER_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"Ошибка загрузки постера: {e}", file=sys.stderr)
+            return QImage()
+        image = QImage()
+        if not image.loadFromData(response.content):
+            print(f"Не удалось декодировать постер: {url}", file=sys.stderr)
+            return QImage()
+        return image.scaled(POSTER_WIDTH, POSTER_HEIGHT,
+                            Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
+
+    def _deliver(self, url: str, image: QImage) -> None:
+        labels = self._waiting.pop(url, [])
+        self._futures.pop(url, None)
+        if image.isNull():
+            pixmap = self.missing
+        else:
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(_poster_key(url), pixmap)
+        for label in labels:
+            if not sip.isdeleted(label):
+                label.setPixmap(pixmap)
+
+    def _prune_disk_cache(self) -> None:
+        """Оставляет на диске не больше POSTER_DISK_CACHE_MAX_FILES самых свежих миниатюр."""
+        try:
+            files = sorted(self.cache_dir.glob("*.png"), key=lambda path: path.stat().st_mtime, reverse=True)
+            for path in files[POSTER_DISK_CACHE_MAX_FILES:]:
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Не удалось очистить кэш постеров: {e}", file=sys.stderr)
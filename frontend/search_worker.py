@@ -0,0 +1,156 @@
+import sys
+import threading
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from backend.api.omdb_client import (OmdbSearchError, SearchCursor, add_circuit_listener, add_update_listener,
+                                     get_full_details, get_movie_by_id, remove_circuit_listener,
+                                     remove_update_listener)
+
+DETAIL_LOADER_WORKERS = 4
+
+
+class SearchWorker(QThread):
+    """
+    Загружает очередную порцию результатов курсора OMDb в фоновом потоке по мере их готовности.
+    С candidates_only порция — только результаты выдачи без деталей (одним сигналом candidates_found).
+    """
+    candidates_found = pyqtSignal(list)
+    result_ready = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    search_failed = pyqtSignal(str)
+    search_finished = pyqtSignal(int)
+
+    def __init__(self, cursor: SearchCursor, candidates_only: bool = False, parent=None):
+        super().__init__(parent)
+        self.cursor = cursor
+        self.candidates_only = candidates_only
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self):
+        try:
+            found = self._fetch_candidates() if self.candidates_only else self._fetch_results()
+        except OmdbSearchError as e:
+            if not self.is_cancelled():
+                self.search_failed.emit(str(e))
+            return
+        if found is not None and not self.is_cancelled():
+            self.search_finished.emit(found)
+
+    def _fetch_results(self) -> int | None:
+        found = 0
+        for movie in self.cursor.fetch_more(on_progress=self.progress.emit, cancel_event=self.cancel_event,
+                                            on_candidates=self.candidates_found.emit):
+            if self.is_cancelled():
+                return None
+            found += 1
+            self.result_ready.emit(movie)
+        return found
+
+    def _fetch_candidates(self) -> int:
+        candidates = self.cursor.fetch_candidates(cancel_event=self.cancel_event)
+        if candidates and not self.is_cancelled():
+            self.candidates_found.emit(candidates)
+        return len(candidates)
+
+
+class DetailLoader(QObject):
+    """
+    Загружает детали фильмов для строк выдачи в нескольких фоновых потоках.
+    Заявки выполняются по возрастанию приоритета (расстояния строки от видимой области списка);
+    prioritize() заменяет набор заявок целиком, поэтому ещё не начатые заявки для строк,
+    ушедших из поля зрения, отменяются.
+    """
+    details_loaded = pyqtSignal(str, object)
+
+    def __init__(self, max_workers: int = DETAIL_LOADER_WORKERS, parent=None):
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending: dict[str, int] = {}
+        self._in_progress: set[str] = set()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, name=f"details-{number}", daemon=True)
+                         for number in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def prioritize(self, priorities: dict[str, int]) -> None:
+        """Новый набор заявок imdbID -> приоритет (меньше — раньше); уже идущие загрузки не повторяются."""
+        with self._condition:
+            self._pending = {imdb_id: priority for imdb_id, priority in priorities.items()
+                             if imdb_id not in self._in_progress}
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending) + len(self._in_progress)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or self._pending)
+                if self._closed:
+                    return
+                imdb_id = min(self._pending, key=self._pending.get)
+                del self._pending[imdb_id]
+                self._in_progress.add(imdb_id)
+            try:
+                data = get_movie_by_id(imdb_id)
+            except Exception as e:
+                print(f"Ошибка загрузки деталей {imdb_id}: {e}", file=sys.stderr)
+                data = None
+            with self._condition:
+                self._in_progress.discard(imdb_id)
+                if self._closed:
+                    return
+            if not sip.isdeleted(self):
+                self.details_loaded.emit(imdb_id, data)
+
+
+class FullDetailsWorker(QThread):
+    """Загружает полные детали фильма (plot=full) для карточки в фоновом потоке."""
+    details_loaded = pyqtSignal(object)
+
+    def __init__(self, imdb_id: str, parent=None):
+        super().__init__(parent)
+        self.imdb_id = imdb_id
+
+    def run(self):
+        self.details_loaded.emit(get_full_details(self.imdb_id))
+
+
+class OmdbUpdateNotifier(QObject):
+    """
+    Передаёт в GUI-поток детали фильмов, обновлённые клиентом OMDb в фоне (stale-while-revalidate),
+    и смену состояния предохранителя OMDb.
+    """
+    details_updated = pyqtSignal(str, dict)
+    circuit_state_changed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        add_update_listener(self._on_update)
+        add_circuit_listener(self._on_circuit_state)
+
+    def detach(self):
+        remove_update_listener(self._on_update)
+        remove_circuit_listener(self._on_circuit_state)
+
+    def _on_circuit_state(self, state: str):
+        if not sip.isdeleted(self):
+            self.circuit_state_changed.emit(state)
+
+    def _on_update(self, kind: str, key: str, data: dict):
+        if kind == 'details' and not sip.isdeleted(self):
+            self.details_updated.emit(key, data)
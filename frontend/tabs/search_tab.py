@@ -1,21 +1,53 @@
+import threading
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
                              QPushButton, QListWidget, QLabel, QListWidgetItem,
-                             QFrame)
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor, QImage, QPixmap
-import requests
-from backend.api.omdb_client import search_movie_by_title
+                             QFrame, QCheckBox)
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QRect, QSize, QTimer
+from PyQt6.QtGui import QFont, QColor
+from backend.api.movie_records import MovieDetails, MovieSummary
+from backend.api.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from backend.api.omdb_client import circuit_state, create_search_cursor, probe_omdb
+from frontend.poster_loader import POSTER_HEIGHT, POSTER_WIDTH, PosterLoader
+from frontend.movie_details_dialog import MovieDetailsDialog
+from frontend.search_worker import DetailLoader, FullDetailsWorker, OmdbUpdateNotifier, SearchWorker
 from backend.database.database import add_favorite
 from frontend.review_dialog import ReviewDialog
 from frontend.ui_utils import show_error_message, show_info_message, show_warning_message
 from backend.models.favourite_film import FavouriteFilm
 
+TYPEAHEAD_DEBOUNCE_MS = 350
+TYPEAHEAD_MIN_LENGTH = 3
+RESULT_ITEM_HEIGHT = 250
+CANDIDATE_ITEM_HEIGHT = 60
+LAZY_DETAILS = True
+LAZY_PREFETCH_ROWS = 2
+VIEWPORT_SYNC_DELAY_MS = 100
+CIRCUIT_REFRESH_MS = 1000
+
 
 class SearchTab(QWidget):
-    def __init__(self, user_id, parent=None):
+    """
+    Поиск фильмов. С lazy_details выдача ?s= показывается сразу, а детали и постеры
+    загружаются только для строк в видимой области списка и рядом с ней.
+    """
+
+    def __init__(self, user_id, parent=None, lazy_details: bool = LAZY_DETAILS):
         super().__init__(parent)
         self.user_id = user_id
+        self.lazy_details = lazy_details
         self.current_search_results = []
+        self.search_worker = None
+        self.search_cursor = None
+        self._candidate_items = {}
+        self._poster_labels = {}
+        self._deferred_posters = set()
+        self.poster_loader = PosterLoader(parent=self)
+        self.detail_loader = DetailLoader(parent=self)
+        self.detail_loader.details_loaded.connect(self.apply_lazy_details)
+        self.update_notifier = OmdbUpdateNotifier(parent=self)
+        self.update_notifier.details_updated.connect(self.update_search_result)
+        self.update_notifier.circuit_state_changed.connect(self.show_omdb_state)
 
         self.bg_color = QColor(240, 240, 245)
         self.primary_color = QColor(80, 100, 220)
@@ -25,6 +57,21 @@ class SearchTab(QWidget):
         self.card_bg_color = QColor(255, 255, 255)
         self.border_color = QColor(200, 200, 200)
 
+        self.typeahead_timer = QTimer(self)
+        self.typeahead_timer.setSingleShot(True)
+        self.typeahead_timer.setInterval(TYPEAHEAD_DEBOUNCE_MS)
+        self.typeahead_timer.timeout.connect(self.perform_typeahead_search)
+
+        self.viewport_timer = QTimer(self)
+        self.viewport_timer.setSingleShot(True)
+        self.viewport_timer.setInterval(VIEWPORT_SYNC_DELAY_MS)
+        self.viewport_timer.timeout.connect(self.sync_viewport)
+
+        self._probe_thread = None
+        self.circuit_timer = QTimer(self)
+        self.circuit_timer.setInterval(CIRCUIT_REFRESH_MS)
+        self.circuit_timer.timeout.connect(self.refresh_omdb_state)
+
         self.init_ui()
 
     def init_ui(self):
@@ -120,6 +167,10 @@ class SearchTab(QWidget):
 
         layout.addLayout(search_layout)
 
+        self.typeahead_checkbox = QCheckBox("Искать при вводе")
+        self.typeahead_checkbox.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(self.typeahead_checkbox)
+
         results_label = QLabel("Результаты поиска:")
         results_label.setStyleSheet("font-weight: bold;")
         layout.addWidget(results_label)
@@ -130,8 +181,18 @@ class SearchTab(QWidget):
         layout.addWidget(self.results_list)
 
         button_layout = QHBoxLayout()
+
+        self.load_more_button = QPushButton("Загрузить ещё")
+        self.load_more_button.setObjectName("clearButton")
+        self.load_more_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        button_layout.addWidget(self.load_more_button)
+
         button_layout.addStretch()
 
+        self.details_button = QPushButton("Подробнее")
+        self.details_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        button_layout.addWidget(self.details_button)
+
         self.add_to_favorites_button = QPushButton("Добавить в избранное")
         self.add_to_favorites_button.setCursor(Qt.CursorShape.PointingHandCursor)
         button_layout.addWidget(self.add_to_favorites_button)
@@ -146,12 +207,23 @@ class SearchTab(QWidget):
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
 
+        self.omdb_state_label = QLabel()
+        self.omdb_state_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.omdb_state_label.setStyleSheet(f"color: {self.error_color.name()};")
+        layout.addWidget(self.omdb_state_label)
+        self.show_omdb_state(circuit_state()[0])
+
         self.search_button.clicked.connect(self.perform_search)
         self.search_input.returnPressed.connect(self.perform_search)
+        self.search_input.textEdited.connect(self.schedule_typeahead_search)
         self.clear_button.clicked.connect(self.clear_search)
+        self.load_more_button.clicked.connect(self.load_more_results)
         self.add_to_favorites_button.clicked.connect(self.add_selected_to_favorites)
         self.leave_review_button.clicked.connect(self.leave_review_for_selected)
         self.results_list.itemSelectionChanged.connect(self.update_action_buttons_state)
+        self.results_list.verticalScrollBar().valueChanged.connect(self.schedule_viewport_sync)
+        self.results_list.itemDoubleClicked.connect(self.show_selected_details)
+        self.details_button.clicked.connect(self.show_selected_details)
 
         self.update_action_buttons_state()
 
@@ -161,163 +233,455 @@ class SearchTab(QWidget):
             show_warning_message(self, "Поиск", "Введите название для поиска.")
             return
 
+        self._start_search(title)
+
+    def schedule_typeahead_search(self, text: str):
+        """
+        В режиме «Искать при вводе» откладывает поиск до паузы в наборе: каждое нажатие
+        перезапускает таймер, а предыдущий поиск сразу отменяется вместе с ожидающими запросами деталей.
+        """
+        if not self.typeahead_checkbox.isChecked():
+            return
+        self.cancel_search()
+        if len(text.strip()) < TYPEAHEAD_MIN_LENGTH:
+            self.typeahead_timer.stop()
+            self.update_action_buttons_state()
+            return
+        self.typeahead_timer.start()
+
+    def perform_typeahead_search(self):
+        title = self.search_input.text().strip()
+        if len(title) < TYPEAHEAD_MIN_LENGTH:
+            return
+        if self.search_cursor is not None and self.search_cursor.title == title and self.search_worker is not None:
+            return
+        self._start_search(title)
+
+    def _start_search(self, title: str):
+        self.typeahead_timer.stop()
+        self.cancel_search()
         self.status_label.setText("Выполняется поиск...")
         self.results_list.clear()
+        self._reset_lazy_state()
         self.current_search_results = []
+        self.search_cursor = create_search_cursor(title)
+        self._start_search_worker()
+
+    def load_more_results(self):
+        """Догружает следующую порцию результатов текущего поиска (только новые страницы выдачи)."""
+        if self.search_cursor is None or self.search_worker is not None or not self.search_cursor.has_more:
+            return
+        self.status_label.setText("Загрузка следующих результатов...")
+        self._start_search_worker()
+
+    def _start_search_worker(self):
+        worker = SearchWorker(self.search_cursor, candidates_only=self.lazy_details, parent=self)
+        worker.candidates_found.connect(self.add_search_candidates)
+        worker.result_ready.connect(self.add_search_result)
+        worker.progress.connect(self.show_search_progress)
+        worker.search_failed.connect(self.handle_search_failed)
+        worker.search_finished.connect(self.handle_search_finished)
+        worker.finished.connect(worker.deleteLater)
+        self.search_worker = worker
+        worker.start()
+        self.update_action_buttons_state()
+
+    def cancel_search(self, wait: bool = False):
+        """
+        Отменяет текущий поиск; его запоздавшие сигналы игнорируются.
+        С wait=True дожидается завершения всех фоновых поисков, в том числе отменённых ранее.
+        """
+        worker = self.search_worker
+        self.search_worker = None
+        if worker is not None:
+            worker.cancel()
+        if wait:
+            self.typeahead_timer.stop()
+            for worker in self.findChildren(SearchWorker):
+                worker.cancel()
+                worker.wait()
+            for worker in self.findChildren(FullDetailsWorker):
+                worker.wait()
+
+    def _is_current_worker(self) -> bool:
+        return self.search_worker is not None and self.sender() is self.search_worker
+
+    def show_search_progress(self, done: int, total: int):
+        if not self._is_current_worker():
+            return
+        self.status_label.setText(
+            f"Загрузка деталей: {done} из {total}... Найдено результатов: {len(self.current_search_results)}"
+        )
 
-        movies = search_movie_by_title(title)
-        if movies is None:
-            self.status_label.setText("Ошибка соединения с API")
-            show_error_message(self, "Ошибка поиска",
-                               "Не удалось выполнить поиск. Проверьте подключение к интернету.")
-        elif not movies:
+    def handle_search_failed(self, message: str):
+        if not self._is_current_worker():
+            return
+        self.search_worker = None
+        self.search_cursor = None
+        if not self.lazy_details:
+            self._settle_candidates()
+        self.update_action_buttons_state()
+        if circuit_state()[0] != CLOSED:
+            # Предохранитель отклонил запрос сразу: OMDb недоступен, окно с ошибкой не показываем.
+            self.status_label.setText(f"Ошибка соединения с API: {message}")
+            return
+        self.status_label.setText("Ошибка соединения с API")
+        show_error_message(self, "Ошибка поиска",
+                           "Не удалось выполнить поиск. Проверьте подключение к интернету.")
+
+    def show_omdb_state(self, state: str):
+        """Показывает, что OMDb недоступен (предохранитель разомкнут) или проверяется пробным запросом."""
+        if state == OPEN:
+            self.omdb_state_label.setText(
+                "OMDb недоступен: поиск работает только по кэшу и локальному каталогу, "
+                f"повторная проверка через {circuit_state()[1]:.0f} с"
+            )
+        elif state == HALF_OPEN:
+            self.omdb_state_label.setText("Проверяем доступность OMDb...")
+        else:
+            self.omdb_state_label.setText("")
+        self.omdb_state_label.setVisible(state != CLOSED)
+        if state == CLOSED:
+            self.circuit_timer.stop()
+        elif not self.circuit_timer.isActive():
+            self.circuit_timer.start()
+
+    def refresh_omdb_state(self):
+        """
+        Раз в секунду, пока OMDb недоступен, обновляет обратный отсчёт, а когда он истёк —
+        отправляет пробный запрос, не дожидаясь, пока пользователь сам запустит поиск.
+        """
+        state, retry_after = circuit_state()
+        if state == HALF_OPEN or (state == OPEN and retry_after <= 0):
+            self.start_omdb_probe()
+        self.show_omdb_state(state)
+
+    def start_omdb_probe(self):
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+        self._probe_thread = threading.Thread(target=probe_omdb, name="omdb-probe", daemon=True)
+        self._probe_thread.start()
+
+    def handle_search_finished(self, found: int):
+        if not self._is_current_worker():
+            return
+        self.search_worker = None
+        if not self.lazy_details:
+            self._settle_candidates()
+        if self.search_cursor is not None and self.search_cursor.truncated:
+            # Детали, отклонённые предохранителем, не потеряны: курсор вернёт их при «Загрузить ещё».
+            reason = "OMDb недоступен" if circuit_state()[0] != CLOSED else "Поиск остановлен по времени"
+            self.status_label.setText(
+                f"Найдено результатов: {len(self.current_search_results)}. "
+                f"{reason} — нажмите «Загрузить ещё», чтобы продолжить."
+            )
+        elif not self.current_search_results:
             self.status_label.setText("Ничего не найдено.")
         else:
-            self.current_search_results = movies
-            for movie in movies:
-                item = QListWidgetItem()
-                item.setData(Qt.ItemDataRole.UserRole, movie)
-                item.setSizeHint(QSize(0, 250))
-
-                widget = QWidget()
-                widget_layout = QHBoxLayout(widget)
-                widget_layout.setContentsMargins(10, 5, 10, 5)
-                widget_layout.setSpacing(10)
-
-                poster_url = movie.get('Poster')
-                if poster_url and poster_url != 'N/A':
-                    try:
-                        response = requests.get(poster_url, timeout=10)
-                        if response.status_code == 200:
-                            image = QImage()
-                            image.loadFromData(response.content)
-
-                            scaled_image = image.scaled(120, 160,
-                                                        Qt.AspectRatioMode.KeepAspectRatio,
-                                                        Qt.TransformationMode.SmoothTransformation)
-
-                            poster_label = QLabel()
-                            poster_label.setPixmap(QPixmap.fromImage(scaled_image))
-                            poster_label.setFixedSize(120, 160)
-                            poster_label.setStyleSheet("border: 1px solid #ddd;")
-                            widget_layout.addWidget(poster_label)
-                    except Exception as e:
-                        print(f"Ошибка загрузки постера: {e}")
-
-                info_widget = QWidget()
-                info_layout = QVBoxLayout(info_widget)
-                info_layout.setContentsMargins(0, 0, 0, 0)
-                info_layout.setSpacing(5)
-
-                title_layout = QHBoxLayout()
-                title_label = QLabel(movie.get('Title', 'Нет названия'))
-                title_font = QFont()
-                title_font.setBold(True)
-                title_font.setPointSize(14)
-                title_label.setFont(title_font)
-                title_layout.addWidget(title_label)
-
-                if movie.get('Year'):
-                    year_label = QLabel(f"({movie.get('Year')})")
-                    year_label.setStyleSheet("color: #666;")
-                    title_layout.addWidget(year_label)
-
-                title_layout.addStretch()
-
-                if movie.get('Type'):
-                    type_label = QLabel(movie.get('Type'))
-                    type_label.setStyleSheet("""
-                        color: white;
-                        background-color: #6c757d;
-                        border-radius: 4px;
-                        padding: 2px 6px;
-                    """)
-                    title_layout.addWidget(type_label)
-
-                info_layout.addLayout(title_layout)
-
-                if movie.get('Genre'):
-                    genre_label = QLabel(f"Жанр: {movie.get('Genre')}")
-                    genre_label.setStyleSheet("color: #555;")
-                    info_layout.addWidget(genre_label)
-
-                if movie.get('Runtime'):
-                    runtime_label = QLabel(f"Продолжительность: {movie.get('Runtime')}")
-                    runtime_label.setStyleSheet("color: #555;")
-                    info_layout.addWidget(runtime_label)
-
-                if movie.get('Director'):
-                    director_label = QLabel(f"Режиссёр: {movie.get('Director')}")
-                    director_label.setStyleSheet("color: #555;")
-                    info_layout.addWidget(director_label)
-
-                if movie.get('Actors'):
-                    actors_label = QLabel(f"Актёры: {movie.get('Actors')}")
-                    actors_label.setWordWrap(True)
-                    actors_label.setStyleSheet("color: #555;")
-                    info_layout.addWidget(actors_label)
-
-                if movie.get('Plot'):
-                    plot_label = QLabel(f"Описание: {movie.get('Plot')}")
-                    plot_label.setWordWrap(True)
-                    plot_label.setStyleSheet("color: #555;")
-                    plot_label.setMaximumHeight(100)
-                    info_layout.addWidget(plot_label)
-
-                if movie.get('imdbRating') and movie.get('imdbRating') != 'N/A':
-                    rating_label = QLabel(f"Рейтинг IMDb: {movie.get('imdbRating')}")
-                    rating_label.setStyleSheet("color: #ffc107; font-weight: bold;")
-                    info_layout.addWidget(rating_label)
-
-                separator = QFrame()
-                separator.setFrameShape(QFrame.Shape.HLine)
-                separator.setStyleSheet(f"color: {self.border_color.name()};")
-                info_layout.addWidget(separator)
-
-                widget_layout.addWidget(info_widget)
-                widget_layout.setStretchFactor(info_widget, 1)
+            self.status_label.setText(f"Найдено результатов: {len(self.current_search_results)}")
+        self.update_action_buttons_state()
 
+    def add_search_candidates(self, candidates: list):
+        """
+        Сразу показывает название и год найденных фильмов; карточки дополняются по мере загрузки деталей.
+        В ленивом режиме кандидаты и есть результаты поиска: детали запрашиваются, когда строка видна.
+        """
+        if not self._is_current_worker():
+            return
+        for movie in candidates:
+            imdb_id = movie.imdb_id
+            if imdb_id in self._candidate_items:
+                continue
+            item = QListWidgetItem()
+            item.setData(Qt.ItemDataRole.UserRole, movie)
+            if not self.lazy_details:
+                item.setSizeHint(QSize(0, CANDIDATE_ITEM_HEIGHT))
                 self.results_list.addItem(item)
-                self.results_list.setItemWidget(item, widget)
+                self.results_list.setItemWidget(item, self._create_candidate_widget(movie, loading=True))
+                self._candidate_items[imdb_id] = item
+                continue
+            # Под карточку сразу отводится полная высота, чтобы строки не сдвигались при загрузке деталей.
+            item.setSizeHint(QSize(0, RESULT_ITEM_HEIGHT))
+            self.results_list.addItem(item)
+            self.current_search_results.append(movie)
+            if movie.details is not None:
+                self.results_list.setItemWidget(item, self._create_result_widget(movie))
+            else:
+                self.results_list.setItemWidget(item, self._create_candidate_widget(movie, loading=False))
+                self._candidate_items[imdb_id] = item
+        self.schedule_viewport_sync()
+
+    def _settle_candidates(self):
+        """Снимает пометку о загрузке с кандидатов, детали которых остались незагруженными."""
+        for item in self._candidate_items.values():
+            movie = item.data(Qt.ItemDataRole.UserRole)
+            self.results_list.setItemWidget(item, self._create_candidate_widget(movie, loading=False))
+
+    def add_search_result(self, movie: MovieSummary):
+        if not self._is_current_worker():
+            return
+        self.current_search_results.append(movie)
 
-            self.status_label.setText(f"Найдено результатов: {len(movies)}")
+        item = self._candidate_items.pop(movie.imdb_id, None)
+        if item is None:
+            item = QListWidgetItem()
+            self.results_list.addItem(item)
+        item.setData(Qt.ItemDataRole.UserRole, movie)
+        item.setSizeHint(QSize(0, RESULT_ITEM_HEIGHT))
+        self.results_list.setItemWidget(item, self._create_result_widget(movie))
 
         self.update_action_buttons_state()
 
+    def schedule_viewport_sync(self):
+        if self.lazy_details:
+            self.viewport_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_viewport_sync()
+
+    def _reset_lazy_state(self):
+        self._candidate_items = {}
+        self._poster_labels = {}
+        self._deferred_posters = set()
+        self.detail_loader.prioritize({})
+
+    @staticmethod
+    def _rows_from_viewport(rect: QRect, viewport: QRect) -> int:
+        """Сколько строк (по RESULT_ITEM_HEIGHT) отделяет строку от видимой области; 0 — строка видна."""
+        if rect.bottom() < viewport.top():
+            gap = viewport.top() - rect.bottom()
+        elif rect.top() > viewport.bottom():
+            gap = rect.top() - viewport.bottom()
+        else:
+            return 0
+        return 1 + gap // RESULT_ITEM_HEIGHT
+
+    def sync_viewport(self):
+        """
+        Запрашивает детали для кандидатов в видимой области и в LAZY_PREFETCH_ROWS строках вокруг неё,
+        ближние — раньше. Заявки для строк вне этого окна снимаются, а ещё не начатые загрузки
+        их постеров откладываются до возвращения строки в поле зрения.
+        """
+        if not self.lazy_details:
+            return
+        viewport = self.results_list.viewport().rect()
+        priorities = {}
+        for row in range(self.results_list.count()):
+            item = self.results_list.item(row)
+            imdb_id = item.data(Qt.ItemDataRole.UserRole).imdb_id
+            distance = self._rows_from_viewport(self.results_list.visualItemRect(item), viewport)
+            near = distance <= LAZY_PREFETCH_ROWS
+            if imdb_id in self._candidate_items:
+                if near:
+                    priorities[imdb_id] = distance
+                continue
+            poster = self._poster_labels.get(imdb_id)
+            if poster is None or sip.isdeleted(poster[1]):
+                continue
+            url, label = poster
+            if near and imdb_id in self._deferred_posters:
+                self._deferred_posters.discard(imdb_id)
+                self.poster_loader.load(url, label)
+            elif not near and self.poster_loader.is_pending(url) and self.poster_loader.cancel(url):
+                self._deferred_posters.add(imdb_id)
+        self.detail_loader.prioritize(priorities)
+
+    def apply_lazy_details(self, imdb_id: str, details: dict | None):
+        """Заменяет строку-кандидата карточкой, когда для неё загрузились детали."""
+        item = self._candidate_items.pop(imdb_id, None)
+        if item is None or details is None:
+            return
+        updated = item.data(Qt.ItemDataRole.UserRole).with_details(MovieDetails.from_omdb(details))
+        item.setData(Qt.ItemDataRole.UserRole, updated)
+        self.results_list.setItemWidget(item, self._create_result_widget(updated))
+        self.current_search_results = [
+            updated if result.imdb_id == imdb_id else result for result in self.current_search_results
+        ]
+
+    def update_search_result(self, imdb_id: str, details: dict):
+        """Перерисовывает карточку фильма, чьи устаревшие данные из кэша обновились в фоне."""
+        movie_details = MovieDetails.from_omdb(details)
+        for row in range(self.results_list.count()):
+            item = self.results_list.item(row)
+            movie = item.data(Qt.ItemDataRole.UserRole)
+            if movie is None or movie.imdb_id != imdb_id:
+                continue
+            updated = movie.with_details(movie_details)
+            item.setData(Qt.ItemDataRole.UserRole, updated)
+            self.results_list.setItemWidget(item, self._create_result_widget(updated))
+            self.current_search_results = [
+                updated if result.imdb_id == imdb_id else result for result in self.current_search_results
+            ]
+
+    def _create_candidate_widget(self, movie: MovieSummary, loading: bool) -> QWidget:
+        widget = QWidget()
+        widget_layout = QHBoxLayout(widget)
+        widget_layout.setContentsMargins(10, 5, 10, 5)
+        widget_layout.setSpacing(10)
+
+        title_label = QLabel(movie.title or 'Нет названия')
+        title_font = QFont()
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        widget_layout.addWidget(title_label)
+
+        if movie.year_label:
+            year_label = QLabel(f"({movie.year_label})")
+            year_label.setStyleSheet("color: #666;")
+            widget_layout.addWidget(year_label)
+
+        widget_layout.addStretch()
+
+        if loading:
+            details_label = QLabel("Загрузка деталей...")
+            details_label.setStyleSheet("color: #999;")
+            widget_layout.addWidget(details_label)
+        return widget
+
+    def _create_result_widget(self, movie: MovieSummary) -> QWidget:
+        widget = QWidget()
+        widget_layout = QHBoxLayout(widget)
+        widget_layout.setContentsMargins(10, 5, 10, 5)
+        widget_layout.setSpacing(10)
+
+        details = movie.details or MovieDetails()
+        poster_url = movie.poster_url
+        if poster_url:
+            poster_label = QLabel()
+            poster_label.setFixedSize(POSTER_WIDTH, POSTER_HEIGHT)
+            poster_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            poster_label.setStyleSheet("border: 1px solid #ddd;")
+            widget_layout.addWidget(poster_label)
+            self.poster_loader.load(poster_url, poster_label)
+            if self.lazy_details:
+                self._poster_labels[movie.imdb_id] = (poster_url, poster_label)
+
+        info_widget = QWidget()
+        info_layout = QVBoxLayout(info_widget)
+        info_layout.setContentsMargins(0, 0, 0, 0)
+        info_layout.setSpacing(5)
+
+        title_layout = QHBoxLayout()
+        title_label = QLabel(movie.title or 'Нет названия')
+        title_font = QFont()
+        title_font.setBold(True)
+        title_font.setPointSize(14)
+        title_label.setFont(title_font)
+        title_layout.addWidget(title_label)
+
+        if movie.year_label:
+            year_label = QLabel(f"({movie.year_label})")
+            year_label.setStyleSheet("color: #666;")
+            title_layout.addWidget(year_label)
+
+        title_layout.addStretch()
+
+        if movie.type_:
+            type_label = QLabel(movie.type_)
+            type_label.setStyleSheet("""
+                color: white;
+                background-color: #6c757d;
+                border-radius: 4px;
+                padding: 2px 6px;
+            """)
+            title_layout.addWidget(type_label)
+
+        info_layout.addLayout(title_layout)
+
+        if details.genre:
+            genre_label = QLabel(f"Жанр: {details.genre}")
+            genre_label.setStyleSheet("color: #555;")
+            info_layout.addWidget(genre_label)
+
+        if details.runtime:
+            runtime_label = QLabel(f"Продолжительность: {details.runtime} мин")
+            runtime_label.setStyleSheet("color: #555;")
+            info_layout.addWidget(runtime_label)
+
+        if details.director:
+            director_label = QLabel(f"Режиссёр: {details.director}")
+            director_label.setStyleSheet("color: #555;")
+            info_layout.addWidget(director_label)
+
+        if details.actors:
+            actors_label = QLabel(f"Актёры: {details.actors}")
+            actors_label.setWordWrap(True)
+            actors_label.setStyleSheet("color: #555;")
+            info_layout.addWidget(actors_label)
+
+        if details.plot:
+            plot_label = QLabel(f"Описание: {details.plot}")
+            plot_label.setWordWrap(True)
+            plot_label.setStyleSheet("color: #555;")
+            plot_label.setMaximumHeight(100)
+            info_layout.addWidget(plot_label)
+
+        if details.rating is not None:
+            rating_label = QLabel(f"Рейтинг IMDb: {details.rating:.1f}")
+            rating_label.setStyleSheet("color: #ffc107; font-weight: bold;")
+            info_layout.addWidget(rating_label)
+
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setStyleSheet(f"color: {self.border_color.name()};")
+        info_layout.addWidget(separator)
+
+        widget_layout.addWidget(info_widget)
+        widget_layout.setStretchFactor(info_widget, 1)
+        return widget
+
     def clear_search(self):
+        self.typeahead_timer.stop()
+        self.cancel_search()
+        self.search_cursor = None
         self.search_input.clear()
         self.results_list.clear()
+        self._reset_lazy_state()
         self.current_search_results = []
         self.status_label.setText("")
         self.update_action_buttons_state()
 
     def update_action_buttons_state(self):
         selected = bool(self.results_list.selectedItems())
+        self.details_button.setEnabled(selected)
         self.add_to_favorites_button.setEnabled(selected)
         self.leave_review_button.setEnabled(selected)
+        self.load_more_button.setEnabled(
+            self.search_cursor is not None and self.search_worker is None and self.search_cursor.has_more
+        )
 
-    def get_selected_movie_data(self):
+    def get_selected_movie_data(self) -> MovieSummary | None:
         selected_items = self.results_list.selectedItems()
         if not selected_items:
             return None
         return selected_items[0].data(Qt.ItemDataRole.UserRole)
 
+    def show_selected_details(self):
+        """Открывает карточку выбранного фильма; полные детали загружаются только сейчас."""
+        movie_data = self.get_selected_movie_data()
+        if not movie_data:
+            return
+        dialog = MovieDetailsDialog(movie_data, self)
+        dialog.exec()
+        dialog.deleteLater()
+
     def add_selected_to_favorites(self):
         movie_data = self.get_selected_movie_data()
         if not movie_data:
             show_warning_message(self, "Избранное", "Фильм не выбран.")
             return
         new_favorite_movie = FavouriteFilm(
-            title=movie_data.get('Title'),
-            year=movie_data.get('Year'),
-            type_=movie_data.get('Type'),
-            imdb_id=movie_data.get('imdbID'),
-            poster_url=movie_data.get('Poster'),
+            title=movie_data.title,
+            year=movie_data.year_label,
+            type_=movie_data.type_,
+            imdb_id=movie_data.imdb_id,
+            poster_url=movie_data.poster_url,
             user_id=self.user_id
         )
         success, message = add_favorite(new_favorite_movie)
         if success:
-            show_info_message(self, "Избранное", f"Фильм '{movie_data.get('Title')}' добавлен в избранное!")
+            show_info_message(self, "Избранное", f"Фильм '{movie_data.title}' добавлен в избранное!")
         else:
             show_warning_message(self, "Избранное", message)
 
@@ -327,8 +691,8 @@ class SearchTab(QWidget):
             show_warning_message(self, "Отзыв", "Фильм не выбран.")
             return
 
-        imdb_id = movie_data.get('imdbID')
-        movie_title = movie_data.get('Title')
+        imdb_id = movie_data.imdb_id
+        movie_title = movie_data.title
 
         if not imdb_id or not movie_title:
             show_error_message(self, "Отзыв", "Недостаточно информации о фильме (отсутствует IMDb ID или название).")
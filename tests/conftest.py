@@ -5,18 +5,21 @@ from sqlalchemy.orm import Session
 from backend.models.favourite_film import FavouriteFilm
 from backend.models.user import User
 from backend.models.review import Review
+from backend.api.omdb_client import OmdbClient
 
 
 @pytest.fixture
 def mock_session():
     with patch('backend.database.database.get_session') as mock_get_session_db_database, \
             patch('backend.database.auth.get_session') as mock_get_session_auth, \
-            patch('backend.database.review_service.get_session') as mock_get_session_review:
+            patch('backend.database.review_service.get_session') as mock_get_session_review, \
+            patch('backend.database.catalog.get_session') as mock_get_session_catalog:
         mock_session_instance = MagicMock(spec=Session)
 
         mock_get_session_db_database.return_value = mock_session_instance
         mock_get_session_auth.return_value = mock_session_instance
         mock_get_session_review.return_value = mock_session_instance
+        mock_get_session_catalog.return_value = mock_session_instance
 
         mock_session_instance.add = MagicMock()
         mock_session_instance.commit = MagicMock()
@@ -55,3 +58,12 @@ def sample_review(sample_user):
         created_at=datetime(2024, 1, 1),
         user=sample_user
     )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_omdb_client(monkeypatch):
+    """Каждый тест получает свой клиент OMDb без пользовательского кэша на диске и в памяти."""
+    client = OmdbClient()
+    monkeypatch.setattr('backend.api.omdb_client.default_client', client)
+    yield client
+    client.close()
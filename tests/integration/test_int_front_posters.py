@@ -0,0 +1,120 @@
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QColor, QImage, QPixmapCache
+from PyQt6.QtWidgets import QApplication, QLabel
+from frontend.poster_loader import POSTER_HEIGHT, PosterLoader, _poster_key
+
+POSTER_URL = "https://example.com/poster.jpg"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Фикстура для создания QApplication"""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def poster_loader(qapp, tmp_path):
+    QPixmapCache.clear()
+    loader = PosterLoader(cache_dir=tmp_path / "posters", max_workers=2)
+    yield loader
+    loader.shutdown()
+
+
+def _png_bytes(width=300, height=450):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor(200, 30, 30))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+def _poster_response(content):
+    response = MagicMock(content=content)
+    response.raise_for_status.return_value = None
+    return response
+
+
+def _wait_for_posters(loader, qapp, timeout=5.0):
+    """Доставляет сигналы пула потоков в GUI-поток, пока все постеры не будут обработаны."""
+    deadline = time.monotonic() + timeout
+    while loader.pending() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    qapp.processEvents()
+
+
+def test_poster_shows_placeholder_then_scaled_thumbnail(poster_loader, qapp):
+    poster_loader.session.get = MagicMock(return_value=_poster_response(_png_bytes()))
+    label = QLabel()
+
+    poster_loader.load(POSTER_URL, label)
+    assert label.pixmap().cacheKey() == poster_loader.placeholder.cacheKey()
+
+    _wait_for_posters(poster_loader, qapp)
+
+    assert label.pixmap().cacheKey() != poster_loader.placeholder.cacheKey()
+    assert label.pixmap().height() == POSTER_HEIGHT
+    assert len(list(poster_loader.cache_dir.glob("*.png"))) == 1
+
+
+def test_same_poster_is_downloaded_once_and_served_from_memory(poster_loader, qapp):
+    poster_loader.session.get = MagicMock(return_value=_poster_response(_png_bytes()))
+    first, second = QLabel(), QLabel()
+
+    poster_loader.load(POSTER_URL, first)
+    poster_loader.load(POSTER_URL, second)
+    _wait_for_posters(poster_loader, qapp)
+
+    third = QLabel()
+    poster_loader.load(POSTER_URL, third)
+
+    poster_loader.session.get.assert_called_once()
+    assert second.pixmap().height() == POSTER_HEIGHT
+    assert third.pixmap().cacheKey() == first.pixmap().cacheKey()
+
+
+def test_poster_is_read_from_disk_cache(poster_loader, qapp, tmp_path):
+    poster_loader.session.get = MagicMock(return_value=_poster_response(_png_bytes()))
+    poster_loader.load(POSTER_URL, QLabel())
+    _wait_for_posters(poster_loader, qapp)
+
+    QPixmapCache.clear()
+    reloaded = PosterLoader(cache_dir=poster_loader.cache_dir, max_workers=1)
+    reloaded.session.get = MagicMock()
+    label = QLabel()
+    reloaded.load(POSTER_URL, label)
+    _wait_for_posters(reloaded, qapp)
+    reloaded.shutdown()
+
+    reloaded.session.get.assert_not_called()
+    assert label.pixmap().height() == POSTER_HEIGHT
+
+
+def test_broken_poster_shows_missing_poster(poster_loader, qapp, capsys):
+    poster_loader.session.get = MagicMock(return_value=_poster_response(b"not an image"))
+    label = QLabel()
+
+    poster_loader.load(POSTER_URL, label)
+    _wait_for_posters(poster_loader, qapp)
+
+    assert label.pixmap().cacheKey() == poster_loader.missing.cacheKey()
+    assert "Не удалось декодировать постер" in capsys.readouterr().err
+
+
+def test_unreachable_poster_shows_missing_poster(poster_loader, qapp, capsys):
+    poster_loader.session.get = MagicMock(side_effect=requests.exceptions.ConnectionError("unreachable"))
+    label = QLabel()
+
+    poster_loader.load(POSTER_URL, label)
+    _wait_for_posters(poster_loader, qapp)
+
+    assert label.pixmap().cacheKey() == poster_loader.missing.cacheKey()
+    assert QPixmapCache.find(_poster_key(POSTER_URL)) is None
+    assert "Ошибка загрузки постера" in capsys.readouterr().err
@@ -0,0 +1,405 @@
+import threading
+import time
+import pytest
+from dataclasses import replace
+from unittest.mock import patch
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+from backend.api.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from backend.api.movie_records import MovieDetails, MovieFullDetails, MovieSummary
+from backend.api.omdb_client import OmdbSearchError
+from frontend.movie_details_dialog import MovieDetailsDialog
+from frontend.search_worker import DetailLoader
+from frontend.tabs.search_tab import SearchTab
+
+
+class FakeCursor:
+    """Курсор поиска, отдающий заранее заданные порции результатов."""
+
+    def __init__(self, title, batches, error=None, truncated=False):
+        self.title = title
+        self.batches = list(batches)
+        self.error = error
+        self.truncated = truncated
+
+    @property
+    def has_more(self):
+        return bool(self.batches)
+
+    def fetch_more(self, on_progress=None, cancel_event=None, on_candidates=None):
+        if self.error is not None:
+            raise self.error
+        batch = self.batches.pop(0)
+        if on_candidates is not None:
+            on_candidates([replace(movie, details=None) for movie in batch])
+        for index, movie in enumerate(batch):
+            if on_progress is not None:
+                on_progress(index + 1, len(batch))
+            yield movie
+
+    def fetch_candidates(self, cancel_event=None):
+        if self.error is not None:
+            raise self.error
+        return [replace(movie, details=None) for movie in self.batches.pop(0)]
+
+
+def _movie(imdb_id, **details):
+    return MovieSummary(imdb_id=imdb_id, title=f"Movie {imdb_id}", details=MovieDetails(**details))
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Фикстура для создания QApplication"""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _close_tab(tab):
+    tab.cancel_search(wait=True)
+    tab.poster_loader.shutdown()
+    tab.detail_loader.shutdown()
+    tab.update_notifier.detach()
+    tab.close()
+
+
+@pytest.fixture
+def search_tab(qapp):
+    """Вкладка с загрузкой деталей вместе с порцией результатов (без ленивого режима)."""
+    tab = SearchTab(1, lazy_details=False)
+    yield tab
+    _close_tab(tab)
+
+
+@pytest.fixture
+def lazy_search_tab(qapp):
+    tab = SearchTab(1)
+    tab.resize(800, 760)
+    tab.show()
+    qapp.processEvents()
+    yield tab
+    _close_tab(tab)
+
+
+def _finish_search(tab, qapp):
+    """Дожидается фонового поиска и доставляет его сигналы в GUI-поток."""
+    worker = tab.search_worker
+    if worker is not None:
+        worker.wait(5000)
+    qapp.processEvents()
+
+
+def test_search_results_are_added_as_they_arrive(search_tab, qapp):
+    """Результаты поиска появляются в списке по одному, прогресс передаётся во вкладку"""
+    cursor = FakeCursor("Batman", [[_movie("tt0"), _movie("tt1")]])
+    progress = []
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor):
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        search_tab.search_worker.progress.connect(lambda done, total: progress.append(done))
+        _finish_search(search_tab, qapp)
+
+    assert search_tab.results_list.count() == 2
+    assert [movie.imdb_id for movie in search_tab.current_search_results] == ["tt0", "tt1"]
+    assert "Найдено результатов: 2" in search_tab.status_label.text()
+    assert search_tab.load_more_button.isEnabled() is False
+
+
+def test_load_more_appends_next_batch(search_tab, qapp):
+    """Кнопка «Загрузить ещё» догружает следующую порцию, не очищая список"""
+    cursor = FakeCursor("Batman", [[_movie("tt0")], [_movie("tt1"), _movie("tt2")]])
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor) as mock_create:
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+        assert search_tab.load_more_button.isEnabled() is True
+
+        search_tab.load_more_button.click()
+        _finish_search(search_tab, qapp)
+
+    mock_create.assert_called_once_with("Batman")
+    assert [movie.imdb_id for movie in search_tab.current_search_results] == ["tt0", "tt1", "tt2"]
+    assert "Найдено результатов: 3" in search_tab.status_label.text()
+    assert search_tab.load_more_button.isEnabled() is False
+
+
+def test_search_failure_shows_error(search_tab, qapp):
+    """Ошибка первой страницы выдачи показывает сообщение об ошибке соединения"""
+    cursor = FakeCursor("Batman", [], error=OmdbSearchError("API Search Error"))
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor), \
+            patch('frontend.tabs.search_tab.show_error_message') as mock_error:
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+
+    mock_error.assert_called_once()
+    assert search_tab.status_label.text() == "Ошибка соединения с API"
+
+
+def test_open_circuit_fails_search_without_dialog(search_tab, qapp):
+    """Пока OMDb недоступен, поиск сразу завершается сообщением в статусе, а не окном с ошибкой"""
+    cursor = FakeCursor("Batman", [], error=OmdbSearchError("OMDb недоступен, повторная попытка через 30 с"))
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor), \
+            patch('frontend.tabs.search_tab.circuit_state', return_value=(OPEN, 30.0)), \
+            patch('frontend.tabs.search_tab.show_error_message') as mock_error:
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+        search_tab.show_omdb_state(OPEN)
+
+    mock_error.assert_not_called()
+    assert "OMDb недоступен" in search_tab.status_label.text()
+    assert "повторная проверка через 30 с" in search_tab.omdb_state_label.text()
+    assert search_tab.omdb_state_label.isHidden() is False
+
+
+def test_circuit_state_changes_reach_search_tab(search_tab, qapp):
+    """Смена состояния предохранителя из фонового потока доходит до вкладки поиска"""
+    assert search_tab.omdb_state_label.isHidden() is True
+
+    search_tab.update_notifier._on_circuit_state(HALF_OPEN)
+    qapp.processEvents()
+    assert search_tab.omdb_state_label.text() == "Проверяем доступность OMDb..."
+
+    search_tab.update_notifier._on_circuit_state(CLOSED)
+    qapp.processEvents()
+    assert search_tab.omdb_state_label.isHidden() is True
+
+
+
+def test_open_circuit_countdown_refreshes_and_probes_when_due(search_tab, qapp):
+    """Пока OMDb недоступен, отсчёт обновляется по таймеру, а по его истечении уходит пробный запрос"""
+    with patch('frontend.tabs.search_tab.probe_omdb') as mock_probe:
+        with patch('frontend.tabs.search_tab.circuit_state', return_value=(OPEN, 12.0)):
+            search_tab.show_omdb_state(OPEN)
+        assert search_tab.circuit_timer.isActive() is True
+
+        with patch('frontend.tabs.search_tab.circuit_state', return_value=(OPEN, 5.0)):
+            search_tab.refresh_omdb_state()
+        assert "повторная проверка через 5 с" in search_tab.omdb_state_label.text()
+        mock_probe.assert_not_called()
+
+        with patch('frontend.tabs.search_tab.circuit_state', return_value=(OPEN, 0.0)):
+            search_tab.refresh_omdb_state()
+        search_tab._probe_thread.join(timeout=1)
+        mock_probe.assert_called_once()
+
+        with patch('frontend.tabs.search_tab.circuit_state', return_value=(CLOSED, 0.0)):
+            search_tab.refresh_omdb_state()
+    assert search_tab.circuit_timer.isActive() is False
+    assert search_tab.omdb_state_label.isHidden() is True
+
+def test_new_search_ignores_results_of_cancelled_one(search_tab, qapp):
+    """Результаты отменённого поиска не попадают в список"""
+    with patch('frontend.tabs.search_tab.create_search_cursor',
+               side_effect=lambda title: FakeCursor(title, [[_movie(f"tt-{title}")]])):
+        search_tab.search_input.setText("First")
+        search_tab.perform_search()
+        first_worker = search_tab.search_worker
+        search_tab.search_input.setText("Second")
+        search_tab.perform_search()
+        first_worker.wait(5000)
+        _finish_search(search_tab, qapp)
+
+    assert [movie.imdb_id for movie in search_tab.current_search_results] == ["tt-Second"]
+
+
+def test_revalidated_details_update_visible_card(search_tab, qapp):
+    """Детали, обновлённые в фоне, перерисовывают карточку фильма"""
+    cursor = FakeCursor("Batman", [[_movie("tt0", rating=7.0)]])
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor):
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+
+    search_tab.update_notifier._on_update('details', 'tt0', {"imdbID": "tt0", "imdbRating": "7.4", "Plot": "New"})
+    qapp.processEvents()
+
+    item = search_tab.results_list.item(0)
+    assert item.data(Qt.ItemDataRole.UserRole).rating == 7.4
+    assert search_tab.current_search_results[0].details.plot == "New"
+
+
+def test_candidates_are_shown_before_details_and_replaced(search_tab, qapp):
+    """Названия из выдачи показываются сразу, а затем заменяются полными карточками на тех же местах"""
+    pending = MovieSummary(imdb_id="tt2", title="Movie tt2", year_label="2005")
+
+    class CandidatesCursor(FakeCursor):
+        def fetch_more(self, on_progress=None, cancel_event=None, on_candidates=None):
+            on_candidates([MovieSummary(imdb_id="tt0", title="Movie tt0"),
+                           MovieSummary(imdb_id="tt1", title="Movie tt1"), pending])
+            yield from super().fetch_more(on_progress, cancel_event)
+
+    cursor = CandidatesCursor("Batman", [[_movie("tt1", genre="Drama"), _movie("tt0", genre="Action")]])
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor):
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+
+    movies = [search_tab.results_list.item(row).data(Qt.ItemDataRole.UserRole)
+              for row in range(search_tab.results_list.count())]
+    assert [movie.imdb_id for movie in movies] == ["tt0", "tt1", "tt2"]
+    assert [movie.details.genre for movie in movies[:2]] == ["Action", "Drama"]
+    assert movies[2] is pending
+    assert "Найдено результатов: 2" in search_tab.status_label.text()
+
+
+def test_typeahead_debounces_keystrokes(search_tab, qapp):
+    """В режиме поиска при вводе серия нажатий приводит к одному поиску по последнему тексту"""
+    search_tab.typeahead_checkbox.setChecked(True)
+
+    with patch('frontend.tabs.search_tab.create_search_cursor',
+               side_effect=lambda title: FakeCursor(title, [[_movie(f"tt-{title}")]])) as mock_create:
+        for text in ("Ba", "Bat", "Batm", "Batman"):
+            search_tab.search_input.setText(text)
+            search_tab.search_input.textEdited.emit(text)
+        assert search_tab.typeahead_timer.isActive()
+        search_tab.typeahead_timer.timeout.emit()
+        _finish_search(search_tab, qapp)
+
+    mock_create.assert_called_once_with("Batman")
+    assert [movie.imdb_id for movie in search_tab.current_search_results] == ["tt-Batman"]
+
+
+def test_typeahead_cancels_superseded_search(search_tab, qapp):
+    """Новое нажатие отменяет уже запущенный поиск вместе с его ожидающими запросами"""
+    search_tab.typeahead_checkbox.setChecked(True)
+
+    with patch('frontend.tabs.search_tab.create_search_cursor',
+               side_effect=lambda title: FakeCursor(title, [[_movie(f"tt-{title}")]])):
+        search_tab.search_input.setText("Bat")
+        search_tab.perform_typeahead_search()
+        first_worker = search_tab.search_worker
+        search_tab.search_input.setText("Batma")
+        search_tab.search_input.textEdited.emit("Batma")
+
+        assert first_worker.is_cancelled()
+        assert search_tab.search_worker is None
+
+        search_tab.typeahead_timer.timeout.emit()
+        first_worker.wait(5000)
+        _finish_search(search_tab, qapp)
+
+    assert [movie.imdb_id for movie in search_tab.current_search_results] == ["tt-Batma"]
+
+
+def test_typeahead_is_off_by_default(search_tab):
+    """Без включённого режима ввод текста не запускает поиск"""
+    search_tab.search_input.textEdited.emit("Batman")
+
+    assert not search_tab.typeahead_timer.isActive()
+    assert search_tab.search_worker is None
+
+
+def test_truncated_search_reports_partial_results(search_tab, qapp):
+    """Поиск, остановленный по сроку, показывает найденное и предлагает догрузить остальное"""
+    cursor = FakeCursor("Batman", [[_movie("tt0")], [_movie("tt1")]], truncated=True)
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor):
+        search_tab.search_input.setText("Batman")
+        search_tab.perform_search()
+        _finish_search(search_tab, qapp)
+
+    assert "Найдено результатов: 1" in search_tab.status_label.text()
+    assert "остановлен по времени" in search_tab.status_label.text()
+    assert search_tab.load_more_button.isEnabled() is True
+
+
+def _dialog_rows(dialog):
+    layout = dialog.form_layout
+    return {layout.itemAt(row, layout.ItemRole.LabelRole).widget().text():
+            layout.itemAt(row, layout.ItemRole.FieldRole).widget().text()
+            for row in range(layout.rowCount())}
+
+
+def test_details_dialog_loads_full_details_on_open(search_tab, qapp):
+    """Карточка фильма запрашивает полные детали только при открытии"""
+    full = MovieFullDetails(plot="Long plot.", awards="Won 2 Oscars.", ratings=(("Rotten Tomatoes", "84%"),))
+
+    with patch('frontend.search_worker.get_full_details', return_value=full) as mock_full:
+        dialog = MovieDetailsDialog(_movie("tt1", plot="Short."), search_tab)
+        dialog.worker.wait(5000)
+        qapp.processEvents()
+
+    mock_full.assert_called_once_with("tt1")
+    rows = _dialog_rows(dialog)
+    assert rows["Описание:"] == "Long plot."
+    assert rows["Награды:"] == "Won 2 Oscars."
+    assert rows["Оценки:"] == "Rotten Tomatoes: 84%"
+    assert dialog.status_label.isHidden() is True
+    dialog.deleteLater()
+
+
+def test_details_dialog_falls_back_to_short_plot(search_tab, qapp):
+    """Если полные детали не загрузились, карточка показывает краткое описание из выдачи"""
+    with patch('frontend.search_worker.get_full_details', return_value=None):
+        dialog = MovieDetailsDialog(_movie("tt1", plot="Short."), search_tab)
+        dialog.worker.wait(5000)
+        qapp.processEvents()
+
+    assert _dialog_rows(dialog) == {"Описание:": "Short."}
+    assert "краткое описание" in dialog.status_label.text()
+    dialog.deleteLater()
+
+
+def _settle_lazy_details(tab, qapp, timeout=5.0):
+    """Синхронизирует видимую область и ждёт, пока загрузятся запрошенные для неё детали."""
+    tab.sync_viewport()
+    deadline = time.monotonic() + timeout
+    while tab.detail_loader.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    qapp.processEvents()
+
+
+def test_lazy_search_loads_details_only_near_viewport(lazy_search_tab, qapp):
+    """В ленивом режиме детали запрашиваются только для видимых строк и строк рядом с ними"""
+    movies = [_movie(f"tt{i:02}", plot=f"Plot {i}") for i in range(15)]
+    cursor = FakeCursor("Batman", [movies])
+    requested = []
+    lock = threading.Lock()
+
+    def fake_details(imdb_id):
+        with lock:
+            requested.append(imdb_id)
+        return {"Response": "True", "imdbID": imdb_id, "Plot": f"Plot of {imdb_id}"}
+
+    with patch('frontend.tabs.search_tab.create_search_cursor', return_value=cursor), \
+            patch('frontend.search_worker.get_movie_by_id', side_effect=fake_details):
+        lazy_search_tab.search_input.setText("Batman")
+        lazy_search_tab.perform_search()
+        _finish_search(lazy_search_tab, qapp)
+
+        assert lazy_search_tab.results_list.count() == 15
+        assert "Найдено результатов: 15" in lazy_search_tab.status_label.text()
+        _settle_lazy_details(lazy_search_tab, qapp)
+
+        first_batch = set(requested)
+        assert 0 < len(first_batch) < 15
+        assert first_batch == {f"tt{i:02}" for i in range(len(first_batch))}
+        top = lazy_search_tab.results_list.item(0).data(Qt.ItemDataRole.UserRole)
+        assert top.details.plot == "Plot of tt00"
+
+        lazy_search_tab.results_list.scrollToBottom()
+        _settle_lazy_details(lazy_search_tab, qapp)
+
+    assert "tt14" in requested
+    assert len(requested) < 15
+    assert len(requested) == len(set(requested))
+    bottom = lazy_search_tab.results_list.item(14).data(Qt.ItemDataRole.UserRole)
+    assert bottom.details.plot == "Plot of tt14"
+
+
+def test_detail_loader_drops_requests_of_rows_scrolled_away(qapp):
+    """Ещё не начатые заявки для строк, ушедших из поля зрения, отменяются"""
+    loader = DetailLoader(max_workers=0)
+    loader.prioritize({"tt00": 0, "tt01": 1})
+
+    loader.prioritize({"tt09": 0, "tt01": 2})
+
+    assert loader._pending == {"tt09": 0, "tt01": 2}
+    loader.shutdown()
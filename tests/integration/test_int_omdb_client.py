@@ -60,9 +60,9 @@ def test_search_movie_by_title_integration(requests_mock):
 
     assert results is not None
     assert len(results) == 2
-    assert results[0]["Title"] == "Batman Begins"
-    assert results[0]["imdbRating"] == "8.2"
-    assert results[1]["Title"] == "Batman v Superman"
-    assert results[1]["imdbRating"] == "6.4"
+    assert results[0].title == "Batman Begins"
+    assert results[0].rating == 8.2
+    assert results[1].title == "Batman v Superman"
+    assert results[1].rating == 6.4
 
     assert requests_mock.call_count == 3
@@ -0,0 +1,113 @@
+import time
+import pytest
+import requests
+from backend.api.omdb_client import OmdbClient
+from backend.api.omdb_stub import LatencyModel, OmdbStub, StubServer
+
+
+@pytest.fixture
+def stub_client():
+    """Клиент OMDb, направленный на заглушку с заданным поведением."""
+    servers, clients = [], []
+
+    def factory(**stub_options):
+        server = StubServer(OmdbStub(seed=1, **stub_options)).start()
+        client = OmdbClient(api_key='test_key', base_url=server.url, backoff_factor=0.01)
+        servers.append(server)
+        clients.append(client)
+        return client, server.stub
+
+    yield factory
+    for client in clients:
+        client.close()
+    for server in servers:
+        server.stop()
+
+
+@pytest.mark.integration
+def test_search_against_stub_pages_through_fixtures(stub_client):
+    client, stub = stub_client()
+
+    results = client.search_movie_by_title("Batman")
+
+    assert len(results) == 15
+    assert results[0].title == "Batman Begins"
+    assert results[1].rating == 9.0
+    assert stub.stats['search'] == 2
+    assert stub.stats['details'] == 15
+
+
+@pytest.mark.integration
+def test_stub_filters_by_year_and_type(stub_client):
+    client, _ = stub_client()
+    assert [r.imdb_id for r in client.search_movie_by_title("batman", type_filter='series')] == ["tt0059968"]
+    assert [r.title for r in client.search_movie_by_title("batman", year='2008')] == ["The Dark Knight"]
+
+
+@pytest.mark.integration
+def test_stub_details_not_found_and_full_plot(stub_client):
+    client, stub = stub_client()
+    assert client.get_movie_by_id("tt0000000") is None
+    assert stub.details("tt1375666", plot='full')['Plot'].startswith("Dom Cobb")
+
+
+@pytest.mark.integration
+def test_client_retries_injected_server_errors(stub_client):
+    client, stub = stub_client(error_rate=0.5)
+    client.max_retries = 10
+
+    movie = client.get_movie_by_id("tt0468569")
+
+    assert movie['Title'] == "The Dark Knight"
+    assert stub.stats['requests'] == stub.stats['errors'] + 1
+
+
+@pytest.mark.integration
+def test_stub_throttles_requests_over_rate_limit(stub_client):
+    client, stub = stub_client(rate_limit=2)
+    statuses = [requests.get(client.base_url, params={'apikey': 'k', 'i': 'tt0468569'}).status_code
+                for _ in range(4)]
+    assert statuses.count(429) >= 1
+    assert stub.stats['throttled'] == statuses.count(429)
+
+
+@pytest.mark.integration
+def test_stub_injects_latency(stub_client):
+    client, _ = stub_client(latency='fixed:0.05')
+    started = time.perf_counter()
+    client.get_movie_by_id("tt0468569")
+    assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.integration
+def test_stub_serves_synthetic_results_for_unknown_queries(stub_client):
+    client, stub = stub_client(synthetic_results=40)
+    cursor_results = client.search_movie_by_title("Unknown Film", min_rating=5.0)
+    assert cursor_results
+    assert all(5.0 <= result.rating <= 10.0 for result in cursor_results)
+    assert stub.search("unknown film", page='4')['Response'] == "True"
+    assert stub.search("unknown film", page='5')['Response'] == "False"
+
+
+def test_latency_model_parses_distributions():
+    assert LatencyModel('').kind == 'fixed'
+    assert LatencyModel('uniform:0.01,0.02').args == (0.01, 0.02)
+    with pytest.raises(ValueError):
+        LatencyModel('gauss:1')
+    with pytest.raises(ValueError):
+        LatencyModel('uniform:0.1')
+
+
+@pytest.mark.integration
+def test_record_fixtures_keeps_full_detail_responses(tmp_path, monkeypatch):
+    from backend.api.omdb_stub import FIXTURES_DIR, _load_fixture, record_fixtures
+
+    monkeypatch.setattr('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+    with StubServer(OmdbStub(seed=1)) as server:
+        recorded = record_fixtures(["Batman"], tmp_path, pages=1, base_url=server.url)
+
+    details = _load_fixture(tmp_path, "details.json")
+    original = _load_fixture(FIXTURES_DIR, "details.json")
+    assert recorded == len(details) == 10
+    assert all(details[imdb_id] == original[imdb_id] for imdb_id in details)
+    assert {"Rated", "Country", "Language"} <= set(next(iter(details.values())))
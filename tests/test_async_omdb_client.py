@@ -0,0 +1,156 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from backend.api.omdb_client import AsyncOmdbClient
+
+
+DETAILS = {
+    "tt001": {"Response": "True", "imdbID": "tt001", "Title": "First", "imdbRating": "8.1", "Plot": "P1"},
+    "tt002": {"Response": "True", "imdbID": "tt002", "Title": "Second", "imdbRating": "6.0", "Plot": "P2"},
+}
+
+
+def _run_with_server(handler, scenario):
+    """Поднимает локальный HTTP-сервер с обработчиком и выполняет сценарий с клиентом."""
+    async def main():
+        app = web.Application()
+        app.router.add_get('/', handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with AsyncOmdbClient(api_key='test_key', base_url=str(server.make_url('/')),
+                                       max_concurrency=4) as client:
+                return await scenario(client)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+async def _omdb_handler(request):
+    if 'i' in request.query:
+        await asyncio.sleep(0.01)
+        return web.json_response(DETAILS.get(request.query['i'], {"Response": "False", "Error": "Incorrect IMDb ID."}))
+    return web.json_response({
+        "Response": "True",
+        "Search": [{"Title": "First", "imdbID": "tt001"}, {"Title": "Second", "imdbID": "tt002"}],
+        "totalResults": "2"
+    })
+
+
+def test_async_get_movie_by_id():
+    movie = _run_with_server(_omdb_handler, lambda client: client.get_movie_by_id("tt001"))
+    assert movie["Title"] == "First"
+
+
+def test_async_get_movie_by_id_not_found(capsys):
+    movie = _run_with_server(_omdb_handler, lambda client: client.get_movie_by_id("tt999"))
+    assert movie is None
+    assert "OMDb API Error (i=tt999): Incorrect IMDb ID." in capsys.readouterr().err
+
+
+def test_async_search_movie_by_title_enriches_in_order():
+    results = _run_with_server(_omdb_handler, lambda client: client.search_movie_by_title("Test"))
+    assert [result.imdb_id for result in results] == ["tt001", "tt002"]
+    assert results[0].rating == 8.1
+    assert results[1].details.plot == "P2"
+
+
+def test_async_search_movie_by_title_rating_filter():
+    results = _run_with_server(_omdb_handler,
+                               lambda client: client.search_movie_by_title("Test", min_rating=7.0))
+    assert [result.imdb_id for result in results] == ["tt001"]
+
+
+def test_async_many_lookups_share_bounded_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def counting_handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return web.json_response({"Response": "True", "imdbID": request.query['i']})
+
+    async def scenario(client):
+        return await asyncio.gather(*(client.get_movie_by_id(f"tt{i}") for i in range(12)))
+
+    movies = _run_with_server(counting_handler, scenario)
+    assert [movie['imdbID'] for movie in movies] == [f"tt{i}" for i in range(12)]
+    assert 1 < peak <= 4
+
+
+def test_async_retries_server_errors():
+    calls = 0
+
+    async def flaky_handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return web.Response(status=503)
+        return web.json_response(DETAILS["tt001"])
+
+    with patch('backend.api.omdb_client.asyncio.sleep', new=AsyncMock()):
+        movie = _run_with_server(flaky_handler, lambda client: client.get_movie_by_id("tt001"))
+    assert movie["Title"] == "First"
+    assert calls == 2
+
+
+def test_async_no_api_key(capsys, monkeypatch):
+    monkeypatch.setattr('backend.api.omdb_client.OMDB_API_KEY', None)
+
+    async def scenario():
+        async with AsyncOmdbClient() as client:
+            return await client.search_movie_by_title("Test")
+
+    assert asyncio.run(scenario()) is None
+    assert "API ключ OMDb не настроен." in capsys.readouterr().err
+
+
+def test_async_coalesces_duplicate_lookups():
+    calls = 0
+
+    async def counting_handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return web.json_response(DETAILS["tt001"])
+
+    async def scenario(client):
+        movies = await asyncio.gather(*(client.get_movie_by_id("tt001") for _ in range(5)))
+        return movies, client.inflight.stats()
+
+    movies, stats = _run_with_server(counting_handler, scenario)
+    assert [movie["Title"] for movie in movies] == ["First"] * 5
+    assert calls == 1
+    assert stats['deduplicated'] == 4
+
+
+def test_async_search_deadline_returns_partial_results():
+    async def slow_second_handler(request):
+        if request.query.get('i') == "tt002":
+            await asyncio.sleep(1)
+        return await _omdb_handler(request)
+
+    results = _run_with_server(slow_second_handler,
+                               lambda client: client.search_movie_by_title("Test", timeout=0.3))
+
+    assert [result.imdb_id for result in results] == ["tt001"]
+    assert results.truncated is True
+
+
+def test_async_search_merges_pages_in_order_without_duplicates():
+    async def paged_handler(request):
+        if 'i' in request.query:
+            return await _omdb_handler(request)
+        page = request.query['page']
+        search = [{"Title": "First", "imdbID": "tt001"}] if page == '1' else \
+            [{"Title": "First", "imdbID": "tt001"}, {"Title": "Second", "imdbID": "tt002"}]
+        return web.json_response({"Response": "True", "Search": search, "totalResults": "15"})
+
+    results = _run_with_server(paged_handler, lambda client: client.search_movie_by_title("Test"))
+
+    assert [result.imdb_id for result in results] == ["tt001", "tt002"]
@@ -0,0 +1,155 @@
+import pytest
+from backend.api.cache import MISSING, DiskCache, MemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def disk_cache(tmp_path, clock):
+    cache = DiskCache(tmp_path / "omdb.sqlite3", max_entries=3, clock=clock)
+    yield cache
+    cache.close()
+
+
+def test_disk_cache_get_set(disk_cache):
+    assert disk_cache.get("i=tt1") is None
+    disk_cache.set("i=tt1", {"Title": "Фильм"}, ttl=60)
+    assert disk_cache.get("i=tt1") == {"Title": "Фильм"}
+
+
+def test_disk_cache_entry_expires(disk_cache, clock):
+    disk_cache.set("i=tt1", {"Title": "A"}, ttl=60)
+    clock.now += 61
+    assert disk_cache.get("i=tt1") is None
+
+
+def test_disk_cache_persists_between_instances(tmp_path, clock):
+    first = DiskCache(tmp_path / "omdb.sqlite3", clock=clock)
+    first.set("i=tt1", {"Title": "A"}, ttl=60)
+    first.close()
+
+    second = DiskCache(tmp_path / "omdb.sqlite3", clock=clock)
+    assert second.get("i=tt1") == {"Title": "A"}
+    second.close()
+
+
+def test_disk_cache_evicts_least_recently_used(disk_cache, clock):
+    for index in range(3):
+        disk_cache.set(f"i=tt{index}", {"index": index}, ttl=60)
+        clock.now += 1
+    disk_cache.get("i=tt0")
+    clock.now += 1
+
+    disk_cache.set("i=tt3", {"index": 3}, ttl=60)
+
+    assert disk_cache.get("i=tt1") is None
+    assert disk_cache.get("i=tt0") == {"index": 0}
+    assert disk_cache.stats()['entries'] == 3
+
+
+def test_disk_cache_evicts_expired_first(disk_cache, clock):
+    disk_cache.set("i=old", {}, ttl=1)
+    disk_cache.set("i=tt1", {}, ttl=60)
+    disk_cache.set("i=tt2", {}, ttl=60)
+    clock.now += 2
+
+    disk_cache.set("i=tt3", {}, ttl=60)
+
+    assert disk_cache.stats()['entries'] == 3
+    assert disk_cache.get("i=tt1") == {}
+
+
+def test_disk_cache_purge_and_stats(disk_cache, clock):
+    disk_cache.set("i=tt1", {"Title": "A"}, ttl=1)
+    disk_cache.set("i=tt2", {"Title": "B"}, ttl=60)
+    clock.now += 2
+
+    stats = disk_cache.stats()
+    assert stats['entries'] == 2
+    assert stats['expired'] == 1
+    assert stats['size_bytes'] > 0
+
+    assert disk_cache.purge(expired_only=True) == 1
+    assert disk_cache.purge() == 1
+    assert disk_cache.stats()['entries'] == 0
+
+
+def test_memory_cache_hit_and_miss_counters(clock):
+    cache = MemoryCache(clock=clock)
+    assert cache.get("tt1") is MISSING
+    cache.set("tt1", {"Title": "A"})
+    assert cache.get("tt1") == {"Title": "A"}
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_memory_cache_negative_entries_use_short_ttl(clock):
+    cache = MemoryCache(ttl=600, negative_ttl=60, clock=clock)
+    cache.set_negative("tt1")
+    cache.set("tt2", {"Title": "B"})
+    assert cache.get("tt1") is None
+    assert cache.stats()['negative_hits'] == 1
+
+    clock.now += 61
+    assert cache.get("tt1") is MISSING
+    assert cache.get("tt2") == {"Title": "B"}
+
+
+def test_memory_cache_evicts_least_recently_used(clock):
+    cache = MemoryCache(max_entries=2, clock=clock)
+    cache.set("tt1", 1)
+    cache.set("tt2", 2)
+    cache.get("tt1")
+    cache.set("tt3", 3)
+
+    assert cache.get("tt2") is MISSING
+    assert cache.get("tt1") == 1
+    assert cache.stats()['evictions'] == 1
+
+
+def test_disk_cache_iter_values_by_prefix(disk_cache, clock):
+    disk_cache.set("i=tt1&plot=short", {"imdbID": "tt1"}, ttl=60)
+    disk_cache.set("i=tt2&plot=short", {"imdbID": "tt2"}, ttl=1)
+    disk_cache.set("page=1&s=batman", {"Search": []}, ttl=60)
+    clock.now += 2
+
+    assert list(disk_cache.iter_values("i=")) == [{"imdbID": "tt1"}]
+
+
+def test_disk_cache_marks_entries_stale_after_soft_expiry(disk_cache, clock):
+    disk_cache.set("i=tt1", {"Title": "A"}, ttl=100, stale_after=10)
+
+    assert disk_cache.get_entry("i=tt1") == ({"Title": "A"}, False)
+    clock.now += 11
+    assert disk_cache.get_entry("i=tt1") == ({"Title": "A"}, True)
+    assert disk_cache.stats()['stale'] == 1
+    clock.now += 90
+    assert disk_cache.get_entry("i=tt1") is None
+
+
+def test_disk_cache_upgrades_schema_without_stale_column(tmp_path, clock):
+    import sqlite3
+    path = tmp_path / "old.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                       " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+    connection.execute("INSERT INTO entries VALUES ('i=tt1', '{\"Title\": \"A\"}', 2000, 1000)")
+    connection.commit()
+    connection.close()
+
+    cache = DiskCache(path, clock=clock)
+    assert cache.get_entry("i=tt1") == ({"Title": "A"}, False)
+    cache.close()
@@ -0,0 +1,168 @@
+import io
+from unittest.mock import MagicMock
+from sqlalchemy import exc as sqlalchemy_exc
+from sqlalchemy.dialects import postgresql
+from backend.api.omdb_client import OmdbClient, SearchCursor
+from backend.database.catalog import (MovieCatalog, _CopyStream, build_search_statement, iter_imdb_basics_rows,
+                                      iter_omdb_rows)
+from backend.models.movie import Movie
+
+BASICS_TSV = (
+    "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres\n"
+    "tt0372784\tmovie\tBatman Begins\tBatman Begins\t0\t2005\t\\N\t140\tAction,Crime,Drama\n"
+    "tt0059968\ttvSeries\tBatman\tBatman\t0\t1966\t1968\t25\tAction,Adventure\n"
+    "tt0000001\tmovie\t\"Quoted\" Title\tQuoted\t1\t1999\t\\N\t90\tDrama\n"
+    "tt0000002\tvideoGame\tBatman: Arkham\tBatman: Arkham\t0\t2009\t\\N\t\\N\tAction\n"
+)
+
+
+def _catalog_result(imdb_id, title="Batman", plot="Plot"):
+    return Movie(imdb_id=imdb_id, title=title, year="2005", type_="movie", imdb_rating=8.2, plot=plot).to_summary()
+
+
+def _omdb_get(search_ids):
+    def get(url, params, timeout):
+        if 'i' in params:
+            return MagicMock(status_code=200, json=MagicMock(return_value={
+                "Response": "True", "imdbID": params['i'], "imdbRating": "7.0", "Plot": "From OMDb"}))
+        return MagicMock(status_code=200, json=MagicMock(return_value={
+            "Response": "True", "Search": [{"imdbID": imdb_id} for imdb_id in search_ids],
+            "totalResults": str(len(search_ids))}))
+    return get
+
+
+def test_imdb_basics_rows_map_types_and_skip_adult_titles():
+    rows = list(iter_imdb_basics_rows(io.StringIO(BASICS_TSV)))
+
+    assert [row[0] for row in rows] == ["tt0372784", "tt0059968"]
+    assert rows[0][1:4] == ("Batman Begins", "2005", "movie")
+    assert rows[0][6:8] == ("140 min", "Action, Crime, Drama")
+    assert rows[1][2:4] == ("1966–1968", "series")
+
+
+def test_omdb_rows_parse_numbers_and_drop_placeholders():
+    rows = list(iter_omdb_rows([
+        {"Response": "True", "imdbID": "tt1", "Title": "A", "imdbRating": "8.2", "imdbVotes": "1,600,000",
+         "Poster": "N/A", "Plot": "Plot"},
+        {"Response": "False", "Error": "Incorrect IMDb ID."}
+    ]))
+
+    assert len(rows) == 1
+    assert rows[0][4:6] == (8.2, 1600000)
+    assert rows[0][11] is None
+    assert rows[0][-1] == 'omdb'
+
+
+def test_copy_stream_escapes_values_and_reads_in_chunks():
+    stream = _CopyStream([("tt1", "Tab\there", None), ("tt2", "Back\\slash", 7.5)])
+
+    data = ''.join(iter(lambda: stream.read(5), ''))
+
+    assert data == "tt1\tTab\\there\t\\N\ntt2\tBack\\\\slash\t7.5\n"
+
+
+def test_search_statement_uses_trigram_filter_and_filters():
+    statement = build_search_statement("bat_man", year="2005", type_filter="movie", min_rating=7.0)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "public.movies.title ILIKE" in sql
+    assert "similarity(public.movies.title" in sql
+    assert "public.movies.imdb_rating BETWEEN" in sql
+    assert "public.movies.type_ =" in sql
+    assert statement.compile().params['title_1'] == "%bat\\_man%"
+
+
+def test_imdb_dump_row_has_no_details():
+    movie = Movie(imdb_id="tt0372784", title="Batman Begins", year="2005", type_="movie", imdb_rating=8.2,
+                  genre="Action", source='imdb')
+
+    assert movie.has_details is False
+    assert movie.to_summary().details is None
+
+
+def test_movie_catalog_search_returns_search_results(mock_session):
+    movie = Movie(imdb_id="tt0372784", title="Batman Begins", year="2005", type_="movie", imdb_rating=8.2,
+                  plot="Plot")
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [movie]
+
+    results = MovieCatalog().search("batman")
+
+    assert results[0].imdb_id == "tt0372784"
+    assert results[0].year == 2005
+    assert results[0].rating == 8.2
+    assert results[0].poster_url is None
+    mock_session.close.assert_called_once()
+
+
+def test_movie_catalog_search_returns_none_on_database_error(mock_session, capsys):
+    mock_session.execute.side_effect = sqlalchemy_exc.OperationalError("SELECT", {}, Exception("down"))
+
+    assert MovieCatalog().search("batman") is None
+    assert "Ошибка поиска в каталоге фильмов" in capsys.readouterr().err
+
+
+def test_search_cursor_answers_from_catalog_without_omdb():
+    catalog = MagicMock(min_results=1)
+    catalog.search.return_value = [_catalog_result(f"tt{i}") for i in range(3)]
+    client = OmdbClient(api_key='test_key', catalog=catalog)
+    client.session.get = MagicMock()
+    cursor = SearchCursor(client, "Batman")
+
+    assert [result.imdb_id for result in cursor.fetch_more(count=2)] == ["tt0", "tt1"]
+    assert cursor.source == 'catalog'
+    assert cursor.has_more is True
+    client.session.get.assert_not_called()
+
+
+def test_search_cursor_continues_with_omdb_when_catalog_runs_out():
+    catalog = MagicMock(min_results=1)
+    catalog.search.side_effect = [
+        [_catalog_result(f"tt{i}") for i in range(3)],
+        [_catalog_result("tt3")]
+    ]
+    client = OmdbClient(api_key='test_key', catalog=catalog)
+    client.session.get = MagicMock(side_effect=_omdb_get(["tt3", "tt9"]))
+    cursor = SearchCursor(client, "Batman", max_workers=1)
+    list(cursor.fetch_more(count=2))
+
+    assert [result.imdb_id for result in cursor.fetch_more(count=2)] == ["tt3", "tt9"]
+    assert catalog.search.call_args.kwargs == {'limit': 3, 'offset': 2}
+    assert cursor.source == 'omdb'
+    assert cursor.has_more is False
+
+
+def test_search_cursor_enriches_catalog_rows_without_details():
+    catalog = MagicMock(min_results=1)
+    catalog.search.return_value = [_catalog_result("tt0"), _catalog_result("tt1", plot=None)]
+    client = OmdbClient(api_key='test_key', catalog=catalog)
+    client.session.get = MagicMock(side_effect=_omdb_get([]))
+
+    results = list(SearchCursor(client, "Batman").fetch_more(count=2))
+
+    assert sorted((result.imdb_id, result.details.plot) for result in results) == [("tt0", "Plot"),
+                                                                                    ("tt1", "From OMDb")]
+    detail_calls = [c.kwargs['params']['i'] for c in client.session.get.call_args_list]
+    assert detail_calls == ["tt1"]
+
+
+def test_search_cursor_uses_omdb_when_catalog_does_not_fill_page():
+    catalog = MagicMock(min_results=1)
+    catalog.search.return_value = [_catalog_result("tt0")]
+    client = OmdbClient(api_key='test_key', catalog=catalog)
+    client.session.get = MagicMock(side_effect=_omdb_get(["tt0", "tt1", "tt2"]))
+
+    results = client.search_movie_by_title("Batman")
+
+    assert [result.imdb_id for result in results] == ["tt0", "tt1", "tt2"]
+    assert all(result.details.plot == "From OMDb" for result in results)
+
+
+def test_search_cursor_falls_back_to_omdb_on_catalog_miss():
+    catalog = MagicMock(min_results=1)
+    catalog.search.return_value = []
+    client = OmdbClient(api_key='test_key', catalog=catalog)
+    client.session.get = MagicMock(return_value=MagicMock(
+        status_code=200, json=MagicMock(return_value={"Response": "False", "Error": "Movie not found!"})))
+
+    assert client.search_movie_by_title("Unknown") == []
+    client.session.get.assert_called_once()
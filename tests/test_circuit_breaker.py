@@ -0,0 +1,109 @@
+import pytest
+from backend.api.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _opened_breaker(clock, threshold=3, reset_timeout=10.0):
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=reset_timeout, clock=clock)
+    for _ in range(threshold):
+        breaker.allow()
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, clock=clock)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_single_probe_after_reset_timeout():
+    clock = FakeClock()
+    breaker = _opened_breaker(clock)
+    clock.now += 9.0
+    assert breaker.retry_after() == pytest.approx(1.0)
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    clock.now += 1.0
+    breaker.allow()
+
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_successful_probe_closes_circuit():
+    clock = FakeClock()
+    breaker = _opened_breaker(clock)
+    clock.now += 10.0
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    breaker.allow()
+
+
+def test_failed_probe_reopens_circuit():
+    clock = FakeClock()
+    breaker = _opened_breaker(clock)
+    clock.now += 10.0
+    breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == pytest.approx(10.0)
+    assert breaker.stats()['opened'] == 2
+
+
+def test_lost_probe_is_replaced_after_reset_timeout():
+    clock = FakeClock()
+    breaker = _opened_breaker(clock)
+    clock.now += 10.0
+    breaker.allow()
+
+    clock.now += 10.0
+    breaker.allow()
+
+    assert breaker.state == HALF_OPEN
+
+
+def test_listeners_receive_state_changes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+    states = []
+    breaker.add_listener(states.append)
+
+    breaker.record_failure()
+    clock.now += 5.0
+    breaker.allow()
+    breaker.record_success()
+    breaker.record_success()
+
+    assert states == [OPEN, HALF_OPEN, CLOSED]
@@ -0,0 +1,110 @@
+import threading
+from backend.api.concurrency import IGNORE, OVERLOAD, SUCCESS, AdaptiveConcurrencyLimit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(limit: AdaptiveConcurrencyLimit, clock: FakeClock, latency: float, outcome: str = SUCCESS,
+         parallel: int | None = None) -> None:
+    """Одна «волна» из parallel одновременных запросов (по умолчанию — весь текущий предел)."""
+    started = [limit.acquire(timeout=0) for _ in range(parallel or limit.limit)]
+    clock.now += latency
+    for moment in started:
+        limit.release(moment, outcome)
+
+
+def test_slow_start_grows_limit_by_one_per_healthy_response():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=2, max_limit=20, clock=clock)
+
+    _run(limit, clock, 0.05)
+    assert limit.limit == 4
+    _run(limit, clock, 0.05)
+    assert limit.limit == 8
+
+
+def test_limit_never_exceeds_max():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=4, max_limit=6, clock=clock)
+    for _ in range(5):
+        _run(limit, clock, 0.05)
+    assert limit.limit == 6
+
+
+def test_overload_halves_limit_once_per_wave():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=8, clock=clock)
+
+    _run(limit, clock, 0.05, OVERLOAD)
+
+    assert limit.limit == 4
+    assert limit.stats()['decreases'] == 1
+
+
+def test_limit_does_not_drop_below_min():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=2, min_limit=2, clock=clock)
+    for _ in range(3):
+        _run(limit, clock, 0.05, OVERLOAD)
+    assert limit.limit == 2
+
+
+def test_after_overload_growth_is_additive():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=8, max_limit=20, clock=clock)
+    _run(limit, clock, 0.05, OVERLOAD)
+
+    _run(limit, clock, 0.05)
+    assert limit.limit == 4
+    _run(limit, clock, 0.05)
+
+    assert limit.limit == 5
+
+
+def test_slow_responses_do_not_grow_limit():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=4, latency_tolerance=2.0, clock=clock)
+    _run(limit, clock, 0.05)
+    grown = limit.limit
+
+    _run(limit, clock, 0.5)
+
+    assert limit.limit == grown
+    assert limit.stats()['slow_responses'] == grown
+
+
+def test_unsaturated_limit_does_not_grow():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=8, clock=clock)
+    for _ in range(10):
+        _run(limit, clock, 0.05, parallel=1)
+    assert limit.limit == 8
+
+
+def test_ignored_outcome_keeps_limit():
+    clock = FakeClock()
+    limit = AdaptiveConcurrencyLimit(initial=4, clock=clock)
+    _run(limit, clock, 0.05, IGNORE)
+    assert limit.stats() == {'limit': 4, 'in_flight': 0, 'increases': 0, 'decreases': 0,
+                             'slow_responses': 0, 'baseline_latency': None}
+
+
+def test_acquire_waits_for_free_slot():
+    limit = AdaptiveConcurrencyLimit(initial=1)
+    started = limit.acquire()
+    assert limit.acquire(timeout=0.01) is None
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(limit.acquire(timeout=2.0)))
+    waiter.start()
+    limit.release(started, IGNORE)
+    waiter.join()
+
+    assert acquired[0] is not None
+    assert limit.in_flight == 1
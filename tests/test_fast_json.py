@@ -0,0 +1,45 @@
+import json
+import pytest
+from backend.api import fast_json
+
+
+def test_decode_details_keeps_only_used_fields():
+    raw = json.dumps({"Response": "True", "imdbID": "tt1", "Title": "A", "imdbRating": "7.1",
+                      "Rated": "PG-13", "Awards": "N/A", "Ratings": [{"Source": "x", "Value": "1"}]}).encode()
+
+    assert fast_json.decode_omdb(raw, {'i': 'tt1'}) == {"Response": "True", "imdbID": "tt1", "Title": "A",
+                                                        "imdbRating": "7.1"}
+
+
+def test_decode_search_page_trims_items():
+    raw = json.dumps({"Response": "True", "totalResults": "1",
+                      "Search": [{"imdbID": "tt1", "Title": "A", "Year": "2000", "Type": "movie",
+                                  "Poster": "N/A", "Extra": "x"}]}).encode()
+
+    page = fast_json.decode_omdb(raw, {'s': 'a'})
+
+    assert page == {"Response": "True", "totalResults": "1",
+                    "Search": [{"imdbID": "tt1", "Title": "A", "Year": "2000", "Type": "movie", "Poster": "N/A"}]}
+
+
+def test_decode_rejects_non_object_payload():
+    with pytest.raises(ValueError):
+        fast_json.decode_omdb(b"[1, 2]", {'i': 'tt1'})
+
+
+def test_falls_back_to_standard_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(fast_json, 'orjson', None)
+
+    assert fast_json.available() is False
+    assert fast_json.loads(fast_json.dumps({"Title": "Ёлки"})) == {"Title": "Ёлки"}
+    assert fast_json.dumps({"Title": "Ёлки"}) == '{"Title": "Ёлки"}'
+
+
+def test_decode_full_details_keeps_card_fields():
+    raw = json.dumps({"Response": "True", "imdbID": "tt1", "Plot": "Long.", "Awards": "None",
+                      "Ratings": [], "DVD": "N/A"}).encode()
+
+    assert fast_json.decode_omdb(raw, {'i': 'tt1', 'plot': 'full'}) == {
+        "Response": "True", "imdbID": "tt1", "Plot": "Long.", "Awards": "None", "Ratings": []
+    }
+    assert "Awards" not in fast_json.decode_omdb(raw, {'i': 'tt1', 'plot': 'short'})
@@ -0,0 +1,37 @@
+from backend.api.hedging import HedgePolicy, LatencyTracker
+
+
+def test_tracker_needs_min_samples_before_reporting_percentile():
+    tracker = LatencyTracker(window=100, min_samples=5)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        tracker.record(seconds)
+    assert tracker.percentile(0.95) is None
+
+    tracker.record(1.0)
+    assert tracker.percentile(0.95) == 1.0
+    assert tracker.percentile(0.5) == 0.3
+
+
+def test_tracker_keeps_only_recent_window():
+    tracker = LatencyTracker(window=3, min_samples=1)
+    for seconds in (5.0, 0.1, 0.1, 0.1):
+        tracker.record(seconds)
+    assert tracker.percentile(0.99) == 0.1
+
+
+def test_hedge_delay_has_floor():
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(0.001)
+    assert HedgePolicy(min_delay=0.02, tracker=tracker).hedge_delay() == 0.02
+
+
+def test_budget_limits_hedges_to_fraction_of_requests():
+    policy = HedgePolicy(budget=0.25, burst=1.0)
+    allowed = 0
+    for _ in range(100):
+        policy.record_request()
+        allowed += policy.try_hedge()
+
+    assert allowed == 25
+    assert policy.stats()['hedges'] == 25
+    assert policy.stats()['denied'] == 75
@@ -0,0 +1,66 @@
+import pytest
+from backend.api.movie_records import MovieDetails, MovieFullDetails, MovieSummary, parse_runtime, parse_year
+
+
+def test_summary_from_search_item_parses_year_and_missing_poster():
+    summary = MovieSummary.from_omdb({"Title": "Batman", "Year": "1966–1968", "imdbID": "tt0059968",
+                                      "Type": "series", "Poster": "N/A"})
+
+    assert summary.year == 1966
+    assert summary.year_label == "1966–1968"
+    assert summary.poster_url is None
+    assert summary.details is None
+    assert summary.rating is None
+
+
+def test_details_from_omdb_parses_numeric_fields():
+    details = MovieDetails.from_omdb({"imdbRating": "8.2", "imdbVotes": "1,634,028", "Runtime": "140 min",
+                                      "Genre": "Action, Crime", "Plot": "N/A", "Poster": "poster.jpg"})
+
+    assert (details.rating, details.votes, details.runtime) == (8.2, 1634028, 140)
+    assert details.genre == "Action, Crime"
+    assert details.plot is None
+
+
+def test_with_details_returns_new_record_with_detail_poster():
+    summary = MovieSummary(imdb_id="tt1", title="A", poster_url="small.jpg")
+
+    enriched = summary.with_details(MovieDetails(rating=7.5, poster_url="large.jpg"))
+
+    assert enriched.rating == 7.5
+    assert enriched.poster_url == "large.jpg"
+    assert summary.details is None
+    assert summary.with_details(MovieDetails()).poster_url == "small.jpg"
+
+
+def test_records_are_immutable_and_slotted():
+    summary = MovieSummary(imdb_id="tt1", title="A")
+
+    with pytest.raises(AttributeError):
+        summary.title = "B"
+    assert not hasattr(summary, '__dict__')
+
+
+@pytest.mark.parametrize("value, expected", [("N/A", None), ("", None), (None, None), ("2019–", 2019)])
+def test_parse_year_handles_missing_and_open_ranges(value, expected):
+    assert parse_year(value) == expected
+
+
+def test_parse_runtime_ignores_missing_value():
+    assert parse_runtime("N/A") is None
+    assert parse_runtime("95 min") == 95
+
+
+def test_full_details_parse_extra_fields_and_ratings():
+    details = MovieFullDetails.from_omdb({
+        "Plot": "Long plot.", "Awards": "Won 2 Oscars.", "BoxOffice": "$206,852,432", "Metascore": "70",
+        "Released": "N/A", "Ratings": [{"Source": "Internet Movie Database", "Value": "8.2/10"},
+                                       {"Source": "Rotten Tomatoes", "Value": "84%"}, {"Source": ""}]
+    })
+
+    assert details.plot == "Long plot."
+    assert details.awards == "Won 2 Oscars."
+    assert details.box_office == "$206,852,432"
+    assert details.metascore == 70
+    assert details.released is None
+    assert details.ratings == (("Internet Movie Database", "8.2/10"), ("Rotten Tomatoes", "84%"))
@@ -1,13 +1,23 @@
 import pytest
 from unittest.mock import patch, MagicMock, call
+import threading
+import time
 import requests
-from backend.api.omdb_client import get_movie_by_id, search_movie_by_title
+from backend.api.cache import DiskCache, MemoryCache
+from backend.api.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from backend.api.concurrency import AdaptiveConcurrencyLimit
+from backend.api.fast_json import available as fast_json_available
+from backend.api.hedging import HedgePolicy, LatencyTracker
+from backend.api.rate_limiter import DailyQuota
+from backend.api.ratings_index import RatingsIndex
+from backend.api.omdb_client import (Deadline, DeadlineExceeded, OmdbClient, OmdbSearchError, SearchCursor,
+                                     _search_params, get_movie_by_id, iter_search, search_movie_by_title)
 
-OMDB_BASE_URL = "http://www.omdbapi.com/"
+OMDB_BASE_URL = "https://www.omdbapi.com/"
 
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_success(mock_requests_get):
     mock_response = MagicMock()
@@ -34,7 +44,7 @@ def test_get_movie_by_id_no_api_key(capsys):
     assert "API ключ OMDb не настроен." in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_api_response_false(mock_requests_get, capsys):
     mock_response = MagicMock()
@@ -49,7 +59,7 @@ def test_get_movie_by_id_api_response_false(mock_requests_get, capsys):
     assert "OMDb API Error (i=tt12345): Movie not found!" in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_api_response_false_generic_omdb_error(mock_requests_get, capsys):
     mock_response = MagicMock()
@@ -64,7 +74,7 @@ def test_get_movie_by_id_api_response_false_generic_omdb_error(mock_requests_get
     assert "OMDb API Error (i=tt12345): Error getting data." not in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_timeout(mock_requests_get, capsys):
     mock_requests_get.side_effect = requests.exceptions.Timeout("Timeout error")
@@ -74,7 +84,7 @@ def test_get_movie_by_id_timeout(mock_requests_get, capsys):
     assert "Таймаут при получении деталей для tt12345" in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_request_exception(mock_requests_get, capsys):
     mock_requests_get.side_effect = requests.exceptions.RequestException("Network error")
@@ -84,7 +94,7 @@ def test_get_movie_by_id_request_exception(mock_requests_get, capsys):
     assert "Ошибка сети при получении деталей tt12345: Network error" in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_get_movie_by_id_unexpected_exception(mock_requests_get, capsys):
     mock_requests_get.side_effect = Exception("Unexpected error")
@@ -95,11 +105,10 @@ def test_get_movie_by_id_unexpected_exception(mock_requests_get, capsys):
 
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_by_title_success_one_page(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep):
+def test_search_movie_by_title_success_one_page(mock_requests_get, mock_internal_get_movie_by_id):
     mock_search_response = MagicMock()
     mock_search_response.json.return_value = {
         "Response": "True",
@@ -118,11 +127,10 @@ def test_search_movie_by_title_success_one_page(mock_requests_get, mock_internal
     results = search_movie_by_title("Test Movie")
 
     assert len(results) == 1
-    assert results[0]['Title'] == "Test Movie 1"
-    assert results[0]['imdbRating'] == "8.0"
-    assert results[0]['imdbRatingValue'] == 8.0
-    assert results[0]['Plot'] == "A great plot."
-    assert results[0]['Poster'] == "detail_poster1.jpg"
+    assert results[0].title == "Test Movie 1"
+    assert results[0].rating == 8.0
+    assert results[0].details.plot == "A great plot."
+    assert results[0].poster_url == "detail_poster1.jpg"
 
     mock_requests_get.assert_called_once_with(
         OMDB_BASE_URL,
@@ -130,7 +138,6 @@ def test_search_movie_by_title_success_one_page(mock_requests_get, mock_internal
         timeout=15
     )
     mock_internal_get_movie_by_id.assert_called_once_with("tt00001")
-    mock_sleep.assert_called_once()
 
 
 @patch('backend.api.omdb_client.OMDB_API_KEY', None)
@@ -146,7 +153,7 @@ def test_search_movie_empty_title():
     assert result == []
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_search_movie_by_title_api_error_first_page(mock_requests_get, capsys):
     mock_requests_get.side_effect = requests.exceptions.RequestException("API Search Error")
@@ -156,7 +163,7 @@ def test_search_movie_by_title_api_error_first_page(mock_requests_get, capsys):
     assert "Ошибка при поиске (страница 1): API Search Error" in captured.err
 
 
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
 def test_search_movie_by_title_no_initial_results_api_false(mock_requests_get):
     mock_search_response = MagicMock()
@@ -166,11 +173,10 @@ def test_search_movie_by_title_no_initial_results_api_false(mock_requests_get):
     assert results == []
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_by_title_with_year_and_type(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep):
+def test_search_movie_by_title_with_year_and_type(mock_requests_get, mock_internal_get_movie_by_id):
     mock_search_response = MagicMock()
     mock_search_response.json.return_value = {
         "Response": "True", "Search": [{"Title": "Test Movie", "imdbID": "tt00001"}], "totalResults": "1"
@@ -187,11 +193,10 @@ def test_search_movie_by_title_with_year_and_type(mock_requests_get, mock_intern
     )
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_by_title_rating_filter(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep):
+def test_search_movie_by_title_rating_filter(mock_requests_get, mock_internal_get_movie_by_id):
     mock_search_response = MagicMock()
     mock_search_response.json.return_value = {
         "Response": "True",
@@ -216,17 +221,15 @@ def test_search_movie_by_title_rating_filter(mock_requests_get, mock_internal_ge
     results = search_movie_by_title("Test", min_rating=7.0, max_rating=9.5)
 
     assert len(results) == 2
-    assert results[0]['imdbID'] == "tt001"
-    assert results[1]['imdbID'] == "tt002"
+    assert results[0].imdb_id == "tt001"
+    assert results[1].imdb_id == "tt002"
     assert mock_internal_get_movie_by_id.call_count == 5
-    assert mock_sleep.call_count == 2
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_by_title_max_15_final_results(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep):
+def test_search_movie_by_title_max_15_final_results(mock_requests_get, mock_internal_get_movie_by_id):
     search_items = [{"Title": f"Movie {i}", "imdbID": f"tt{i:05}"} for i in range(1, 25)]  # 24 items
 
     mock_search_response_p1 = MagicMock()
@@ -242,41 +245,36 @@ def test_search_movie_by_title_max_15_final_results(mock_requests_get, mock_inte
 
     assert len(results) == 15
     assert mock_internal_get_movie_by_id.call_count == 15
-    assert mock_sleep.call_count == 15
     mock_requests_get.assert_has_calls([
         call(OMDB_BASE_URL, params={'apikey': 'test_key', 's': 'Test', 'page': 1}, timeout=15),
         call(OMDB_BASE_URL, params={'apikey': 'test_key', 's': 'Test', 'page': 2}, timeout=15)
     ])
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_internal_get_movie_by_id_returns_none(mock_requests_get, mock_internal_get_movie_by_id,
-                                                            mock_sleep):
+def test_search_movie_internal_get_movie_by_id_returns_none(mock_requests_get, mock_internal_get_movie_by_id):
     mock_search_response = MagicMock()
     mock_search_response.json.return_value = {
         "Response": "True",
         "Search": [{"imdbID": "tt001"}, {"imdbID": "tt002"}], "totalResults": "2"
     }
     mock_requests_get.return_value = mock_search_response
-    mock_internal_get_movie_by_id.side_effect = [
-        {"imdbID": "tt001", "imdbRating": "8.0"}, None
-    ]
+    mock_internal_get_movie_by_id.side_effect = lambda imdb_id: (
+        {"imdbID": "tt001", "imdbRating": "8.0"} if imdb_id == "tt001" else None
+    )
 
     results = search_movie_by_title("Test")
     assert len(results) == 1
-    assert results[0]['imdbID'] == "tt001"
+    assert results[0].imdb_id == "tt001"
     assert mock_internal_get_movie_by_id.call_count == 2
-    assert mock_sleep.call_count == 1
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_stops_paging_if_total_results_met(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep):
+def test_search_movie_stops_paging_if_total_results_met(mock_requests_get, mock_internal_get_movie_by_id):
     mock_search_response = MagicMock()
     mock_search_response.json.return_value = {
         "Response": "True", "Search": [{"imdbID": f"tt{i}"} for i in range(5)], "totalResults": "5"
@@ -288,15 +286,12 @@ def test_search_movie_stops_paging_if_total_results_met(mock_requests_get, mock_
     assert len(results) == 5
     mock_requests_get.assert_called_once()
     assert mock_internal_get_movie_by_id.call_count == 5
-    assert mock_sleep.call_count == 5
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_stops_paging_if_max_initial_results_met(mock_requests_get, mock_internal_get_movie_by_id,
-                                                              mock_sleep):
+def test_search_movie_stops_paging_if_max_initial_results_met(mock_requests_get, mock_internal_get_movie_by_id):
     items_p1 = [{"imdbID": f"tt{i:02}"} for i in range(10)]
     items_p2 = [{"imdbID": f"tt{i:02}"} for i in range(10, 20)]
 
@@ -315,14 +310,12 @@ def test_search_movie_stops_paging_if_max_initial_results_met(mock_requests_get,
     assert mock_requests_get.call_count == 2
     assert len(results) == 15
     assert mock_internal_get_movie_by_id.call_count == 15
-    assert mock_sleep.call_count == 15
 
 
-@patch('backend.api.omdb_client.time.sleep')
-@patch('backend.api.omdb_client.get_movie_by_id')
-@patch('backend.api.omdb_client.requests.get')
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
 @patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
-def test_search_movie_api_error_on_second_page(mock_requests_get, mock_internal_get_movie_by_id, mock_sleep, capsys):
+def test_search_movie_api_error_on_second_page(mock_requests_get, mock_internal_get_movie_by_id, capsys):
     items_p1 = [{"imdbID": f"tt{i:02}"} for i in range(5)]
     mock_resp_p1 = MagicMock()
     mock_resp_p1.json.return_value = {"Response": "True", "Search": items_p1, "totalResults": "25"}
@@ -338,6 +331,1034 @@ def test_search_movie_api_error_on_second_page(mock_requests_get, mock_internal_
     assert len(results) == 5
     assert mock_requests_get.call_count == 2
     assert mock_internal_get_movie_by_id.call_count == 5
-    assert mock_sleep.call_count == 5
     captured = capsys.readouterr()
     assert "Ошибка при поиске (страница 2): API Error page 2" in captured.err
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_search_movie_keeps_omdb_order_with_parallel_details(mock_requests_get, mock_internal_get_movie_by_id):
+    mock_search_response = MagicMock()
+    mock_search_response.json.return_value = {
+        "Response": "True", "Search": [{"imdbID": f"tt{i}"} for i in range(6)], "totalResults": "6"
+    }
+    mock_requests_get.return_value = mock_search_response
+
+    def slow_for_first_ids(imdb_id):
+        time.sleep(0.01 * (6 - int(imdb_id[2:])))
+        return {"imdbID": imdb_id, "imdbRating": "7.0"}
+
+    mock_internal_get_movie_by_id.side_effect = slow_for_first_ids
+
+    results = search_movie_by_title("Test")
+    assert [result.imdb_id for result in results] == [f"tt{i}" for i in range(6)]
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_search_movie_bounds_concurrent_detail_requests(mock_requests_get, mock_internal_get_movie_by_id):
+    mock_search_response = MagicMock()
+    mock_search_response.json.return_value = {
+        "Response": "True", "Search": [{"imdbID": f"tt{i}"} for i in range(10)], "totalResults": "10"
+    }
+    mock_requests_get.return_value = mock_search_response
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def tracked(imdb_id):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {"imdbID": imdb_id, "imdbRating": "7.0"}
+
+    mock_internal_get_movie_by_id.side_effect = tracked
+
+    results = search_movie_by_title("Test", max_workers=3)
+    assert len(results) == 10
+    assert 1 < peak <= 3
+
+
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_get_movie_by_id_served_from_disk_cache(mock_requests_get, tmp_path, monkeypatch):
+    monkeypatch.setattr('backend.api.omdb_client.default_client.response_cache', DiskCache(tmp_path / "omdb.sqlite3"))
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"Response": "True", "Title": "Test Movie"}
+    mock_requests_get.return_value = mock_response
+
+    assert get_movie_by_id("tt12345") == {"Response": "True", "Title": "Test Movie"}
+    assert get_movie_by_id("tt12345") == {"Response": "True", "Title": "Test Movie"}
+    mock_requests_get.assert_called_once()
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_search_page_served_from_disk_cache(mock_requests_get, mock_internal_get_movie_by_id, tmp_path, monkeypatch):
+    monkeypatch.setattr('backend.api.omdb_client.default_client.response_cache', DiskCache(tmp_path / "omdb.sqlite3"))
+    mock_search_response = MagicMock()
+    mock_search_response.json.return_value = {
+        "Response": "True", "Search": [{"imdbID": "tt001"}], "totalResults": "1"
+    }
+    mock_requests_get.return_value = mock_search_response
+    mock_internal_get_movie_by_id.return_value = {"imdbID": "tt001", "imdbRating": "7.0"}
+
+    search_movie_by_title("Test Movie")
+    results = search_movie_by_title("  test   movie ")
+
+    assert len(results) == 1
+    mock_requests_get.assert_called_once()
+
+
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_get_movie_by_id_caches_misses_in_memory(mock_requests_get, monkeypatch):
+    memory_cache = MemoryCache()
+    monkeypatch.setattr('backend.api.omdb_client.default_client.detail_cache', memory_cache)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"Response": "False", "Error": "Error getting data."}
+    mock_requests_get.return_value = mock_response
+
+    assert get_movie_by_id("tt12345") is None
+    assert get_movie_by_id("tt12345") is None
+
+    mock_requests_get.assert_called_once()
+    assert memory_cache.stats()['negative_hits'] == 1
+
+
+def test_search_details_are_cached_without_card_only_fields(tmp_path):
+    cache = DiskCache(tmp_path / "omdb.sqlite3")
+    client = OmdbClient(api_key='test_key', response_cache=cache)
+    client.session.get = MagicMock(return_value=_response(json_data={
+        "Response": "True", "imdbID": "tt1", "Plot": "Short.", "Awards": "Won 2 Oscars.", "BoxOffice": "$1"
+    }))
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1", "Plot": "Short."}
+    assert cache.get("i=tt1&plot=short") == {"Response": "True", "imdbID": "tt1", "Plot": "Short."}
+
+
+def test_full_details_are_fetched_on_demand_and_cached_separately():
+    client = OmdbClient(api_key='test_key', detail_cache=MemoryCache())
+
+    def get(url, params, timeout):
+        plot = "Long plot." if params['plot'] == 'full' else "Short."
+        return _response(json_data={"Response": "True", "imdbID": params['i'], "Plot": plot, "Awards": "Won 2 Oscars."})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    assert client.get_movie_by_id("tt1")["Plot"] == "Short."
+    full = client.get_full_details("tt1")
+    assert client.get_full_details("tt1") == full
+
+    assert full.plot == "Long plot."
+    assert full.awards == "Won 2 Oscars."
+    assert [c.kwargs['params']['plot'] for c in client.session.get.call_args_list] == ['short', 'full']
+    assert client.get_movie_by_id("tt1")["Plot"] == "Short."
+
+
+def test_full_details_error_returns_none(capsys):
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "False", "Error": "Incorrect IMDb ID."}))
+
+    assert client.get_full_details("tt0") is None
+    assert "Incorrect IMDb ID." in capsys.readouterr().err
+
+
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_get_movie_by_id_does_not_cache_network_errors(mock_requests_get, monkeypatch):
+    monkeypatch.setattr('backend.api.omdb_client.default_client.detail_cache', MemoryCache())
+    mock_requests_get.side_effect = requests.exceptions.Timeout("Timeout error")
+
+    get_movie_by_id("tt12345")
+    get_movie_by_id("tt12345")
+
+    assert mock_requests_get.call_count == 2
+
+
+def _response(status_code=200, json_data=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Server Error")
+    return response
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_client_retries_server_errors_with_backoff(mock_sleep):
+    client = OmdbClient(api_key='test_key', max_retries=2)
+    client.session.get = MagicMock(side_effect=[
+        _response(503), _response(502), _response(json_data={"Response": "True", "Title": "Test Movie"})
+    ])
+
+    assert client.get_movie_by_id("tt12345") == {"Response": "True", "Title": "Test Movie"}
+    assert client.session.get.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert all(0 <= delay_call.args[0] <= client.backoff_max for delay_call in mock_sleep.call_args_list)
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_client_retries_connection_errors_then_gives_up(mock_sleep, capsys):
+    client = OmdbClient(api_key='test_key', max_retries=2)
+    client.session.get = MagicMock(side_effect=requests.exceptions.ConnectionError("refused"))
+
+    assert client.get_movie_by_id("tt12345") is None
+    assert client.session.get.call_count == 3
+    assert "Ошибка сети при получении деталей tt12345: refused" in capsys.readouterr().err
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_client_does_not_retry_client_errors(mock_sleep):
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(return_value=_response(401))
+
+    assert client.get_movie_by_id("tt12345") is None
+    client.session.get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_client_backoff_grows_exponentially_and_is_capped():
+    client = OmdbClient(api_key='test_key', backoff_factor=0.5, backoff_max=1.5)
+    with patch('backend.api.omdb_client.random.uniform', side_effect=lambda low, high: high):
+        assert [client._backoff_delay(attempt) for attempt in range(4)] == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_client_mounts_pooled_adapter():
+    client = OmdbClient(api_key='test_key', pool_size=7)
+    adapter = client.session.get_adapter(OMDB_BASE_URL)
+    assert adapter._pool_maxsize == 7
+    client.close()
+
+
+def test_client_serves_cache_only_when_quota_exhausted(tmp_path, capsys):
+    detail_cache = MemoryCache()
+    detail_cache.set("tt00001", {"Response": "True", "imdbID": "tt00001"})
+    quota = DailyQuota(tmp_path / "quota.json", limit=10, reserve=10)
+    client = OmdbClient(api_key='test_key', detail_cache=detail_cache, quota=quota)
+    client.session.get = MagicMock()
+
+    assert client.get_movie_by_id("tt00001") == {"Response": "True", "imdbID": "tt00001"}
+    assert client.get_movie_by_id("tt00002") is None
+
+    client.session.get.assert_not_called()
+    assert "Дневной лимит запросов OMDb почти исчерпан" in capsys.readouterr().err
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_client_waits_for_rate_limiter_token(mock_sleep):
+    rate_limiter = MagicMock()
+    rate_limiter.reserve.return_value = 0.2
+    client = OmdbClient(api_key='test_key', rate_limiter=rate_limiter)
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "True"}))
+
+    client.get_movie_by_id("tt00001")
+
+    rate_limiter.reserve.assert_called_once()
+    mock_sleep.assert_called_once_with(0.2)
+
+
+def _search_page(imdb_ids, total=None):
+    return _response(json_data={
+        "Response": "True", "Search": [{"imdbID": imdb_id} for imdb_id in imdb_ids],
+        "totalResults": str(total if total is not None else len(imdb_ids))
+    })
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_iter_search_yields_results_as_details_arrive(mock_requests_get, mock_internal_get_movie_by_id):
+    mock_requests_get.return_value = _search_page(["tt0", "tt1", "tt2"])
+    delays = {"tt0": 0.1, "tt1": 0.0, "tt2": 0.05}
+
+    def delayed_details(imdb_id):
+        time.sleep(delays[imdb_id])
+        return {"imdbID": imdb_id, "imdbRating": "7.0"}
+
+    mock_internal_get_movie_by_id.side_effect = delayed_details
+    progress = []
+
+    results = list(iter_search("Test", on_progress=lambda done, total: progress.append((done, total))))
+
+    assert [result.imdb_id for result in results] == ["tt1", "tt2", "tt0"]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_iter_search_applies_rating_filter_and_cap(mock_requests_get, mock_internal_get_movie_by_id):
+    mock_requests_get.side_effect = [
+        _search_page([f"tt{i:02}" for i in range(10)], total=20),
+        _search_page([f"tt{i:02}" for i in range(10, 20)], total=20)
+    ]
+    mock_internal_get_movie_by_id.side_effect = lambda imdb_id: {
+        "imdbID": imdb_id, "imdbRating": "9.0" if int(imdb_id[2:]) % 4 else "3.0"
+    }
+
+    results = list(iter_search("Test", min_rating=5.0))
+
+    assert len(results) == 15
+    assert all(result.rating == 9.0 for result in results)
+
+
+@patch('backend.api.omdb_client.default_client.get_movie_by_id')
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_iter_search_cancellation_skips_pending_details(mock_requests_get, mock_internal_get_movie_by_id):
+    mock_requests_get.return_value = _search_page([f"tt{i}" for i in range(10)])
+    cancel_event = threading.Event()
+
+    def details(imdb_id):
+        time.sleep(0.02)
+        return {"imdbID": imdb_id, "imdbRating": "7.0"}
+
+    mock_internal_get_movie_by_id.side_effect = details
+    results = []
+    for result in iter_search("Test", max_workers=2, cancel_event=cancel_event):
+        results.append(result)
+        cancel_event.set()
+
+    time.sleep(0.05)
+    assert len(results) == 1
+    assert mock_internal_get_movie_by_id.call_count < 10
+
+
+@patch('backend.api.omdb_client.default_client.session.get')
+@patch('backend.api.omdb_client.OMDB_API_KEY', 'test_key')
+def test_iter_search_raises_when_first_page_fails(mock_requests_get):
+    mock_requests_get.side_effect = requests.exceptions.RequestException("API Search Error")
+    with pytest.raises(OmdbSearchError):
+        list(iter_search("Test"))
+
+
+def _paged_search(pages, total):
+    """Имитация ?s= с заданными страницами: pages[n] — список imdbID страницы n + 1."""
+    def fake_get(url, params, timeout):
+        if 'i' in params:
+            return _response(json_data={"Response": "True", "imdbID": params['i'], "imdbRating": "7.0"})
+        page = params['page']
+        if page > len(pages):
+            return _response(json_data={"Response": "False", "Error": "Movie not found!"})
+        return _search_page(pages[page - 1], total=total)
+    return fake_get
+
+
+@pytest.mark.skipif(not fast_json_available(), reason="orjson не установлен")
+def test_fast_json_client_decodes_raw_body_and_drops_unused_fields():
+    client = OmdbClient(api_key='test_key', fast_json=True)
+    response = _response()
+    response.content = b'{"Response": "True", "imdbID": "tt1", "imdbRating": "7.0", "Awards": "None"}'
+    client.session.get = MagicMock(return_value=response)
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1", "imdbRating": "7.0"}
+    response.json.assert_not_called()
+
+
+def test_search_cursor_loads_pages_on_demand_and_dedupes():
+    client = OmdbClient(api_key='test_key')
+    pages = [[f"tt{i:02}" for i in range(10)],
+             [f"tt{i:02}" for i in range(10, 20)],
+             [f"tt{i:02}" for i in range(18, 28)]]
+    client.session.get = MagicMock(side_effect=_paged_search(pages, total=30))
+    cursor = SearchCursor(client, "Test")
+
+    first = list(cursor.fetch_more())
+    search_calls = [c for c in client.session.get.call_args_list if 's' in c.kwargs['params']]
+    assert sorted(result.imdb_id for result in first) == [f"tt{i:02}" for i in range(15)]
+    assert len(search_calls) == 2
+    assert cursor.has_more is True
+
+    second = list(cursor.fetch_more())
+    search_calls = [c for c in client.session.get.call_args_list if 's' in c.kwargs['params']]
+    assert len(search_calls) == 3
+    assert sorted(result.imdb_id for result in second) == [f"tt{i:02}" for i in range(15, 28)]
+    assert len({result.imdb_id for result in cursor.results}) == 28
+    assert cursor.has_more is False
+
+
+def test_search_cursor_requests_remaining_pages_concurrently():
+    client = OmdbClient(api_key='test_key')
+    pages = [[f"tt{i:02}" for i in range(page * 10, page * 10 + 10)] for page in range(4)]
+    pages[2][0] = "tt05"
+    paged = _paged_search(pages, total=40)
+    lock = threading.Lock()
+    active = {'now': 0, 'max': 0}
+
+    def get(url, params, timeout):
+        if 's' in params and params['page'] > 1:
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            # Поздние страницы отвечают быстрее ранних: порядок выдачи не должен от этого зависеть.
+            time.sleep(0.05 * (5 - params['page']))
+            with lock:
+                active['now'] -= 1
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test")
+
+    candidates = cursor.fetch_candidates(count=40)
+
+    assert active['max'] == 3
+    expected = [imdb_id for page in pages for imdb_id in page if imdb_id != "tt05" or page is pages[0]]
+    assert [movie.imdb_id for movie in candidates] == expected
+    assert cursor.has_more is False
+
+
+def test_search_cursor_stops_at_failed_page_and_retries_it():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+    pages = [[f"tt{i:02}" for i in range(page * 10, page * 10 + 10)] for page in range(3)]
+    paged = _paged_search(pages, total=30)
+    failing = {2}
+
+    def get(url, params, timeout):
+        if 's' in params and params['page'] in failing:
+            failing.discard(params['page'])
+            raise requests.exceptions.ConnectionError("boom")
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test")
+
+    first = cursor.fetch_candidates(count=30)
+    second = cursor.fetch_candidates(count=30)
+
+    assert [movie.imdb_id for movie in first] == pages[0]
+    assert [movie.imdb_id for movie in second] == pages[1] + pages[2]
+    assert cursor.has_more is False
+
+
+def test_search_cursor_keeps_unprocessed_candidates_for_next_fetch():
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(side_effect=_paged_search([[f"tt{i}" for i in range(10)]], total=10))
+    cursor = SearchCursor(client, "Test", max_workers=1)
+
+    assert [result.imdb_id for result in cursor.fetch_more(count=4)] == ["tt0", "tt1", "tt2", "tt3"]
+    assert [result.imdb_id for result in cursor.fetch_more(count=4)] == ["tt4", "tt5", "tt6", "tt7"]
+    search_calls = [c for c in client.session.get.call_args_list if 's' in c.kwargs['params']]
+    assert len(search_calls) == 1
+
+
+def test_search_cursor_fetch_candidates_skips_detail_requests():
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(side_effect=_paged_search([[f"tt{i}" for i in range(10)],
+                                                              [f"tt{i}" for i in range(10, 20)]], total=20))
+    cursor = SearchCursor(client, "Test")
+
+    first = cursor.fetch_candidates(count=15)
+    second = cursor.fetch_candidates(count=15)
+
+    assert [movie.imdb_id for movie in first] == [f"tt{i}" for i in range(15)]
+    assert [movie.imdb_id for movie in second] == [f"tt{i}" for i in range(15, 20)]
+    assert all(movie.details is None for movie in first + second)
+    assert all('s' in c.kwargs['params'] for c in client.session.get.call_args_list)
+    assert cursor.has_more is False
+
+
+def test_search_cursor_fetch_candidates_respects_time_budget():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+    paged = _paged_search([[f"tt{i}" for i in range(10)], [f"tt{i}" for i in range(10, 20)]], total=20)
+
+    def get(url, params, timeout):
+        if params['page'] == 2:
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout()
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test", time_budget=0.2)
+    started = time.monotonic()
+
+    candidates = cursor.fetch_candidates(count=15)
+
+    assert time.monotonic() - started < 0.5
+    assert [movie.imdb_id for movie in candidates] == [f"tt{i}" for i in range(10)]
+    assert cursor.truncated is True
+    assert cursor.has_more is True
+
+
+def test_search_cursor_first_page_cut_by_time_budget_is_truncated():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+
+    def get(url, params, timeout):
+        time.sleep(timeout)
+        raise requests.exceptions.Timeout()
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test", time_budget=0.2)
+
+    assert cursor.fetch_candidates() == []
+    assert cursor.truncated is True
+    assert cursor.has_more is True
+
+
+def test_search_cursor_reports_candidates_before_details():
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(side_effect=_paged_search([[f"tt{i}" for i in range(10)]], total=10))
+    cursor = SearchCursor(client, "Test", max_workers=1)
+    events = []
+
+    def on_candidates(candidates):
+        detail_calls = [c for c in client.session.get.call_args_list if 'i' in c.kwargs['params']]
+        events.append(([candidate.imdb_id for candidate in candidates], len(detail_calls)))
+
+    results = list(cursor.fetch_more(count=4, on_candidates=on_candidates))
+
+    assert events == [([f"tt{i}" for i in range(10)], 0)]
+    assert len(results) == 4
+    assert list(cursor.fetch_more(count=4, on_candidates=on_candidates))
+    assert len(events) == 1
+
+
+def test_search_cursor_empty_title_has_no_results():
+    cursor = SearchCursor(OmdbClient(api_key='test_key'), "")
+    assert cursor.has_more is False
+    assert list(cursor.fetch_more()) == []
+
+
+def test_search_deadline_returns_partial_results_marked_truncated():
+    client = OmdbClient(api_key='test_key')
+    fast_ids = {"tt0", "tt1"}
+    detail_timeouts = []
+
+    def get(url, params, timeout):
+        if 's' in params:
+            return _search_page([f"tt{i}" for i in range(4)], total=4)
+        detail_timeouts.append(timeout)
+        if params['i'] not in fast_ids:
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout()
+        return _response(json_data={"Response": "True", "imdbID": params['i'], "imdbRating": "7.0"})
+
+    client.session.get = MagicMock(side_effect=get)
+    started = time.monotonic()
+
+    results = client.search_movie_by_title("Test", timeout=0.3)
+
+    assert time.monotonic() - started < 1.0
+    assert [result.imdb_id for result in results] == ["tt0", "tt1"]
+    assert results.truncated is True
+    assert all(timeout <= 0.3 for timeout in detail_timeouts)
+
+
+def test_search_deadline_enriches_first_page_before_loading_more():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+    paged = _paged_search([[f"tt{i}" for i in range(10)], [f"tt{i}" for i in range(10, 20)]], total=20)
+
+    def get(url, params, timeout):
+        if params.get('page') == 2:
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout()
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+
+    results = client.search_movie_by_title("Test", timeout=0.3)
+
+    assert [result.imdb_id for result in results] == [f"tt{i}" for i in range(10)]
+    assert results.truncated is True
+
+
+def test_caller_without_deadline_does_not_inherit_expired_shared_request():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+    started = threading.Event()
+
+    def get(url, params, timeout):
+        if not started.is_set():
+            started.set()
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout()
+        return _response(json_data={"Response": "True", "imdbID": params['i'], "imdbRating": "7.0"})
+
+    client.session.get = MagicMock(side_effect=get)
+    first = []
+    thread = threading.Thread(target=lambda: first.append(client.get_movie_by_id("tt1", deadline=Deadline(0.2))))
+    thread.start()
+    started.wait()
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1", "imdbRating": "7.0"}
+    thread.join()
+    assert first == [None]
+    assert client.session.get.call_count == 2
+
+
+def test_failed_details_are_retried_in_next_fetch_instead_of_dropped():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+    paged = _paged_search([["tt0", "tt1", "tt2"]], total=3)
+    broken = {"tt1"}
+
+    def get(url, params, timeout):
+        if params.get('i') in broken:
+            broken.discard(params['i'])
+            raise requests.exceptions.ConnectionError("boom")
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test", max_workers=1)
+
+    assert [result.imdb_id for result in cursor.fetch_more()] == ["tt0", "tt2"]
+    assert cursor.truncated is True
+    assert cursor.has_more is True
+    assert [result.imdb_id for result in cursor.fetch_more()] == ["tt1"]
+    assert cursor.truncated is False
+    assert cursor.has_more is False
+
+
+def test_search_without_deadline_is_not_truncated():
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock(side_effect=_paged_search([["tt0", "tt1"]], total=2))
+
+    results = client.search_movie_by_title("Test", timeout=5)
+
+    assert [result.imdb_id for result in results] == ["tt0", "tt1"]
+    assert results.truncated is False
+
+
+def test_truncated_cursor_keeps_unfinished_candidates():
+    client = OmdbClient(api_key='test_key')
+    release = threading.Event()
+
+    def get(url, params, timeout):
+        if 's' in params:
+            return _search_page(["tt0", "tt1"], total=2)
+        if params['i'] == "tt1" and not release.is_set():
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout()
+        return _response(json_data={"Response": "True", "imdbID": params['i']})
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test", max_workers=1, time_budget=0.2)
+
+    assert [result.imdb_id for result in cursor.fetch_more()] == ["tt0"]
+    assert cursor.truncated is True
+    assert cursor.has_more is True
+
+    release.set()
+    assert [result.imdb_id for result in cursor.fetch_more()] == ["tt1"]
+    assert cursor.truncated is False
+
+
+def test_expired_deadline_skips_request():
+    client = OmdbClient(api_key='test_key')
+    client.session.get = MagicMock()
+
+    assert client.get_movie_by_id("tt1", deadline=Deadline(0)) is None
+    client.session.get.assert_not_called()
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_retry_backoff_does_not_outlive_deadline(mock_sleep):
+    client = OmdbClient(api_key='test_key', max_retries=3, backoff_factor=10)
+    client.session.get = MagicMock(return_value=_response(503))
+
+    with patch('backend.api.omdb_client.random.uniform', side_effect=lambda low, high: high):
+        with pytest.raises(DeadlineExceeded):
+            client._get({'apikey': 'test_key', 'i': 'tt1'}, 10, Deadline(5))
+
+    client.session.get.assert_called_once()
+    assert client.session.get.call_args.kwargs['timeout'] <= 5
+    mock_sleep.assert_not_called()
+
+
+def _warm_hedge_policy(budget=1.0):
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(0.01)
+    return HedgePolicy(budget=budget, burst=1.0, tracker=tracker)
+
+
+def test_hedged_request_returns_faster_duplicate():
+    policy = _warm_hedge_policy()
+    client = OmdbClient(api_key='test_key', hedge=policy)
+    calls = []
+
+    def get(url, params, timeout):
+        calls.append(params['i'])
+        if len(calls) == 1:
+            time.sleep(0.3)
+            return _response(json_data={"Response": "True", "imdbID": "tt1", "Title": "slow"})
+        return _response(json_data={"Response": "True", "imdbID": "tt1", "Title": "fast"})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    assert client.get_movie_by_id("tt1")['Title'] == "fast"
+    assert calls == ["tt1", "tt1"]
+    assert policy.stats()['hedge_wins'] == 1
+    client.close()
+
+
+def test_hedge_budget_exhausted_waits_for_primary():
+    policy = _warm_hedge_policy(budget=0.0)
+    client = OmdbClient(api_key='test_key', hedge=policy)
+
+    def get(url, params, timeout):
+        time.sleep(0.1)
+        return _response(json_data={"Response": "True", "imdbID": params['i']})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1"}
+    client.session.get.assert_called_once()
+    assert policy.stats()['denied'] == 1
+    client.close()
+
+
+def test_hedge_falls_back_to_primary_when_duplicate_fails():
+    client = OmdbClient(api_key='test_key', hedge=_warm_hedge_policy(), max_retries=0)
+    calls = []
+
+    def get(url, params, timeout):
+        calls.append(params['i'])
+        if len(calls) == 1:
+            time.sleep(0.2)
+            return _response(json_data={"Response": "True", "imdbID": "tt1"})
+        raise requests.exceptions.ConnectionError("refused")
+
+    client.session.get = MagicMock(side_effect=get)
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1"}
+    assert len(calls) == 2
+    client.close()
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_throttled_response_shrinks_concurrency_limit_and_is_retried(mock_sleep):
+    limit = AdaptiveConcurrencyLimit(initial=8)
+    client = OmdbClient(api_key='test_key', concurrency=limit)
+    client.session.get = MagicMock(side_effect=[
+        _response(429),
+        _response(json_data={"Response": "True", "imdbID": "tt1"})
+    ])
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1"}
+    assert limit.stats()['decreases'] == 1
+    assert limit.limit == 4
+    assert limit.in_flight == 0
+
+
+def test_timeout_shrinks_concurrency_limit():
+    limit = AdaptiveConcurrencyLimit(initial=8)
+    client = OmdbClient(api_key='test_key', concurrency=limit)
+    client.session.get = MagicMock(side_effect=requests.exceptions.ReadTimeout("slow"))
+
+    assert client.get_movie_by_id("tt1") is None
+    assert limit.limit == 4
+    assert limit.in_flight == 0
+
+
+def test_deadline_expiring_after_slot_acquired_releases_slot():
+    now = [0.0]
+    limit = AdaptiveConcurrencyLimit(initial=1, min_limit=1)
+    client = OmdbClient(api_key='test_key', concurrency=limit)
+    client.session.get = MagicMock()
+    acquire = limit.acquire
+
+    def acquire_and_expire(timeout=None):
+        started = acquire(timeout)
+        now[0] += 10.0
+        return started
+
+    limit.acquire = acquire_and_expire
+
+    with pytest.raises(DeadlineExceeded):
+        client._get({'i': "tt1"}, 10, Deadline(1.0, clock=lambda: now[0]))
+
+    client.session.get.assert_not_called()
+    assert limit.in_flight == 0
+    assert acquire(timeout=0.5) is not None
+
+
+def test_detail_fan_out_follows_adaptive_limit():
+    limit = AdaptiveConcurrencyLimit(initial=2, max_limit=2)
+    client = OmdbClient(api_key='test_key', concurrency=limit)
+    fake_get = _paged_search([[f"tt{i}" for i in range(10)]], total=10)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def tracked(url, params, timeout):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return fake_get(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=tracked)
+
+    results = client.search_movie_by_title("Test", max_workers=10)
+
+    assert len(results) == 10
+    assert peak == 2
+
+
+@patch('backend.api.omdb_client.time.sleep')
+def test_open_circuit_fails_fast_without_network(mock_sleep):
+    breaker = CircuitBreaker(failure_threshold=3)
+    client = OmdbClient(api_key='test_key', max_retries=2, circuit_breaker=breaker)
+    client.session.get = MagicMock(side_effect=requests.exceptions.ConnectionError("down"))
+
+    assert client.get_movie_by_id("tt1") is None
+    assert breaker.state == OPEN
+    assert client.session.get.call_count == 3
+
+    assert client.search_movie_by_title("Test") is None
+    assert client.session.get.call_count == 3
+
+
+def test_open_circuit_still_serves_cached_details():
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = OmdbClient(api_key='test_key', detail_cache=MemoryCache(), circuit_breaker=breaker)
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "True", "imdbID": "tt1"}))
+    client.get_movie_by_id("tt1")
+    breaker.record_failure()
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1"}
+    client.session.get.assert_called_once()
+
+
+def test_successful_probe_closes_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    client = OmdbClient(api_key='test_key', circuit_breaker=breaker)
+    breaker.record_failure()
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "True", "imdbID": "tt1"}))
+
+    assert client.get_movie_by_id("tt1") == {"Response": "True", "imdbID": "tt1"}
+    assert breaker.state == CLOSED
+
+
+
+def test_probe_closes_circuit_once_reset_timeout_elapsed():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0])
+    client = OmdbClient(api_key='test_key', circuit_breaker=breaker)
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "True", "imdbID": "tt1"}))
+    breaker.record_failure()
+
+    assert client.probe() is False
+    client.session.get.assert_not_called()
+
+    now[0] = 31.0
+    assert client.probe() is True
+    assert breaker.state == CLOSED
+
+
+def test_half_open_rejections_truncate_search_instead_of_dropping_results(tmp_path):
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0])
+    client = OmdbClient(api_key='test_key', response_cache=DiskCache(tmp_path / "omdb.sqlite3"),
+                        circuit_breaker=breaker)
+    paged = _paged_search([["tt0", "tt1", "tt2"]], total=3)
+    client.session.get = MagicMock(side_effect=paged)
+    client._fetch_search_page(_search_params('test_key', "Test", 1, None, None))
+    breaker.record_failure()
+    now[0] = 31.0
+    probe_calls = []
+
+    def get(url, params, timeout):
+        if not probe_calls:
+            # Пробный запрос отвечает только после того, как остальные детали отклонены предохранителем.
+            probe_calls.append(params['i'])
+            limit = time.monotonic() + 2
+            while breaker.rejected < 2 and time.monotonic() < limit:
+                time.sleep(0.01)
+        return paged(url, params, timeout)
+
+    client.session.get = MagicMock(side_effect=get)
+    cursor = SearchCursor(client, "Test", max_workers=3)
+
+    first = [result.imdb_id for result in cursor.fetch_more()]
+    assert first == probe_calls
+    assert cursor.truncated is True
+    assert breaker.state == CLOSED
+    rest = [result.imdb_id for result in cursor.fetch_more()]
+    assert sorted(first + rest) == ["tt0", "tt1", "tt2"]
+    assert cursor.truncated is False
+
+
+def test_concurrent_revalidations_share_one_executor():
+    client = OmdbClient(api_key='test_key')
+    barrier = threading.Barrier(8)
+    executors = []
+
+    def get_executor():
+        barrier.wait()
+        executors.append(client._get_revalidation_executor())
+
+    threads = [threading.Thread(target=get_executor) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert len({id(executor) for executor in executors}) == 1
+
+def test_client_coalesces_concurrent_detail_requests():
+    client = OmdbClient(api_key='test_key')
+
+    def slow_get(url, params, timeout):
+        time.sleep(0.05)
+        return _response(json_data={"Response": "True", "imdbID": params['i']})
+
+    client.session.get = MagicMock(side_effect=slow_get)
+    barrier = threading.Barrier(4)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(client.get_movie_by_id("tt00001"))
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"Response": "True", "imdbID": "tt00001"}] * 4
+    client.session.get.assert_called_once()
+    assert client.inflight.stats()['deduplicated'] == 3
+
+
+def test_ratings_index_prefilters_candidates_before_detail_calls(tmp_path):
+    ratings_index = RatingsIndex(tmp_path / "ratings.sqlite3")
+    ratings_index.set("tt1", 5.0)
+    ratings_index.set("tt3", None)
+    client = OmdbClient(api_key='test_key', ratings_index=ratings_index)
+    client.session.get = MagicMock(side_effect=_paged_search([["tt0", "tt1", "tt2", "tt3"]], total=4))
+
+    results = client.search_movie_by_title("Test", min_rating=6.0)
+
+    assert [result.imdb_id for result in results] == ["tt0", "tt2"]
+    detail_ids = [c.kwargs['params']['i'] for c in client.session.get.call_args_list if 'i' in c.kwargs['params']]
+    assert sorted(detail_ids) == ["tt0", "tt2"]
+    assert ratings_index.get("tt0") == 7.0
+    ratings_index.close()
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_stale_details_are_served_immediately_and_revalidated(tmp_path):
+    cache = DiskCache(tmp_path / "omdb.sqlite3")
+    cache.set("i=tt1&plot=short", {"Response": "True", "imdbID": "tt1", "imdbRating": "7.0"}, ttl=100, stale_after=0)
+    client = OmdbClient(api_key='test_key', response_cache=cache)
+    refreshed = {"Response": "True", "imdbID": "tt1", "imdbRating": "7.5"}
+    client.session.get = MagicMock(return_value=_response(json_data=refreshed))
+    updates = []
+    client.add_update_listener(lambda kind, key, data: updates.append((kind, key, data)))
+
+    assert client.get_movie_by_id("tt1")['imdbRating'] == "7.0"
+
+    assert _wait_until(lambda: updates)
+    assert updates == [('details', 'tt1', refreshed)]
+    assert cache.get_entry("i=tt1&plot=short") == (refreshed, False)
+    client.close()
+
+
+def test_failed_revalidation_keeps_stale_entry(tmp_path, capsys):
+    cache = DiskCache(tmp_path / "omdb.sqlite3")
+    stale = {"Response": "True", "imdbID": "tt1", "imdbRating": "7.0"}
+    cache.set("i=tt1&plot=short", stale, ttl=100, stale_after=0)
+    client = OmdbClient(api_key='test_key', response_cache=cache, detail_cache=MemoryCache(ttl=0))
+    client.session.get = MagicMock(return_value=_response(json_data={"Response": "False", "Error": "Error getting data."}))
+
+    assert client.get_movie_by_id("tt1") == stale
+    assert _wait_until(lambda: client.session.get.called and not client._revalidating)
+    assert client.get_movie_by_id("tt1") == stale
+    client.close()
+
+
+def test_stale_search_page_is_revalidated_once(tmp_path):
+    cache = DiskCache(tmp_path / "omdb.sqlite3")
+    page = {"Response": "True", "Search": [], "totalResults": "0"}
+    cache.set("page=1&s=test", page, ttl=100, stale_after=0)
+    client = OmdbClient(api_key='test_key', response_cache=cache)
+    release = threading.Event()
+
+    def slow_get(url, params, timeout):
+        release.wait(2)
+        return _response(json_data=page)
+
+    client.session.get = MagicMock(side_effect=slow_get)
+
+    assert client._fetch_search_page({'apikey': 'test_key', 's': 'Test', 'page': 1}) == page
+    assert client._fetch_search_page({'apikey': 'test_key', 's': 'test', 'page': 1}) == page
+    release.set()
+    assert _wait_until(lambda: not client._revalidating)
+    client.session.get.assert_called_once()
+    client.close()
+
+
+def test_search_many_streams_results_as_queries_finish():
+    client = OmdbClient(api_key='test_key')
+    delays = {"slow": 0.2, "fast": 0.0}
+
+    def get(url, params, timeout):
+        if 's' in params:
+            time.sleep(delays.get(params['s'], 0.0))
+            return _search_page([f"tt-{params['s']}-{params.get('y', '')}"])
+        return _response(json_data={"Response": "True", "imdbID": params['i'], "imdbRating": "7.0"})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    streamed = [(index, [result.imdb_id for result in results])
+                for index, results in client.search_many(["slow", ("fast", "2001"), ("Fast", "2001", None)])]
+
+    assert sorted(index for index, _ in streamed[:2]) == [1, 2]
+    assert streamed[2] == (0, ["tt-slow-"])
+    assert dict(streamed)[1] == ["tt-fast-2001"]
+    search_calls = [c for c in client.session.get.call_args_list if 's' in c.kwargs['params']]
+    assert len(search_calls) == 2
+
+
+def test_search_many_shares_detail_requests_between_queries():
+    client = OmdbClient(api_key='test_key')
+
+    def get(url, params, timeout):
+        if 's' in params:
+            return _search_page(["tt0", "tt1"])
+        time.sleep(0.05)
+        return _response(json_data={"Response": "True", "imdbID": params['i'], "imdbRating": "7.0"})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    found = dict(client.search_many([("First", None, "movie"), ("Second", None, "movie")]))
+
+    assert [result.imdb_id for result in found[0]] == [result.imdb_id for result in found[1]] == ["tt0", "tt1"]
+    detail_calls = [c for c in client.session.get.call_args_list if 'i' in c.kwargs['params']]
+    assert len(detail_calls) == 2
+
+
+def test_search_many_reports_failed_query_without_stopping_batch():
+    client = OmdbClient(api_key='test_key', max_retries=0)
+
+    def get(url, params, timeout):
+        if params.get('s') == "broken":
+            raise requests.exceptions.ConnectionError("boom")
+        if 's' in params:
+            return _search_page(["tt0"])
+        return _response(json_data={"Response": "True", "imdbID": params['i']})
+
+    client.session.get = MagicMock(side_effect=get)
+
+    found = dict(client.search_many(["broken", "ok"]))
+
+    assert found[0] is None
+    assert [result.imdb_id for result in found[1]] == ["tt0"]
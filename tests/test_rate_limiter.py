@@ -0,0 +1,90 @@
+import threading
+import pytest
+from backend.api.rate_limiter import DailyQuota, QuotaExceededError, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+def test_token_bucket_reserve_queues_waiters():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, burst=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.25)
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_is_capped_by_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    clock.now += 60
+
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = TokenBucket(rate=0.001, burst=50)
+    granted = []
+
+    def worker():
+        granted.append(sum(bucket.try_acquire() for _ in range(20)))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(granted) == 50
+
+
+def test_daily_quota_persists_and_keeps_reserve(tmp_path):
+    path = tmp_path / "quota.json"
+    quota = DailyQuota(path, limit=5, reserve=2, today=lambda: "2026-10-18")
+    quota.consume()
+    quota.consume()
+
+    reloaded = DailyQuota(path, limit=5, reserve=2, today=lambda: "2026-10-18")
+    assert reloaded.used == 2
+    assert reloaded.remaining == 1
+    reloaded.consume()
+    with pytest.raises(QuotaExceededError):
+        reloaded.consume()
+    assert reloaded.used == 3
+
+
+def test_daily_quota_resets_on_new_day(tmp_path):
+    day = {"value": "2026-10-18"}
+    quota = DailyQuota(tmp_path / "quota.json", limit=2, reserve=0, today=lambda: day["value"])
+    quota.consume()
+    quota.consume()
+
+    day["value"] = "2026-10-19"
+    assert quota.remaining == 2
+    quota.consume()
+    assert quota.used == 1
+
+
+def test_daily_quota_ignores_corrupted_file(tmp_path, capsys):
+    path = tmp_path / "quota.json"
+    path.write_text("not json", encoding='utf-8')
+
+    quota = DailyQuota(path, limit=10, reserve=0)
+    assert quota.used == 0
+    assert "Не удалось прочитать счётчик квоты OMDb" in capsys.readouterr().err
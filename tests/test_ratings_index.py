@@ -0,0 +1,70 @@
+import gzip
+import pytest
+from backend.api.cache import MISSING
+from backend.api.ratings_index import RatingsIndex
+
+
+@pytest.fixture
+def ratings_index(tmp_path):
+    index = RatingsIndex(tmp_path / "ratings.sqlite3")
+    yield index
+    index.close()
+
+
+def test_ratings_index_records_detail_responses(ratings_index):
+    assert ratings_index.get("tt1") is MISSING
+    ratings_index.record({"imdbID": "tt1", "imdbRating": "8.3"})
+    ratings_index.record({"imdbID": "tt2", "imdbRating": "N/A"})
+
+    assert ratings_index.get("tt1") == 8.3
+    assert ratings_index.get("tt2") is None
+    assert ratings_index.stats()['entries'] == 2
+    assert ratings_index.stats()['unrated'] == 1
+
+
+def test_ratings_index_excludes_only_known_mismatches(ratings_index):
+    ratings_index.set("tt1", 8.3)
+    ratings_index.set("tt2", None)
+
+    assert ratings_index.excludes("tt1", 0.0, 8.0) is True
+    assert ratings_index.excludes("tt1", 8.0, 9.0) is False
+    assert ratings_index.excludes("tt2", 1.0, 10.0) is True
+    assert ratings_index.excludes("tt2", 0.0, 10.0) is False
+    assert ratings_index.excludes("tt404", 9.0, 10.0) is False
+
+
+def test_ratings_index_forgets_missing_rating_after_ttl(tmp_path):
+    now = [1000.0]
+    index = RatingsIndex(tmp_path / "ratings.sqlite3", unrated_ttl=60, clock=lambda: now[0])
+    index.set("tt1", None)
+    index.set("tt2", 5.0)
+
+    assert index.excludes("tt1", 6.0, 10.0) is True
+    now[0] += 60
+    assert index.get("tt1") is MISSING
+    assert index.excludes("tt1", 6.0, 10.0) is False
+    assert index.excludes("tt2", 6.0, 10.0) is True
+    index.close()
+
+
+def test_ratings_index_loads_gzipped_dump(ratings_index, tmp_path):
+    dump = tmp_path / "title.ratings.tsv.gz"
+    with gzip.open(dump, 'wt', encoding='utf-8') as file:
+        file.write("tconst\taverageRating\tnumVotes\n")
+        file.write("tt0000001\t5.7\t2100\n")
+        file.write("tt0000002\t\\N\t0\n")
+        file.write("tt0000003\t6.5\t2000\n")
+
+    assert ratings_index.load_dump(dump) == 2
+    assert ratings_index.get("tt0000001") == 5.7
+    assert ratings_index.get("tt0000002") is MISSING
+
+
+def test_ratings_index_persists_between_instances(tmp_path):
+    first = RatingsIndex(tmp_path / "ratings.sqlite3")
+    first.set("tt1", 7.1)
+    first.close()
+
+    second = RatingsIndex(tmp_path / "ratings.sqlite3")
+    assert second.get("tt1") == 7.1
+    second.close()
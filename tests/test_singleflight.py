@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+import pytest
+from backend.api.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_result_between_concurrent_callers():
+    group = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def slow_fetch(key):
+        calls.append(key)
+        started.set()
+        time.sleep(0.05)
+        return {"imdbID": key}
+
+    results = []
+
+    def caller():
+        results.append(group.do("tt1", slow_fetch, "tt1"))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert calls == ["tt1"]
+    assert results == [{"imdbID": "tt1"}] * 5
+    assert group.stats() == {'executed': 1, 'deduplicated': 4, 'in_flight': 0}
+
+
+def test_single_flight_propagates_errors_and_forgets_key():
+    group = SingleFlight()
+
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        group.do("tt1", failing)
+    assert group.do("tt1", lambda: "ok") == "ok"
+    assert group.stats()['executed'] == 2
+
+
+def test_single_flight_waiter_retries_when_retry_on_matches():
+    group = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def fetch(name):
+        calls.append(name)
+        if name == "leader":
+            started.set()
+            time.sleep(0.05)
+            raise TimeoutError(name)
+        return name
+
+    leader_errors = []
+
+    def leader():
+        try:
+            group.do("tt1", fetch, "leader")
+        except TimeoutError as e:
+            leader_errors.append(e)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait()
+
+    assert group.do("tt1", fetch, "waiter", retry_on=lambda error: isinstance(error, TimeoutError)) == "waiter"
+    thread.join()
+    assert calls == ["leader", "waiter"]
+    assert len(leader_errors) == 1
+
+
+def test_async_single_flight_coalesces_coroutines():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def scenario():
+        return await asyncio.gather(*(group.do("tt1", fetch, "tt1") for _ in range(5)),
+                                    group.do("tt2", fetch, "tt2"))
+
+    assert asyncio.run(scenario()) == ["TT1"] * 5 + ["TT2"]
+    assert sorted(calls) == ["tt1", "tt2"]
+    assert group.stats() == {'executed': 2, 'deduplicated': 4, 'in_flight': 0}
+
+
+def test_async_single_flight_cancelled_waiter_does_not_cancel_others():
+    group = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == "done"